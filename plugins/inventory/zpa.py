@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2022, William Guilherme <wguilherme@securitygeek.io>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+name: zpa
+short_description: ZPA App Connectors and Service Edges inventory source
+description:
+  - Builds an inventory of the App Connectors and Private Service Edges of a ZPA tenant.
+  - Hosts are grouped in C(app_connectors) and C(service_edges), and in one group per
+    App Connector group and per Service Edge group, named after the group.
+  - Connectors and service edge groups are fetched concurrently over one client.
+  - The configuration file must end with C(zpa.yml) or C(zpa.yaml).
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.0.0"
+extends_documentation_fragment:
+  - constructed
+  - inventory_cache
+options:
+  plugin:
+    description: Token that ensures this is a source file for the plugin.
+    required: true
+    choices: ["willguibr.zpacloud.zpa"]
+  client_id:
+    description: ""
+    type: str
+    env:
+      - name: ZPA_CLIENT_ID
+  client_secret:
+    description: ""
+    type: str
+    env:
+      - name: ZPA_CLIENT_SECRET
+  customer_id:
+    description: ""
+    type: str
+    env:
+      - name: ZPA_CUSTOMER_ID
+  include:
+    description: Kinds of hosts added to the inventory.
+    type: list
+    elements: str
+    choices: ["app_connectors", "service_edges"]
+    default: ["app_connectors", "service_edges"]
+  ansible_host:
+    description: Address used as C(ansible_host).
+    type: str
+    choices: ["private_ip", "public_ip"]
+    default: private_ip
+"""
+
+EXAMPLES = """
+# zpa.yml
+plugin: willguibr.zpacloud.zpa
+ansible_host: private_ip
+cache: true
+cache_plugin: ansible.builtin.jsonfile
+cache_connection: ~/.ansible/zpacloud/inventory
+cache_timeout: 3600
+keyed_groups:
+  - key: current_version
+    prefix: version
+groups:
+  disconnected: control_channel_status != 'ZPN_STATUS_AUTHENTICATED'
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructable
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_app_connector_controller import (
+    AppConnectorControllerService,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.plugin_utils.zpa_plugin_utils import (
+    pluginModule,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_service_edge_groups import (
+    ServiceEdgeGroupService,
+)
+
+
+class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
+    NAME = "willguibr.zpacloud.zpa"
+
+    def verify_file(self, path):
+        return super(InventoryModule, self).verify_file(path) and path.endswith(
+            ("zpa.yml", "zpa.yaml")
+        )
+
+    def fetch(self):
+        """{"app_connectors": [...], "service_edge_groups": [...]} from the API"""
+        include = self.get_option("include")
+        module = pluginModule(self, self.NAME)
+        customer_id = module.params.get("customer_id")
+        rest = sharedClient(module)
+        fetchers = {}
+        if "app_connectors" in include:
+            fetchers["app_connectors"] = AppConnectorControllerService(
+                module, customer_id, rest
+            ).getAll
+        if "service_edges" in include:
+            fetchers["service_edge_groups"] = ServiceEdgeGroupService(
+                module, customer_id, rest
+            ).getAll
+        if not fetchers:
+            return {}
+        with ThreadPoolExecutor(max_workers=len(fetchers)) as executor:
+            futures = dict(
+                (name, executor.submit(fetch)) for name, fetch in fetchers.items()
+            )
+            return dict((name, future.result()) for name, future in futures.items())
+
+    def addHost(self, name, parent, group, variables):
+        if not name:
+            return
+        self.inventory.add_host(name, group=parent)
+        if group:
+            group = self.inventory.add_group(self._sanitize_group_name(group))
+            self.inventory.add_child(parent, group)
+            self.inventory.add_host(name, group=group)
+        address = variables.get(self.get_option("ansible_host"))
+        if address:
+            self.inventory.set_variable(name, "ansible_host", address)
+        for key, value in variables.items():
+            self.inventory.set_variable(name, key, value)
+        strict = self.get_option("strict")
+        self._set_composite_vars(
+            self.get_option("compose"), variables, name, strict=strict
+        )
+        self._add_host_to_composed_groups(
+            self.get_option("groups"), variables, name, strict=strict
+        )
+        self._add_host_to_keyed_groups(
+            self.get_option("keyed_groups"), variables, name, strict=strict
+        )
+
+    def populate(self, results):
+        if "app_connectors" in results:
+            self.inventory.add_group("app_connectors")
+            for connector in results["app_connectors"]:
+                self.addHost(
+                    connector.get("name"),
+                    "app_connectors",
+                    connector.get("app_connector_group_name"),
+                    connector,
+                )
+        if "service_edge_groups" in results:
+            self.inventory.add_group("service_edges")
+            for edge_group in results["service_edge_groups"]:
+                for edge in edge_group.get("service_edges", []):
+                    variables = dict(edge)
+                    variables["service_edge_group_id"] = edge_group.get("id")
+                    variables["service_edge_group_name"] = edge_group.get("name")
+                    self.addHost(
+                        edge.get("name"),
+                        "service_edges",
+                        edge_group.get("name"),
+                        variables,
+                    )
+
+    def parse(self, inventory, loader, path, cache=True):
+        super(InventoryModule, self).parse(inventory, loader, path, cache)
+        self._read_config_data(path)
+        cache_key = self.get_cache_key(path)
+        use_cache = self.get_option("cache") and cache
+        update_cache = self.get_option("cache") and not cache
+        results = None
+        if use_cache:
+            try:
+                results = self._cache[cache_key]
+            except KeyError:
+                update_cache = True
+        if results is None:
+            results = self.fetch()
+        if update_cache:
+            self._cache[cache_key] = results
+        self.populate(results)
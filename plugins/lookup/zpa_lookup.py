@@ -0,0 +1,203 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2022, William Guilherme <wguilherme@securitygeek.io>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+name: zpa_lookup
+short_description: Resolve ZPA object names to IDs
+description:
+  - Resolves the names of ZPA objects of one or several resource types to their IDs in one call,
+    for instance to build policy rule operands.
+  - Each needed collection is fetched once (concurrently, over one client) and indexed by name.
+    In memory the indexes only live as long as the worker process running the task, which
+    serves the items of a loop but not later tasks or other hosts. Those reuse them through
+    C(ZPA_CACHE_DIR), for C(cache_ttl) seconds. A name missing from a reused index is
+    looked up again in a freshly fetched collection.
+  - Terms are C(<resource>:<name>), or plain names when I(resource) is set. SCIM groups and
+    SCIM attributes belong to an IdP, given with I(idp) or as C(<resource>:<idp name>/<name>).
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.0.0"
+options:
+  _terms:
+    description: Names to resolve.
+    required: true
+    type: list
+    elements: str
+  resource:
+    description: Resource type of every term, terms are then plain names.
+    type: str
+    choices:
+      - app_connector
+      - app_connector_group
+      - application
+      - application_server
+      - ba_certificate
+      - cloud_connector_group
+      - customer_version_profile
+      - enrollment_certificate
+      - idp
+      - lss_config
+      - machine_group
+      - policy_access_rule
+      - policy_forwarding_rule
+      - policy_timeout_rule
+      - posture
+      - provisioning_key_connector
+      - provisioning_key_service_edge
+      - saml_attribute
+      - scim_attribute
+      - scim_group
+      - segment_group
+      - server_group
+      - service_edge_group
+      - trusted_network
+  idp:
+    description: Name of the IdP of the C(scim_group) and C(scim_attribute) terms.
+    type: str
+  field:
+    description:
+      - Attribute returned for each name.
+      - C(postureUdid) (postures) and C(networkId) (trusted networks) are the values expected
+        by policy rule operands.
+    type: str
+    choices: ["id", "postureUdid", "networkId"]
+    default: id
+  errors:
+    description: What to do when a name is not found, C(ignore) and C(warn) return C(None) for it.
+    type: str
+    choices: ["strict", "warn", "ignore"]
+    default: strict
+  cache_ttl:
+    description: Seconds during which the fetched indexes are reused by later tasks, C(0) to disable.
+    type: int
+    default: 600
+    env:
+      - name: ZPA_LOOKUP_CACHE_TTL
+  client_id:
+    description: ""
+    type: str
+    env:
+      - name: ZPA_CLIENT_ID
+  client_secret:
+    description: ""
+    type: str
+    env:
+      - name: ZPA_CLIENT_SECRET
+  customer_id:
+    description: ""
+    type: str
+    env:
+      - name: ZPA_CUSTOMER_ID
+"""
+
+EXAMPLES = """
+- name: Resolve the objects referenced by an access rule
+  ansible.builtin.set_fact:
+    ids: "{{ query('willguibr.zpacloud.zpa_lookup',
+                   'segment_group:Browser Access Apps',
+                   'idp:Okta',
+                   'scim_group:Okta/Engineering') }}"
+
+- name: Resolve several SCIM groups of one IdP
+  ansible.builtin.set_fact:
+    group_ids: "{{ query('willguibr.zpacloud.zpa_lookup', 'Engineering', 'Finance',
+                         resource='scim_group', idp='Okta') }}"
+
+- name: Posture UDIDs for policy operands
+  ansible.builtin.set_fact:
+    postures: "{{ query('willguibr.zpacloud.zpa_lookup', 'CrowdStrike_ZPA_ZTA_40',
+                        resource='posture', field='postureUdid') }}"
+"""
+
+RETURN = """
+_raw:
+  description: The requested attribute of each named object, in the order of the terms.
+  type: list
+  elements: str
+"""
+
+from ansible.errors import AnsibleError
+from ansible.plugins.lookup import LookupBase
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_object_index import (
+    IDP_SCOPED_KINDS,
+    OBJECT_KINDS,
+    ObjectIndex,
+    recordAttributes,
+)
+from ansible_collections.willguibr.zpacloud.plugins.plugin_utils.zpa_plugin_utils import (
+    display,
+    pluginModule,
+)
+
+# indexes fetched by earlier lookups of this worker process, i.e. of the same task
+# (and loop); later tasks run in other forks and share them through the file cache
+MEMO = {}
+
+
+class LookupModule(LookupBase):
+    NAME = "willguibr.zpacloud.zpa_lookup"
+
+    def parseTerm(self, term):
+        """(kind, name, idp name) of a term"""
+        kind = self.get_option("resource")
+        name = term
+        if kind is None:
+            kind, sep, name = term.partition(":")
+            if not sep or kind not in OBJECT_KINDS:
+                raise AnsibleError(
+                    "%s: invalid term %r, expected <resource>:<name> with resource one of %s"
+                    % (self.NAME, term, ", ".join(sorted(OBJECT_KINDS)))
+                )
+        idp = None
+        if kind in IDP_SCOPED_KINDS:
+            idp = self.get_option("idp")
+            if idp is None:
+                idp, sep, name = name.partition("/")
+                if not sep:
+                    raise AnsibleError(
+                        "%s: %s %r requires the idp option or the <idp name>/<name> form"
+                        % (self.NAME, kind, term)
+                    )
+        field = self.get_option("field")
+        if field not in recordAttributes(kind):
+            raise AnsibleError(
+                "%s: %s objects have no %s attribute" % (self.NAME, kind, field)
+            )
+        return kind, name, idp
+
+    def run(self, terms, variables=None, **kwargs):
+        self.set_options(var_options=variables, direct=kwargs)
+        refs = [self.parseTerm(term) for term in terms]
+        if not refs:
+            return []
+        module = pluginModule(self, self.NAME)
+        index = ObjectIndex(
+            sharedClient(module),
+            module.params.get("customer_id"),
+            ttl=self.get_option("cache_ttl"),
+            memo=MEMO,
+        )
+        field = self.get_option("field")
+        errors = self.get_option("errors")
+        values = []
+        for term, found in zip(terms, index.resolveNames(refs)):
+            if found is None:
+                msg = "%s: %r not found" % (self.NAME, term)
+                if errors == "strict":
+                    raise AnsibleError(msg)
+                if errors == "warn":
+                    display.warning(msg)
+                values.append(None)
+            else:
+                values.append(found.get(field))
+        return values
@@ -5,17 +5,17 @@ __metaclass__ = type
 import re
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     camelcaseToSnakeCase,
     delete_none,
+    sharedClient,
 )
 
 
 class AppConnectorControllerService:
-    def __init__(self, module, customer_id):
+    def __init__(self, module, customer_id, rest=None):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = rest or sharedClient(module)
 
     def getByIDOrName(self, id, name):
         connector = None
@@ -44,12 +44,21 @@ class AppConnectorControllerService:
             connectors.append(self.mapRespJSONToApp(connector))
         return connectors
 
+    def iter_all(self):
+        for connector in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/connector" % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(connector)
+
     def getByName(self, name):
-        connectors = self.getAll()
-        for connector in connectors:
-            if connector.get("name") == name:
-                return connector
-        return None
+        connector = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/connector" % (self.customer_id),
+            name=name,
+        )
+        if connector is None:
+            return None
+        return self.mapRespJSONToApp(connector)
 
     def mapConnectorsJSONToList(self, connectors):
         if connectors is None:
@@ -111,7 +120,7 @@ class AppConnectorControllerService:
             "platform": resp_json.get("platform"),
             "previous_version": resp_json.get("previousVersion"),
             "private_ip": resp_json.get("privateIp"),
-            "public_ip": resp_json.get("c"),
+            "public_ip": resp_json.get("publicIp"),
             "sarge_version": resp_json.get("sargeVersion"),
             "enrollment_cert": resp_json.get("enrollmentCert"),
             "upgrade_attempt": resp_json.get("upgradeAttempt"),
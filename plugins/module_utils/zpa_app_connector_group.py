@@ -45,12 +45,23 @@ class AppConnectorGroupService:
             apps.append(self.mapRespJSONToApp(app))
         return apps
 
+    def iter_all(self):
+        for app in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/appConnectorGroup"
+            % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(app)
+
     def getByName(self, name):
-        apps = self.getAll()
-        for app in apps:
-            if app.get("name") == name:
-                return app
-        return None
+        app = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/appConnectorGroup"
+            % (self.customer_id),
+            name=name,
+        )
+        if app is None:
+            return None
+        return self.mapRespJSONToApp(app)
 
     def mapConnectorsJSONToList(self, connectors):
         if connectors is None:
@@ -5,8 +5,40 @@ __metaclass__ = type
 import re
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    camelcaseToSnakeCase,
-    delete_none,
+    writtenObject,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_schema import (
+    ENTITIES,
+    REFERENCES,
+    Field,
+    Schema,
+)
+
+APPLICATION_SEGMENT = Schema(
+    Field("tcp_port_range"),
+    Field("enabled"),
+    Field("bypass_type"),
+    Field("udp_port_range"),
+    Field("config_space"),
+    Field("health_reporting"),
+    Field("segment_group_id"),
+    Field("double_encrypt"),
+    Field("health_check_type"),
+    Field("is_cname_enabled"),
+    Field("passive_health_enabled"),
+    Field("ip_anchored"),
+    Field("name"),
+    Field("description"),
+    Field("icmp_access_type"),
+    Field("creation_time"),
+    Field("modifiedby", "modifiedBy"),
+    Field("id"),
+    Field("server_groups", kind=REFERENCES),
+    Field("segment_group_name"),
+    Field("domain_names"),
+    Field("default_idle_timeout"),
+    Field("default_max_age"),
+    Field("clientless_apps", kind=ENTITIES, write=False),
 )
 
 
@@ -44,103 +76,29 @@ class ApplicationSegmentService:
             apps.append(self.mapRespJSONToApp(app))
         return apps
 
+    def iter_all(self):
+        for app in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/application"
+            % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(app)
+
     def getByName(self, name):
-        apps = self.getAll()
-        for app in apps:
-            if app.get("name") == name:
-                return app
-        return None
-
-    def mapServerGroupsJSONToList(self, serverGroups):
-        if serverGroups is None:
-            return []
-        l = []
-        for s in serverGroups:
-            d = camelcaseToSnakeCase(s)
-            l.append(d)
-        return l
-
-    def mapServerGroupsListToJSON(self, serverGroups):
-        if serverGroups is None:
-            return []
-        l = []
-        for s in serverGroups:
-            d = dict(id=s.get("id"))
-            l.append(d)
-        return l
-
-    def mapClientlessAppsJSONToList(self, apps):
-        if apps is None:
-            return []
-        l = []
-        for app in apps:
-            d = camelcaseToSnakeCase(app)
-            l.append(d)
-        return l
+        app = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/application"
+            % (self.customer_id),
+            name=name,
+        )
+        if app is None:
+            return None
+        return self.mapRespJSONToApp(app)
 
-    @delete_none
     def mapRespJSONToApp(self, resp_json):
-        if resp_json is None:
-            return {}
-        return {
-            "tcp_port_range": resp_json.get("tcpPortRange"),
-            "enabled": resp_json.get("enabled"),
-            "bypass_type": resp_json.get("bypassType"),
-            "udp_port_range": resp_json.get("udpPortRange"),
-            "config_space": resp_json.get("configSpace"),
-            "health_reporting": resp_json.get("healthReporting"),
-            "segment_group_id": resp_json.get("segmentGroupId"),
-            "double_encrypt": resp_json.get("doubleEncrypt"),
-            "health_check_type": resp_json.get("healthCheckType"),
-            "is_cname_enabled": resp_json.get("isCnameEnabled"),
-            "passive_health_enabled": resp_json.get("passiveHealthEnabled"),
-            "ip_anchored": resp_json.get("ipAnchored"),
-            "name": resp_json.get("name"),
-            "description": resp_json.get("description"),
-            "icmp_access_type": resp_json.get("icmpAccessType"),
-            "creation_time": resp_json.get("creationTime"),
-            "modifiedby": resp_json.get("modifiedBy"),
-            "id": resp_json.get("id"),
-            "server_groups": self.mapServerGroupsJSONToList(
-                resp_json.get("serverGroups")
-            ),
-            "segment_group_name": resp_json.get("segmentGroupName"),
-            "domain_names": resp_json.get("domainNames"),
-            "clientless_apps": self.mapClientlessAppsJSONToList(
-                resp_json.get("clientlessApps")
-            ),
-        }
-
-    @delete_none
+        return APPLICATION_SEGMENT.fromJSON(resp_json)
+
     def mapAppToJSON(self, app):
-        if app is None:
-            return {}
-        return {
-            "tcpPortRange": app.get("tcp_port_range"),
-            "enabled": app.get("enabled"),
-            "bypassType": app.get("bypass_type"),
-            "udpPortRange": app.get("udp_port_range"),
-            "configSpace": app.get("config_space"),
-            "healthReporting": app.get("health_reporting"),
-            "segmentGroupId": app.get("segment_group_id"),
-            "doubleEncrypt": app.get("double_encrypt"),
-            "healthCheckType": app.get("health_check_type"),
-            "isCnameEnabled": app.get("is_cname_enabled"),
-            "passiveHealthEnabled": app.get("passive_health_enabled"),
-            "ipAnchored": app.get("ip_anchored"),
-            "name": app.get("name"),
-            "description": app.get("description"),
-            "icmpAccessType": app.get("icmp_access_type"),
-            "creationTime": app.get("creation_time"),
-            "modifiedBy": app.get("modifiedby"),
-            "modified_time": app.get("modifiedTime"),
-            "id": app.get("id"),
-            "serverGroups": self.mapServerGroupsListToJSON(app.get("server_groups")),
-            "segmentGroupName": app.get("segment_group_name"),
-            "domainNames": app.get("domain_names"),
-            "defaultIdleTimeout": app.get("default_idle_timeout"),
-            "defaultMaxAge": app.get("default_max_age"),
-        }
+        return APPLICATION_SEGMENT.toJSON(app)
 
     def create(self, app):
         """Create new application"""
@@ -152,6 +110,9 @@ class ApplicationSegmentService:
         status_code = response.status_code
         if status_code > 299:
             return None
+        written = writtenObject(self.rest, response, appJSON)
+        if written is not None:
+            return self.mapRespJSONToApp(written)
         return self.getByID(response.json.get("id"))
 
     def update(self, app):
@@ -165,6 +126,9 @@ class ApplicationSegmentService:
         status_code = response.status_code
         if status_code > 299:
             return None
+        written = writtenObject(self.rest, response, appJSON)
+        if written is not None:
+            return self.mapRespJSONToApp(written)
         return self.getByID(app.get("id"))
 
     def detach_from_segment_group(self, app_id, seg_group_id):
@@ -3,8 +3,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     delete_none,
+    sharedClient,
 )
 
 
@@ -12,7 +12,7 @@ class ApplicationServerService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
 
     def getByIDOrName(self, id, name):
         application_server = None
@@ -41,12 +41,21 @@ class ApplicationServerService:
             application_servers.append(self.mapRespJSONToApp(application_server))
         return application_servers
 
+    def iter_all(self):
+        for application_server in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/server" % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(application_server)
+
     def getByName(self, name):
-        application_servers = self.getAll()
-        for application_server in application_servers:
-            if application_server.get("name") == name:
-                return application_server
-        return None
+        application_server = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/server" % (self.customer_id),
+            name=name,
+        )
+        if application_server is None:
+            return None
+        return self.mapRespJSONToApp(application_server)
 
     @delete_none
     def mapRespJSONToApp(self, resp_json):
@@ -81,9 +90,8 @@ class ApplicationServerService:
         if server is None:
             return None
         if len(server.get("app_server_group_ids", [])) > 0:
-            self.module.log(
-                "[INFO] Removing server group ID/s from application server: %s"
-                % (appID)
+            self.rest.logger.info(
+                "Removing server group ID/s from application server: %s", appID
             )
             server["app_server_group_ids"] = []
             return self.update(server)
@@ -3,8 +3,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     delete_none,
+    sharedClient,
 )
 
 
@@ -12,7 +12,7 @@ class BrowserCertificateService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
 
     def getByIDOrName(self, id, name):
         certificate = None
@@ -43,12 +43,23 @@ class BrowserCertificateService:
             certificates.append(self.mapRespJSONToApp(certificate))
         return certificates
 
+    def iter_all(self):
+        for certificate in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v2/admin/customers/%s/clientlessCertificate/issued"
+            % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(certificate)
+
     def getByName(self, name):
-        certificates = self.getAll()
-        for certificate in certificates:
-            if certificate.get("name") == name:
-                return certificate
-        return None
+        certificate = self.rest.find_by_name(
+            base_url="/mgmtconfig/v2/admin/customers/%s/clientlessCertificate/issued"
+            % (self.customer_id),
+            name=name,
+        )
+        if certificate is None:
+            return None
+        return self.mapRespJSONToApp(certificate)
 
     @delete_none
     def mapRespJSONToApp(self, resp_json):
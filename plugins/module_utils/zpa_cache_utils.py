@@ -0,0 +1,48 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import hashlib
+import json
+import os
+import tempfile
+
+
+def default_cache_dir():
+    return os.environ.get(
+        "ZPA_CACHE_DIR",
+        os.path.join(os.path.expanduser("~"), ".ansible", "zpacloud"),
+    )
+
+
+def cache_key(*parts):
+    """stable file name friendly digest of the given values"""
+    return hashlib.sha256(
+        "\0".join(str(part) for part in parts).encode("utf-8")
+    ).hexdigest()
+
+
+def read_json(path):
+    """return the JSON document stored at path, or None when missing or unreadable"""
+    try:
+        with open(path, "r") as f:
+            return json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+
+
+def write_json_atomic(path, data, sort_keys=False):
+    """write data as JSON to path (mode 0600) so concurrent readers never see a partial file"""
+    cache_dir = os.path.dirname(path)
+    if not os.path.isdir(cache_dir):
+        os.makedirs(cache_dir, mode=0o700)
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, prefix=".tmp-")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, separators=(",", ":"), sort_keys=sort_keys)
+        os.chmod(tmp_path, 0o600)
+        os.rename(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
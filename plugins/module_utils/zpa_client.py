@@ -16,19 +16,135 @@ from ansible.module_utils.common.text.converters import jsonify
 __metaclass__ = type
 
 import json
+import os
 import random
+import threading
 import time
 import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 
 from ansible.module_utils._text import to_text
 from ansible.module_utils.basic import env_fallback
 from ansible.module_utils.urls import fetch_url
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_cache_utils import (
+    cache_key,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_connection_pool import (
+    HTTPSConnectionPool,
+    proxy_configured,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_logging import (
+    RequestLogger,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_rate_limit import (
+    DEFAULT_LIMITS,
+    RateLimiter,
+    retryAfter,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_response_cache import (
+    ResponseCache,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_token_cache import (
+    TokenCache,
+)
+
+try:
+    import orjson
+
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
+
+# marks a Response whose body was not decoded yet (None is a valid result)
+_NOT_DECODED = object()
+
+
+def env_bool(name, default):
+    value = os.environ.get(name)
+    if value is None or value == "":
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+def env_int(name, default):
+    try:
+        return int(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+class WorkerFailure(Exception):
+    """failure of a call run by runConcurrently, reported by the calling thread"""
+
+
+class TooManyPages(Exception):
+    """raised by iter_paginated_data when a collection spans more than max_pages"""
+
+
+# marks the threads running the calls of runConcurrently
+_worker = threading.local()
+
+
+def failJson(module, msg):
+    """
+    module.fail_json(msg), or WorkerFailure when called from a worker thread of
+    runConcurrently: only the main thread may print the module result and exit
+    """
+    if getattr(_worker, "active", False):
+        raise WorkerFailure(msg)
+    module.fail_json(msg=msg)
+
+
+def _runInWorker(call, args):
+    _worker.active = True
+    try:
+        return call(*args)
+    finally:
+        _worker.active = False
+
+
+def submitToWorker(executor, call, *args):
+    """executor.submit(call, *args) with the failures of call raised as WorkerFailure"""
+    return executor.submit(_runInWorker, call, args)
+
+
+def runConcurrently(module, calls, max_workers):
+    """
+    results of the (callable, args) calls, in order, at most max_workers running at
+    a time (one by one when max_workers <= 1). The first failure cancels the calls
+    not started yet and is reported once with module.fail_json, from the calling
+    thread; it is raised instead when module is None.
+    """
+    if max_workers <= 1 or len(calls) <= 1:
+        return [call(*args) for call, args in calls]
+    results = None
+    failure = None
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        futures = [submitToWorker(executor, call, *args) for call, args in calls]
+        try:
+            results = [future.result() for future in futures]
+        except WorkerFailure as e:
+            failure = e
+        finally:
+            for future in futures:
+                future.cancel()
+    if failure is not None:
+        if module is None:
+            raise failure
+        failJson(module, str(failure))
+    return results
+
+
+# statuses worth retrying: throttling, transient server errors and network failures
+RETRYABLE_STATUS_CODES = (-1, 408, 429, 500, 502, 503, 504)
 
 
 def retry_with_backoff(retries=5, backoff_in_seconds=1):
     """
     This decorator should be used on functions that make HTTP calls and
-    returns Response
+    returns Response. Only retryable statuses are retried, after the delay
+    given by Retry-After when the response has one.
     """
 
     def decorator(f):
@@ -36,15 +152,19 @@ def retry_with_backoff(retries=5, backoff_in_seconds=1):
             x = 0
             while True:
                 resp = f(*args)
-                if resp.status_code < 299 or resp.status_code == 400:
+                if resp.status_code not in RETRYABLE_STATUS_CODES:
                     return resp
                 if x == retries:
                     raise Exception("Reached max retries: %s" % (resp.json))
                 else:
-                    sleep = backoff_in_seconds * 2 ** x + random.uniform(0, 1)
-                    args[0].module.log(
-                        "\n[INFO] args: %s\nretrying after %d seconds...\n"
-                        % (str(args), sleep)
+                    sleep = retryAfter(resp.info)
+                    if sleep is None:
+                        sleep = backoff_in_seconds * 2**x + random.uniform(0, 1)
+                    args[0].logger.info(
+                        "%s returned %s, retrying after %d seconds...",
+                        f.__name__,
+                        resp.status_code,
+                        sleep,
                     )
                     time.sleep(sleep)
                     x += 1
@@ -68,35 +188,152 @@ def delete_none(f):
     return wrapper
 
 
+# types that cannot hold None, checked first to keep the walk cheap on plain values
+SCALAR_TYPES = frozenset((str, int, bool, float))
+
+
+def _tupleWithoutNone(value, stack):
+    """copy of a tuple without None items; mutable items are queued on stack"""
+    items = []
+    for item in value:
+        if item is None:
+            continue
+        if isinstance(item, tuple):
+            item = _tupleWithoutNone(item, stack)
+        elif isinstance(item, (dict, list, set)):
+            stack.append(item)
+        items.append(item)
+    return type(value)(items)
+
+
 def deleteNone(_dict):
-    """Delete None values recursively from all of the dictionaries, tuples, lists, sets"""
-    if isinstance(_dict, dict):
-        for key, value in list(_dict.items()):
-            if isinstance(value, (list, dict, tuple, set)):
-                _dict[key] = deleteNone(value)
-            elif value is None or key is None:
-                del _dict[key]
-    elif isinstance(_dict, (list, set, tuple)):
-        _dict = type(_dict)(deleteNone(item) for item in _dict if item is not None)
+    """
+    Delete None values from all of the dictionaries, tuples, lists, sets, at any depth.
+    Dicts, lists and sets are pruned in place and keep their identity, only tuples
+    holding None are replaced. The walk uses an explicit stack, so deeply nested
+    conditions do not run into the recursion limit.
+    """
+    stack = []
+    push = stack.append
+    if isinstance(_dict, tuple):
+        _dict = _tupleWithoutNone(_dict, stack)
+    else:
+        push(_dict)
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            dead = None
+            for key, value in obj.items():
+                if value is None or key is None:
+                    if isinstance(value, (dict, list, set)):
+                        push(value)
+                    elif isinstance(value, tuple):
+                        obj[key] = _tupleWithoutNone(value, stack)
+                    else:
+                        if dead is None:
+                            dead = []
+                        dead.append(key)
+                elif type(value) in SCALAR_TYPES:
+                    continue
+                elif isinstance(value, tuple):
+                    obj[key] = _tupleWithoutNone(value, stack)
+                elif isinstance(value, (dict, list, set)):
+                    push(value)
+            if dead is not None:
+                for key in dead:
+                    del obj[key]
+        elif isinstance(obj, list):
+            pruned = False
+            for i, item in enumerate(obj):
+                if item is None:
+                    pruned = True
+                elif type(item) in SCALAR_TYPES:
+                    continue
+                elif isinstance(item, tuple):
+                    obj[i] = _tupleWithoutNone(item, stack)
+                elif isinstance(item, (dict, list, set)):
+                    push(item)
+            if pruned:
+                obj[:] = [item for item in obj if item is not None]
+        elif isinstance(obj, set):
+            obj.discard(None)
+            for item in [item for item in obj if isinstance(item, tuple)]:
+                obj.remove(item)
+                obj.add(_tupleWithoutNone(item, stack))
     return _dict
 
 
-def camelcaseToSnakeCase(obj):
-    new_obj = dict()
-    for key, value in obj.items():
-        if value is not None:
-            new_obj[re.sub(r"(?<!^)(?=[A-Z])", "_", key).lower()] = value
-    return new_obj
+def writtenObject(rest, response, payload, required=("id",)):
+    """
+    API JSON of the object a POST/PUT just wrote, when the client trusts write
+    responses (ZPA_WRITE_RESPONSE): the response body, if it is a JSON object, laid
+    over the submitted payload. Returns None when the option is off or when the
+    result misses one of the required keys; callers then GET the object again.
+    """
+    if getattr(rest, "trust_write_response", False) is not True:
+        return None
+    written = dict(payload or {})
+    body = response.json
+    if isinstance(body, dict):
+        written.update(body)
+    for key in required:
+        if written.get(key) in (None, ""):
+            return None
+    return written
+
+
+# a capital letter that does not start the key starts a new snake_case word
+CAMEL_BOUNDARY = re.compile(r"(?<!^)(?=[A-Z])")
+
+# distinct keys remembered by the key translation caches; ZPA objects use a few
+# hundred different keys, the bound only protects against unexpected payloads
+KEY_CACHE_SIZE = 2048
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def snakeCaseKey(key):
+    return CAMEL_BOUNDARY.sub("_", key).lower()
+
+
+@lru_cache(maxsize=KEY_CACHE_SIZE)
+def camelCaseKey(key):
+    newKey = "".join(x.capitalize() or "_" for x in key.split("_"))
+    return newKey[:1].lower() + newKey[1:]
+
+
+def convertKeys(obj, convert_key):
+    """
+    copy of obj with every dict key, at any depth, translated by convert_key and
+    None dict values dropped, built in a single pass
+    """
+    if isinstance(obj, dict):
+        return {
+            convert_key(k): convertKeys(v, convert_key)
+            for k, v in obj.items()
+            if v is not None
+        }
+    if isinstance(obj, list):
+        return [convertKeys(v, convert_key) for v in obj]
+    return obj
+
+
+def camelcaseToSnakeCase(obj, recursive=False):
+    if recursive:
+        return convertKeys(obj, snakeCaseKey)
+    return {snakeCaseKey(k): v for k, v in obj.items() if v is not None}
+
+
+def snakecaseToCamelcase(obj, recursive=False):
+    if recursive:
+        return convertKeys(obj, camelCaseKey)
+    return {camelCaseKey(k): v for k, v in obj.items() if v is not None}
 
 
-def snakecaseToCamelcase(obj):
-    new_obj = dict()
-    for key, value in obj.items():
-        if value is not None:
-            newKey = "".join(x.capitalize() or "_" for x in key.split("_"))
-            newKey = newKey[:1].lower() + newKey[1:]
-            new_obj[newKey] = value
-    return new_obj
+def json_loads(data):
+    """decode a JSON document with orjson when it is installed, json otherwise"""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(to_text(data))
 
 
 class Response(object):
@@ -105,23 +342,51 @@ class Response(object):
         if resp:
             self.body = resp.read()
         self.info = info
-
-    @property
-    def json(self):
-        if not self.body:
-            if "body" in self.info:
-                return json.loads(to_text(self.info.get("body")))
-            return None
+        self._json = _NOT_DECODED
+
+    def _decode(self):
+        body = self.body
+        if not body:
+            body = self.info.get("body")
+            if not body:
+                return None
         try:
-            return json.loads(to_text(self.body))
+            return json_loads(body)
         except ValueError:
             return None
 
+    @property
+    def json(self):
+        """the decoded body, parsed on first access only"""
+        if self._json is _NOT_DECODED:
+            self._json = self._decode()
+        return self._json
+
     @property
     def status_code(self):
         return self.info.get("status")
 
 
+def sharedClient(module):
+    """
+    ZPAClientHelper of module, built on first use and shared by every service of
+    the module execution: one sign-in and one connection pool per set of credentials.
+    The clients are kept on the module itself, so they go away with it.
+    """
+    key = cache_key(
+        module.params.get("client_id"),
+        module.params.get("client_secret"),
+        module.params.get("customer_id"),
+    )
+    clients = getattr(module, "_zpa_clients", None)
+    if not isinstance(clients, dict):
+        clients = {}
+        setattr(module, "_zpa_clients", clients)
+    if key not in clients:
+        clients[key] = ZPAClientHelper(module)
+    return clients[key]
+
+
 class ZPAClientHelper:
     def __init__(self, module):
         self.baseurl = "https://config.private.zscaler.com"
@@ -132,22 +397,101 @@ class ZPAClientHelper:
         self.client_secret = module.params.get("client_secret")
         self.customer_id = module.params.get("customer_id")
         self.tries = 0
-        # login
-        response = self.login()
-        if response is None or response.status_code > 299 or response.json is None:
-            self.module.fail_json(
-                msg="Failed to login using provided credentials, please verify validity of API ZPA_CLIENT_ID & ZPA_CLIENT_SECRET. response: %s"
-                % (response)
+        self.logger = RequestLogger(module)
+        self.transport = None
+        if env_bool("ZPA_KEEPALIVE", True) and not proxy_configured(self.baseurl):
+            self.transport = HTTPSConnectionPool(
+                self.baseurl,
+                maxsize=env_int("ZPA_POOL_SIZE", 10),
+                timeout=self.timeout,
             )
-        resp_json = response.json
-        self.access_token = resp_json.get("access_token")
-        self.module.log("[INFO] access_token: '%s'" % (self.access_token))
+        self.rate_limiter = None
+        if env_bool("ZPA_RATE_LIMIT", True):
+            self.rate_limiter = RateLimiter(
+                cache_key(self.customer_id, self.baseurl),
+                limits={
+                    "read": (
+                        env_int("ZPA_RATE_LIMIT_GET", DEFAULT_LIMITS["read"][0]),
+                        DEFAULT_LIMITS["read"][1],
+                    ),
+                    "write": (
+                        env_int("ZPA_RATE_LIMIT_WRITE", DEFAULT_LIMITS["write"][0]),
+                        DEFAULT_LIMITS["write"][1],
+                    ),
+                },
+            )
+        self.response_cache = None
+        if env_bool("ZPA_RESPONSE_CACHE", False):
+            self.response_cache = ResponseCache(self.customer_id, self.baseurl)
+        # only the read-only *_info modules are served from the response cache,
+        # writes from any module invalidate it
+        module_name = getattr(module, "_name", None)
+        self.cache_reads = isinstance(module_name, str) and module_name.endswith(
+            "_info"
+        )
+        # build the result of create/update calls from the write response and the
+        # submitted payload instead of reading the object back, see writtenObject
+        self.trust_write_response = env_bool("ZPA_WRITE_RESPONSE", False)
+        self.token_cache = None
+        if env_bool("ZPA_TOKEN_CACHE", True):
+            self.token_cache = TokenCache(
+                self.client_id, self.client_secret, self.customer_id, self.baseurl
+            )
+        self.access_token = None
+        if self.token_cache is not None:
+            self.access_token = self.token_cache.get()
+        if self.access_token is None:
+            self.authenticate()
+        self._set_headers()
+
+    def _set_headers(self):
         self.headers = {  # 'referer': self.baseurl,
             "Content-Type": "application/json",
             "Accept": "application/json",
             "Authorization": "Bearer %s" % (self.access_token),
         }
 
+    def authenticate(self, stale_token=None):
+        """
+        sign in and refresh the cached token; when the cache is enabled, sign-ins
+        for the same credentials are serialized across processes and a token
+        refreshed meanwhile by another fork is reused instead of signing in again
+        """
+        if self.token_cache is None:
+            self._sign_in()
+            return
+        try:
+            with self.token_cache.lock():
+                if stale_token is not None:
+                    self.token_cache.invalidate(stale_token)
+                access_token = self.token_cache.get()
+                if access_token is not None:
+                    self.access_token = access_token
+                    return
+                expires_in = self._sign_in()
+                try:
+                    self.token_cache.set(self.access_token, expires_in)
+                except (IOError, OSError) as e:
+                    self.logger.warn("unable to cache token: %s", to_text(e))
+        except (IOError, OSError) as e:
+            self.logger.warn("token cache unavailable: %s", to_text(e))
+            self._sign_in()
+
+    def _sign_in(self):
+        response = self.login()
+        if response is None or response.status_code > 299 or response.json is None:
+            failJson(
+                self.module,
+                "Failed to login using provided credentials, please verify validity of API ZPA_CLIENT_ID & ZPA_CLIENT_SECRET. response: %s"
+                % (response),
+            )
+        resp_json = response.json
+        self.access_token = resp_json.get("access_token")
+        self.logger.info(
+            "signed in, token valid for %s seconds", resp_json.get("expires_in")
+        )
+        return resp_json.get("expires_in")
+
     @retry_with_backoff(retries=5)
     def login(self):
         """get jwt token"""
@@ -160,16 +504,7 @@ class ZPAClientHelper:
         }
         try:
             url = "%s/signin" % self.baseurl
-            resp, info = fetch_url(
-                module=self.module, url=url, data=data, method="POST", headers=headers
-            )
-            resp = Response(resp, info)
-            self.module.log(
-                "[INFO] calling: %s %s %s\n response: %s"
-                % ("POST", url, str(data), str("" if resp is None else resp.json))
-            )
-            # self.module.log("[INFO] %s\n" % (to_text(resp.read())))
-            return resp
+            return self._fetch("POST", url, data=data, headers=headers)
         except Exception as e:
             self._fail("login", str(e))
 
@@ -184,13 +519,40 @@ class ZPAClientHelper:
             err_string = e.get("message")
         else:
             err_string = e
-        self.module.fail_json(msg="%s: %s" % (msg, err_string))
+        failJson(self.module, "%s: %s" % (msg, err_string))
 
     def _url_builder(self, path):
         if path[0] == "/":
             path = path[1:]
         return "%s/%s" % (self.baseurl, path)
 
+    def _fetch(self, method, url, data=None, headers=None):
+        """
+        send the request over the keep-alive pool when possible, fetch_url otherwise,
+        paced by the shared rate limiter; returns a logged Response
+        """
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire(method)
+        start = time.time()
+        if self.transport is not None and self.transport.handles(url):
+            resp, info = self.transport.request(
+                method, url, data=data, headers=headers, timeout=self.timeout
+            )
+        else:
+            resp, info = fetch_url(
+                self.module,
+                url,
+                data=data,
+                headers=headers,
+                method=method,
+                timeout=self.timeout,
+            )
+        resp = Response(resp, info)
+        self.logger.request(method, url, data, resp, time.time() - start)
+        if self.rate_limiter is not None:
+            self.rate_limiter.update(method, info.get("status"), info)
+        return resp
+
     @retry_with_backoff(retries=5)
     def send(self, method, path, data=None, fail_safe=False):
         url = self._url_builder(path)
@@ -199,36 +561,41 @@ class ZPAClientHelper:
             if data == "null":
                 data = None
 
-        resp, info = fetch_url(
-            self.module,
-            url,
-            data=data,
-            headers=self.headers,
-            method=method,
-            timeout=self.timeout,
-        )
-        resp = Response(resp, info)
-        self.module.log(
-            "[INFO] calling: %s %s %s\n response: %s"
-            % (method, url, str(data), str("" if resp is None else resp.json))
-        )
+        resp = self._fetch(method, url, data=data, headers=self.headers)
+        if resp.status_code == 401 and self.token_cache is not None:
+            # the cached token was revoked or expired early, sign in again once
+            self.authenticate(stale_token=self.access_token)
+            self._set_headers()
+            resp = self._fetch(method, url, data=data, headers=self.headers)
         if resp.status_code == 400 and fail_safe:
-            self.module.fail_json(
-                msg="Operation failed. API response: %s\n" % (resp.json)
-            )
+            failJson(self.module, "Operation failed. API response: %s\n" % (resp.json))
         return resp
 
     def get(self, path, data=None, fail_safe=False):
-        return self.send("GET", path, data, fail_safe)
+        if self.response_cache is None or not self.cache_reads or data is not None:
+            return self.send("GET", path, data, fail_safe)
+        cached = self.response_cache.get(path)
+        if cached is not None:
+            self.logger.debug("GET %s served from the response cache", path)
+            return Response(None, {"status": cached[0], "body": cached[1]})
+        resp = self.send("GET", path, data, fail_safe)
+        self.response_cache.put(path, resp.status_code, resp.body)
+        return resp
+
+    def _write(self, method, path, data):
+        resp = self.send(method, path, data)
+        if self.response_cache is not None:
+            self.response_cache.invalidate(path)
+        return resp
 
     def put(self, path, data=None):
-        return self.send("PUT", path, data)
+        return self._write("PUT", path, data)
 
     def post(self, path, data=None):
-        return self.send("POST", path, data)
+        return self._write("POST", path, data)
 
     def delete(self, path, data=None):
-        return self.send("DELETE", path, data)
+        return self._write("DELETE", path, data)
 
     @staticmethod
     def zpa_argument_spec():
@@ -256,59 +623,195 @@ class ZPAClientHelper:
             ),
         )
 
+    def _page_url(self, base_url, page, data_per_page, search=None):
+        url = "{0}?page={1}&pagesize={2}".format(base_url, page, data_per_page)
+        if search is not None:
+            url += "&search={0}".format(urllib.parse.quote(search, safe=""))
+        return url
+
+    def _fail_page(self, response, base_url, data_key_name):
+        msg = "Failed to fetch %s from %s" % (data_key_name, base_url)
+        page_json = None if response is None else response.json
+        if isinstance(page_json, dict) and page_json.get("message") is not None:
+            msg += " due to error : %s" % page_json.get("message")
+        elif response is not None:
+            msg += " due to status code : %s" % response.status_code
+        failJson(self.module, msg)
+
     def get_paginated_data(
         self,
         base_url=None,
         data_key_name=None,
         data_per_page=500,
         expected_status_code=200,
+        max_workers=None,
     ):
         """
         Function to get all paginated data from given URL
         Args:
             base_url: Base URL to get data from
             data_key_name: Name of data key value
-            data_per_page: Number results per page (Default: 40)
-            expected_status_code: Expected returned code from DigitalOcean (Default: 200)
+            data_per_page: Number results per page (Default: 500)
+            expected_status_code: Expected returned code from ZPA (Default: 200)
+            max_workers: Number of pages fetched concurrently once totalPages is known
+                         (Default: ZPA_PAGINATION_WORKERS or 4, 1 fetches pages one by one)
         Returns: List of data
 
         """
-        page = 0
-        has_next = True
-        ret_data = []
-        status_code = None
-        response = None
-        while has_next or status_code != expected_status_code:
-            required_url = "{0}?page={1}&pagesize={2}".format(
-                base_url, page, data_per_page
+        if max_workers is None:
+            max_workers = env_int("ZPA_PAGINATION_WORKERS", 4)
+        response = self.get(self._page_url(base_url, 1, data_per_page))
+        if response is None or response.status_code != expected_status_code:
+            self._fail_page(response, base_url, data_key_name)
+        page_json = response.json
+        if not isinstance(page_json, dict) or page_json.get(data_key_name) is None:
+            return []
+        ret_data = list(page_json[data_key_name])
+        try:
+            total_pages = int(page_json.get("totalPages") or 1)
+        except (TypeError, ValueError):
+            total_pages = 1
+        pages = range(2, total_pages + 1)
+        if len(pages) == 0:
+            return ret_data
+
+        if max_workers <= 1:
+            responses = (
+                self.get(self._page_url(base_url, page, data_per_page))
+                for page in pages
             )
-            response = self.get(required_url)
-            status_code = response.status_code
-            # stop if any error during pagination
-            if status_code != expected_status_code:
-                break
-            page += 1
-            if (
-                response is None
-                or response.json is None
-                or response.json.get(data_key_name) is None
-            ):
-                has_next = False
-                continue
-            ret_data.extend(response.json[data_key_name])
+            return self._collect_pages(
+                ret_data, responses, base_url, data_key_name, expected_status_code
+            )
+        failure = None
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pages))) as executor:
+            futures = [
+                submitToWorker(
+                    executor, self.get, self._page_url(base_url, page, data_per_page)
+                )
+                for page in pages
+            ]
             try:
-                has_next = (
-                    response.json.get("totalPages") is not None
-                    and int(response.json["totalPages"]) != 0
-                    and int(response.json["totalPages"]) < page
+                # results are consumed in page order, whatever order they complete in
+                return self._collect_pages(
+                    ret_data,
+                    (future.result() for future in futures),
+                    base_url,
+                    data_key_name,
+                    expected_status_code,
                 )
-            except KeyError:
-                has_next = False
+            except WorkerFailure as e:
+                failure = e
+            finally:
+                for future in futures:
+                    future.cancel()
+        # reported once the other pages are done or cancelled
+        failJson(self.module, str(failure))
+
+    def iter_paginated_data(
+        self,
+        base_url=None,
+        data_key_name=None,
+        data_per_page=500,
+        expected_status_code=200,
+        search=None,
+        max_pages=None,
+    ):
+        """
+        Generator over all paginated data from given URL, fetching the next page
+        only once the previous one has been consumed, so at most one page is held
+        in memory and callers that stop early skip the remaining pages.
+        Args: same as get_paginated_data, plus
+            search: Optional server-side search string
+            max_pages: Optional limit, TooManyPages is raised before yielding any
+                item when the first page reports more pages
+        Returns: Iterator of data
+        """
+        page = 1
+        total_pages = 1
+        while page <= total_pages:
+            response = self.get(self._page_url(base_url, page, data_per_page, search))
+            if response is None or response.status_code != expected_status_code:
+                self._fail_page(response, base_url, data_key_name)
+            page_json = response.json
+            response = None
+            if not isinstance(page_json, dict) or page_json.get(data_key_name) is None:
+                return
+            try:
+                total_pages = int(page_json.get("totalPages") or 1)
+            except (TypeError, ValueError):
+                total_pages = 1
+            if max_pages is not None and total_pages > max_pages:
+                raise TooManyPages(total_pages)
+            items = page_json[data_key_name]
+            page_json = None
+            for item in items:
+                yield item
+            items = None
+            page += 1
 
-        if status_code != expected_status_code:
-            msg = "Failed to fetch %s from %s" % (data_key_name, base_url)
-            if response:
-                msg += " due to error : %s" % response.json.get("message")
-            self.module.fail_json(msg=msg)
+    def find_by_name(
+        self,
+        base_url=None,
+        name=None,
+        data_key_name="list",
+        search_page_size=20,
+        max_search_pages=5,
+    ):
+        """
+        Function to look up a single object by its exact name
+        The API is asked with a search query first and the exact match verified
+        locally; the whole collection is only scanned when the search returned
+        nothing, when the endpoint ignored the search parameter, or when the
+        search results span more pages than a scan with full pages is likely to.
+        Args:
+            base_url: Base URL of the collection
+            name: Exact name of the object
+            data_key_name: Name of data key value (Default: list)
+            search_page_size: Page size used for search results (Default: 20)
+            max_search_pages: Search result pages read at most (Default: 5)
+        Returns: The raw JSON object or None
 
+        """
+        if name is None:
+            return None
+        searched = False
+        needle = name.lower()
+        try:
+            for item in self.iter_paginated_data(
+                base_url=base_url,
+                data_key_name=data_key_name,
+                data_per_page=search_page_size,
+                search=name,
+                max_pages=max_search_pages,
+            ):
+                if item.get("name") == name:
+                    return item
+                if needle not in str(item.get("name", "")).lower():
+                    # the endpoint does not filter on search, scan it with full pages
+                    searched = False
+                    break
+                searched = True
+        except TooManyPages:
+            searched = False
+        if searched:
+            return None
+        for item in self.iter_paginated_data(
+            base_url=base_url, data_key_name=data_key_name
+        ):
+            if item.get("name") == name:
+                return item
+        return None
+
+    def _collect_pages(
+        self, ret_data, responses, base_url, data_key_name, expected_status_code
+    ):
+        for response in responses:
+            if response is None or response.status_code != expected_status_code:
+                # stop at the first failed page
+                self._fail_page(response, base_url, data_key_name)
+            page_json = response.json
+            if not isinstance(page_json, dict) or page_json.get(data_key_name) is None:
+                break
+            ret_data.extend(page_json[data_key_name])
         return ret_data
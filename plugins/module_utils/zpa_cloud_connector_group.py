@@ -3,8 +3,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     delete_none,
+    sharedClient,
 )
 
 
@@ -12,7 +12,7 @@ class CloudConnectorGroupService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
 
     def getByIDOrName(self, id, name):
         cloud_connector = None
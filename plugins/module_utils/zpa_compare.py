@@ -0,0 +1,58 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+# values that leave a field unset, whichever form the API or the module uses
+EMPTY_VALUES = (None, "", [], {})
+
+# desired values of the options left to their default: whatever ZPA holds for
+# them (e.g. the defaultIdleTimeout it picks itself) is kept
+UNSET_VALUES = (None, "")
+
+
+def normalizeValue(value):
+    """
+    canonical form of an API JSON value for comparison: booleans and numbers
+    become the strings ZPA often returns for them, and lists of objects that
+    all carry an id (references such as serverGroups) are sorted by id
+    """
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (int, float)):
+        return str(value)
+    if isinstance(value, dict):
+        return dict((k, normalizeValue(v)) for k, v in value.items())
+    if isinstance(value, (list, tuple)):
+        items = [normalizeValue(v) for v in value]
+        if items and all(
+            isinstance(i, dict) and i.get("id") is not None for i in items
+        ):
+            items.sort(key=lambda i: str(i.get("id")))
+        return items
+    return value
+
+
+def _contains(existing, desired):
+    if desired in UNSET_VALUES:
+        return True
+    if desired in EMPTY_VALUES:
+        return existing in EMPTY_VALUES
+    if isinstance(desired, dict):
+        if not isinstance(existing, dict):
+            return False
+        return all(_contains(existing.get(k), v) for k, v in desired.items())
+    if isinstance(desired, list):
+        if not isinstance(existing, list) or len(existing) != len(desired):
+            return False
+        return all(_contains(e, d) for e, d in zip(existing, desired))
+    return existing == desired
+
+
+def isEquivalent(desired, existing):
+    """
+    True when sending desired (API JSON, as built by mapAppToJSON) would not
+    change existing (the fetched object, mapped the same way). Only the fields
+    set in desired are compared: fields ZPA adds on its side and fields left to
+    None or "" are ignored.
+    """
+    return _contains(normalizeValue(existing), normalizeValue(desired))
@@ -0,0 +1,129 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import http.client as http_client
+import io
+import socket
+import ssl
+import threading
+from urllib.parse import urlparse
+from urllib.request import getproxies, proxy_bypass
+
+from ansible.module_utils.urls import get_user_agent
+
+# errors raised when a kept-alive connection was closed by the server while idle
+STALE_CONNECTION_ERRORS = (
+    http_client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+# methods safe to send again when the response to them was lost
+IDEMPOTENT_METHODS = ("GET", "HEAD")
+
+
+def proxy_configured(url):
+    """True when urllib would route url through a proxy (the pool only talks directly)"""
+    parsed = urlparse(url)
+    if parsed.scheme not in getproxies():
+        return False
+    return not proxy_bypass(parsed.hostname)
+
+
+class HTTPSConnectionPool:
+    """
+    Thread-safe pool of persistent HTTPS connections to a single host.
+    request() mirrors ansible.module_utils.urls.fetch_url and returns a
+    (response, info) tuple, so callers can switch between both transports.
+    """
+
+    def __init__(self, baseurl, maxsize=10, timeout=240, context=None):
+        parsed = urlparse(baseurl)
+        self.scheme = parsed.scheme
+        self.host = parsed.hostname
+        self.port = parsed.port or 443
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self.context = context or ssl.create_default_context()
+        self.user_agent = get_user_agent()
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def handles(self, url):
+        parsed = urlparse(url)
+        return (
+            parsed.scheme == self.scheme
+            and parsed.hostname == self.host
+            and (parsed.port or 443) == self.port
+        )
+
+    def _new_conn(self, timeout):
+        return http_client.HTTPSConnection(
+            self.host, self.port, timeout=timeout, context=self.context
+        )
+
+    def _get_conn(self, timeout):
+        with self._lock:
+            conn = self._idle.pop() if self._idle else None
+        if conn is None:
+            return self._new_conn(timeout), False
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+        return conn, True
+
+    def _put_conn(self, conn):
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    def close(self):
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def request(self, method, url, data=None, headers=None, timeout=None):
+        parsed = urlparse(url)
+        path = parsed.path or "/"
+        if parsed.query:
+            path += "?" + parsed.query
+        headers = dict(headers or {})
+        headers.setdefault("User-Agent", self.user_agent)
+        if data is not None and not isinstance(data, bytes):
+            data = data.encode("utf-8")
+        timeout = timeout or self.timeout
+        info = {"url": url}
+        while True:
+            conn, reused = self._get_conn(timeout)
+            sent = False
+            try:
+                conn.request(method, path, body=data, headers=headers)
+                sent = True
+                resp = conn.getresponse()
+                body = resp.read()
+            except STALE_CONNECTION_ERRORS as e:
+                conn.close()
+                if reused and (not sent or method in IDEMPOTENT_METHODS):
+                    # the server dropped an idle connection, retry on a fresh one;
+                    # a write it may have received is not sent twice
+                    continue
+                info.update(status=-1, msg="Request failed: %s" % (e))
+                return None, info
+            except (socket.timeout, http_client.HTTPException, OSError) as e:
+                conn.close()
+                info.update(status=-1, msg="Request failed: %s" % (e))
+                return None, info
+            break
+        if resp.will_close:
+            conn.close()
+        else:
+            self._put_conn(conn)
+        info.update((k.lower(), v) for k, v in resp.getheaders())
+        info.update(status=resp.status, msg="OK (%s bytes)" % (len(body)))
+        if resp.status >= 400:
+            info.update(msg="HTTP Error %s: %s" % (resp.status, resp.reason), body=body)
+            return None, info
+        return io.BytesIO(body), info
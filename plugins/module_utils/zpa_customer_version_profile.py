@@ -5,9 +5,9 @@ __metaclass__ = type
 import re
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     camelcaseToSnakeCase,
     delete_none,
+    sharedClient,
 )
 
 
@@ -15,7 +15,7 @@ class ProfileVersionService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
 
     def getByIDOrName(self, id, name):
         version = None
@@ -46,12 +46,23 @@ class ProfileVersionService:
             networks.append(self.mapRespJSONToApp(network))
         return networks
 
+    def iter_all(self):
+        for network in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/visible/versionProfiles"
+            % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(network)
+
     def getByName(self, name):
-        networks = self.getAll()
-        for network in networks:
-            if network.get("name") == name:
-                return network
-        return None
+        network = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/visible/versionProfiles"
+            % (self.customer_id),
+            name=name,
+        )
+        if network is None:
+            return None
+        return self.mapRespJSONToApp(network)
 
     def mapJSONCustomScopeCustomerIds(self, d):
         if d is None:
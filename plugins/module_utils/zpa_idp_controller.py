@@ -3,8 +3,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     delete_none,
+    sharedClient,
 )
 
 
@@ -12,7 +12,7 @@ class IDPControllerService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
 
     def getByIDOrName(self, id, name):
         idp = None
@@ -41,12 +41,21 @@ class IDPControllerService:
             idps.append(self.mapRespJSONToApp(idp))
         return idps
 
+    def iter_all(self):
+        for idp in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v2/admin/customers/%s/idp" % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(idp)
+
     def getByName(self, name):
-        idps = self.getAll()
-        for idp in idps:
-            if idp.get("name") == name:
-                return idp
-        return None
+        idp = self.rest.find_by_name(
+            base_url="/mgmtconfig/v2/admin/customers/%s/idp" % (self.customer_id),
+            name=name,
+        )
+        if idp is None:
+            return None
+        return self.mapRespJSONToApp(idp)
 
     @delete_none
     def mapRespJSONToApp(self, resp_json):
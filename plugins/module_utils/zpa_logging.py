@@ -0,0 +1,157 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import re
+import time
+from urllib.parse import urlparse
+
+from ansible.module_utils._text import to_text
+
+LOG_LEVELS = {"off": 0, "error": 1, "warn": 2, "info": 3, "debug": 4}
+
+DEFAULT_LOG_LEVEL = "info"
+DEFAULT_MAX_BODY = 1024
+
+REDACTED = "********"
+
+# characters kept past the truncation point so that a secret crossing it is still redacted
+REDACT_MARGIN = 4096
+
+# secrets in JSON bodies, form encoded bodies and headers
+SECRET_PATTERNS = [
+    re.compile(
+        r'("(?:access_token|client_secret|clientSecret|refresh_token)"\s*:\s*")[^"]*'
+    ),
+    re.compile(r"((?:access_token|client_secret|refresh_token)=)[^&\s]*"),
+    re.compile(
+        r"((?:Authorization|authorization)['\"]?\s*[:=]\s*['\"]?Bearer\s+)[^'\"\s,}]*"
+    ),
+]
+
+
+def redact(text):
+    for pattern in SECRET_PATTERNS:
+        text = pattern.sub(r"\1" + REDACTED, text)
+    return text
+
+
+def redactAndTruncate(data, limit):
+    """
+    data redacted, then truncated; only the part that is kept (plus a margin for a
+    secret crossing the cut) goes through the redaction patterns
+    """
+    size = len(data)
+    if 0 <= limit < size:
+        data = data[: limit + REDACT_MARGIN]
+    text = redact(to_text(data, errors="surrogate_or_replace"))
+    if 0 <= limit < size:
+        return "%s... (%d more)" % (text[:limit], size - limit)
+    return text
+
+
+class RequestLogger:
+    """
+    Verbosity aware logging for ZPAClientHelper (ZPA_LOG_LEVEL: off, error, warn,
+    info or debug). Messages are only formatted when their level is enabled, bodies
+    are only logged at debug level, truncated to ZPA_LOG_MAX_BODY characters and
+    stripped of tokens and secrets. With ZPA_LOG_TIMING set to a file path, one JSON
+    line per request (method, path, status, bytes, ms) is appended to that file.
+    """
+
+    def __init__(self, module, level=None, max_body=None, timing_file=None):
+        self.module = module
+        if level is None:
+            level = os.environ.get("ZPA_LOG_LEVEL", DEFAULT_LOG_LEVEL)
+        self.level = LOG_LEVELS.get(str(level).strip().lower(), LOG_LEVELS["info"])
+        if max_body is None:
+            try:
+                max_body = int(os.environ.get("ZPA_LOG_MAX_BODY", DEFAULT_MAX_BODY))
+            except ValueError:
+                max_body = DEFAULT_MAX_BODY
+        self.max_body = max_body
+        if timing_file is None:
+            timing_file = os.environ.get("ZPA_LOG_TIMING") or None
+        self.timing_file = timing_file
+
+    def enabled(self, level):
+        return 0 < LOG_LEVELS[level] <= self.level
+
+    def log(self, level, msg, *args):
+        """log msg % args when level is enabled"""
+        if not self.enabled(level):
+            return
+        if args:
+            msg = msg % args
+        self.module.log("[%s] %s" % (level.upper(), msg))
+
+    def error(self, msg, *args):
+        self.log("error", msg, *args)
+
+    def warn(self, msg, *args):
+        self.log("warn", msg, *args)
+
+    def info(self, msg, *args):
+        self.log("info", msg, *args)
+
+    def debug(self, msg, *args):
+        self.log("debug", msg, *args)
+
+    def body(self, data):
+        """printable, truncated and redacted form of a request or response body"""
+        if data is None:
+            return ""
+        if not isinstance(data, (bytes, str)):
+            data = str(data)
+        return redactAndTruncate(data, self.max_body)
+
+    def request(self, method, url, data, response, elapsed):
+        """log one API call and record its timing; response is a zpa_client.Response"""
+        status = response.status_code
+        body = response.body
+        if not body:
+            body = response.info.get("body")
+        size = len(body) if body else 0
+        ms = elapsed * 1000
+        if self.enabled("debug"):
+            self.debug(
+                "%s %s -> %s (%d bytes, %.1f ms)\n request: %s\n response: %s",
+                method,
+                url,
+                status,
+                size,
+                ms,
+                self.body(data),
+                self.body(body),
+            )
+        else:
+            self.info("%s %s -> %s (%d bytes, %.1f ms)", method, url, status, size, ms)
+        if self.timing_file is not None:
+            self.timing(method, url, status, size, ms)
+
+    def timing(self, method, url, status, size, ms):
+        line = json.dumps(
+            {
+                "ts": round(time.time(), 3),
+                "method": method,
+                "path": urlparse(url).path,
+                "status": status,
+                "bytes": size,
+                "ms": round(ms, 1),
+            },
+            separators=(",", ":"),
+        )
+        try:
+            # a single O_APPEND write keeps lines from concurrent forks intact
+            fd = os.open(
+                self.timing_file, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o600
+            )
+            try:
+                os.write(fd, (line + "\n").encode("utf-8"))
+            finally:
+                os.close(fd)
+        except (IOError, OSError) as e:
+            self.warn("unable to write request timing to %s: %s", self.timing_file, e)
+            self.timing_file = None
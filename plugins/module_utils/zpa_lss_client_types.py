@@ -3,15 +3,15 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     camelcaseToSnakeCase,
+    sharedClient,
 )
 
 
 class LSSClientTypesService:
     def __init__(self, module):
         self.module = module
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
 
     def getAll(self):
         response = self.rest.get("/mgmtconfig/v2/admin/lssConfig/clientTypes")
@@ -5,10 +5,11 @@ __metaclass__ = type
 import re
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     camelcaseToSnakeCase,
     delete_none,
+    sharedClient,
     snakecaseToCamelcase,
+    writtenObject,
 )
 
 
@@ -16,7 +17,7 @@ class LSSConfigControllerService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
 
     def getByIDOrName(self, id, name):
         lss_config = None
@@ -45,9 +46,15 @@ class LSSConfigControllerService:
             lss_configs.append(self.mapRespJSONToApp(lss_config))
         return lss_configs
 
+    def iter_all(self):
+        for lss_config in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v2/admin/customers/%s/lssConfig" % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(lss_config)
+
     def getByName(self, name):
-        lss_configs = self.getAll()
-        for lss_config in lss_configs:
+        for lss_config in self.iter_all():
             if lss_config.get("config", {}).get("name") == name:
                 return lss_config
         return None
@@ -217,6 +224,9 @@ class LSSConfigControllerService:
         status_code = response.status_code
         if status_code > 299:
             return None
+        written = writtenObject(self.rest, response, appJSON)
+        if written is not None:
+            return self.mapRespJSONToApp(written)
         return self.getByID(response.json.get("id"))
 
     def update(self, lss_config):
@@ -230,6 +240,9 @@ class LSSConfigControllerService:
         status_code = response.status_code
         if status_code > 299:
             return None
+        written = writtenObject(self.rest, response, appJSON)
+        if written is not None:
+            return self.mapRespJSONToApp(written)
         return self.getByID(appJSON.get("id"))
 
     def delete(self, id):
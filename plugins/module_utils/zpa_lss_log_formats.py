@@ -3,15 +3,15 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     camelcaseToSnakeCase,
+    sharedClient,
 )
 
 
 class LSSLogFormatsService:
     def __init__(self, module):
         self.module = module
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
 
     def getByLogType(self, logType):
         response = self.rest.get(
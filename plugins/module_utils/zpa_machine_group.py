@@ -3,8 +3,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     delete_none,
+    sharedClient,
 )
 
 
@@ -12,7 +12,7 @@ class MachineGroupService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
 
     def getByIDOrName(self, id, name):
         machineGroup = None
@@ -42,12 +42,23 @@ class MachineGroupService:
             machineGroups.append(self.mapRespJSONToApp(machineGroup))
         return machineGroups
 
+    def iter_all(self):
+        for machineGroup in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/machineGroup"
+            % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(machineGroup)
+
     def getByName(self, name):
-        machineGroups = self.getAll()
-        for machineGroup in machineGroups:
-            if machineGroup.get("name") == name:
-                return machineGroup
-        return None
+        machineGroup = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/machineGroup"
+            % (self.customer_id),
+            name=name,
+        )
+        if machineGroup is None:
+            return None
+        return self.mapRespJSONToApp(machineGroup)
 
     @delete_none
     def mapRespJSONToApp(self, resp_json):
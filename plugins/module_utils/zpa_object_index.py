@@ -0,0 +1,442 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import time
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_cache_utils import (
+    cache_key,
+    default_cache_dir,
+    read_json,
+    write_json_atomic,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    env_int,
+    runConcurrently,
+)
+
+POLICY_RULES = "/mgmtconfig/v1/admin/customers/%s/policySet/rules/policyType/"
+PROVISIONING_KEYS = "/mgmtconfig/v1/admin/customers/%s/associationType/"
+
+# kind: (collection URL, single object URL, attribute other resources refer to the
+# objects by). URLs are formatted with the customer id, the collection URL of IdP
+# scoped kinds with the customer id and the IdP id. Kinds without a single object
+# URL can only be checked against their whole collection.
+OBJECT_KINDS = {
+    "app_connector": ("/mgmtconfig/v1/admin/customers/%s/connector", None, "id"),
+    "app_connector_group": (
+        "/mgmtconfig/v1/admin/customers/%s/appConnectorGroup",
+        None,
+        "id",
+    ),
+    "application": (
+        "/mgmtconfig/v1/admin/customers/%s/application",
+        "/mgmtconfig/v1/admin/customers/%s/application/%s",
+        "id",
+    ),
+    "application_server": ("/mgmtconfig/v1/admin/customers/%s/server", None, "id"),
+    "ba_certificate": (
+        "/mgmtconfig/v2/admin/customers/%s/clientlessCertificate/issued",
+        None,
+        "id",
+    ),
+    "cloud_connector_group": (
+        "/mgmtconfig/v1/admin/customers/%s/cloudConnectorGroup",
+        "/mgmtconfig/v1/admin/customers/%s/cloudConnectorGroup/%s",
+        "id",
+    ),
+    "customer_version_profile": (
+        "/mgmtconfig/v1/admin/customers/%s/visible/versionProfiles",
+        None,
+        "id",
+    ),
+    "enrollment_certificate": (
+        "/mgmtconfig/v2/admin/customers/%s/enrollmentCert",
+        None,
+        "id",
+    ),
+    "idp": (
+        "/mgmtconfig/v2/admin/customers/%s/idp",
+        "/mgmtconfig/v1/admin/customers/%s/idp/%s",
+        "id",
+    ),
+    "lss_config": ("/mgmtconfig/v2/admin/customers/%s/lssConfig", None, "id"),
+    "machine_group": (
+        "/mgmtconfig/v1/admin/customers/%s/machineGroup",
+        "/mgmtconfig/v1/admin/customers/%s/machineGroup/%s",
+        "id",
+    ),
+    "policy_access_rule": (POLICY_RULES + "ACCESS_POLICY", None, "id"),
+    "policy_forwarding_rule": (POLICY_RULES + "BYPASS_POLICY", None, "id"),
+    "policy_timeout_rule": (POLICY_RULES + "TIMEOUT_POLICY", None, "id"),
+    "posture": ("/mgmtconfig/v2/admin/customers/%s/posture", None, "postureUdid"),
+    "provisioning_key_connector": (
+        PROVISIONING_KEYS + "CONNECTOR_GRP/provisioningKey",
+        None,
+        "id",
+    ),
+    "provisioning_key_service_edge": (
+        PROVISIONING_KEYS + "SERVICE_EDGE_GRP/provisioningKey",
+        None,
+        "id",
+    ),
+    "saml_attribute": (
+        "/mgmtconfig/v2/admin/customers/%s/samlAttribute",
+        "/mgmtconfig/v1/admin/customers/%s/samlAttribute/%s",
+        "id",
+    ),
+    "scim_attribute": (
+        "/mgmtconfig/v1/admin/customers/%s/idp/%s/scimattribute",
+        "/mgmtconfig/v1/admin/customers/%s/idp/scimattribute/%s",
+        "id",
+    ),
+    "scim_group": (
+        "/userconfig/v1/customers/%s/scimgroup/idpId/%s",
+        "/userconfig/v1/customers/%s/scimgroup/%s",
+        "id",
+    ),
+    "segment_group": (
+        "/mgmtconfig/v1/admin/customers/%s/segmentGroup",
+        "/mgmtconfig/v1/admin/customers/%s/segmentGroup/%s",
+        "id",
+    ),
+    "server_group": ("/mgmtconfig/v1/admin/customers/%s/serverGroup", None, "id"),
+    "service_edge_group": (
+        "/mgmtconfig/v1/admin/customers/%s/serviceEdgeGroup",
+        None,
+        "id",
+    ),
+    "trusted_network": (
+        "/mgmtconfig/v2/admin/customers/%s/network",
+        None,
+        "networkId",
+    ),
+}
+
+# kinds whose collection belongs to one IdP
+IDP_SCOPED_KINDS = ("scim_attribute", "scim_group")
+
+# page size of the collection fetches (the iter_paginated_data default)
+PAGE_SIZE = 500
+
+
+def collectionURL(kind, customer_id, scope=None):
+    url = OBJECT_KINDS[kind][0]
+    return url % ((customer_id,) if scope is None else (customer_id, scope))
+
+
+def recordAttributes(kind):
+    """attributes kept in the index for each object of this kind"""
+    attributes = ("id", "name")
+    if OBJECT_KINDS[kind][2] not in attributes:
+        attributes += (OBJECT_KINDS[kind][2],)
+    return attributes
+
+
+class ObjectIndex:
+    """
+    Index of the objects of ZPA collections, for turning names into ids and for
+    checking that the objects referenced by other resources exist.
+    Each (kind, IdP) collection is streamed at most once, keeping only the id, the
+    name and the attribute other resources use (postureUdid, networkId) of each
+    object, so SCIM directories with tens of thousands of groups stay cheap to hold.
+    Missing collections are fetched concurrently over the shared client, and with
+    ttl > 0 they are persisted for the following tasks; a value missing from a
+    persisted collection is looked up again before being reported as missing.
+    Collections can be shared between instances through the memo dict.
+    """
+
+    def __init__(
+        self, rest, customer_id, ttl=0, cache_dir=None, memo=None, max_workers=4
+    ):
+        self.rest = rest
+        self.customer_id = customer_id
+        self.ttl = ttl
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.max_workers = max_workers
+        self._tenant = cache_key(customer_id, getattr(rest, "baseurl", ""))
+        self._records = memo if memo is not None else {}
+        self._maps = {}
+        self._stale = set()
+        self._exists = {}
+
+    def _module(self):
+        """module the failures of concurrent fetches are reported to"""
+        return getattr(self.rest, "module", None)
+
+    def _key(self, kind, scope):
+        return (self._tenant, kind, scope)
+
+    def _cache_path(self, kind, scope):
+        name = kind if scope is None else "%s-%s" % (kind, cache_key(scope))
+        return os.path.join(self.cache_dir, "index-%s-%s.json" % (self._tenant, name))
+
+    def _read_persisted(self, kind, scope):
+        if self.ttl <= 0:
+            return None
+        entry = read_json(self._cache_path(kind, scope))
+        return entry if isinstance(entry, dict) else None
+
+    def _load_persisted(self, kind, scope):
+        entry = self._read_persisted(kind, scope)
+        if entry is None or not isinstance(entry.get("records"), list):
+            return None
+        if time.time() - float(entry.get("fetched_at", 0)) > self.ttl:
+            return None
+        return entry["records"]
+
+    def _persist(self, kind, scope, records):
+        if self.ttl <= 0:
+            return
+        try:
+            write_json_atomic(
+                self._cache_path(kind, scope),
+                {
+                    "fetched_at": time.time(),
+                    "pages": max(1, -(-len(records) // PAGE_SIZE)),
+                    "records": records,
+                },
+            )
+        except (IOError, OSError):
+            pass
+
+    def fetch(self, kind, scope=None, keep=None):
+        """
+        stream the (kind, IdP) collection and index it in one pass; returns the raw
+        items for which keep(item) is true
+        """
+        attributes = recordAttributes(kind)
+        records = []
+        kept = []
+        for item in self.rest.iter_paginated_data(
+            base_url=collectionURL(kind, self.customer_id, scope),
+            data_key_name="list",
+        ):
+            records.append(
+                dict((attribute, item.get(attribute)) for attribute in attributes)
+            )
+            if keep is not None and keep(item):
+                kept.append(item)
+        self._records[self._key(kind, scope)] = records
+        self._stale.discard(self._key(kind, scope))
+        self._persist(kind, scope, records)
+        return kept
+
+    def loaded(self, kind, scope=None):
+        return self._key(kind, scope) in self._records
+
+    def records(self, kind, scope=None, refresh=False):
+        """indexed objects of the (kind, IdP) collection, fetched at most once"""
+        key = self._key(kind, scope)
+        if not refresh:
+            if key in self._records:
+                return self._records[key]
+            records = self._load_persisted(kind, scope)
+            if records is not None:
+                self._records[key] = records
+                self._stale.add(key)
+                return records
+        self.fetch(kind, scope)
+        return self._records[key]
+
+    def fetchCost(self, kind, scope=None):
+        """
+        requests needed to load the (kind, IdP) collection: 0 when it is loaded or
+        persisted, the page count of its last persisted fetch once that expired,
+        None when unknown
+        """
+        if self.loaded(kind, scope):
+            return 0
+        records = self._load_persisted(kind, scope)
+        if records is not None:
+            self._records[self._key(kind, scope)] = records
+            self._stale.add(self._key(kind, scope))
+            return 0
+        entry = self._read_persisted(kind, scope)
+        pages = None if entry is None else entry.get("pages")
+        return pages if isinstance(pages, int) else None
+
+    def worthFetching(self, kind, count, scope=None):
+        """
+        True when loading the (kind, IdP) collection is known to take fewer requests
+        than count single object GETs
+        """
+        cost = self.fetchCost(kind, scope)
+        return cost is not None and cost < count
+
+    def prefetch(self, collections):
+        """load the given (kind, scope) collections, fetching the missing ones concurrently"""
+        missing = []
+        for kind, scope in set(collections):
+            key = self._key(kind, scope)
+            if key in self._records:
+                continue
+            records = self._load_persisted(kind, scope)
+            if records is None:
+                missing.append((kind, scope))
+            else:
+                self._records[key] = records
+                self._stale.add(key)
+        runConcurrently(
+            self._module(), [(self.fetch, c) for c in missing], self.max_workers
+        )
+
+    def byKey(self, kind, attribute, scope=None):
+        """{str(record[attribute]): record}, the first object wins on duplicates"""
+        records = self.records(kind, scope)
+        built = self._maps.get((kind, scope, attribute))
+        if built is None or built[0] is not records:
+            values = {}
+            for record in records:
+                value = record.get(attribute)
+                if value is not None:
+                    values.setdefault(str(value), record)
+            built = (records, values)
+            self._maps[(kind, scope, attribute)] = built
+        return built[1]
+
+    def get(self, kind, attribute, value, scope=None):
+        """indexed object of this kind whose attribute is value, or None"""
+        if value is None:
+            return None
+        found = self.byKey(kind, attribute, scope).get(str(value))
+        if found is None and self._key(kind, scope) in self._stale:
+            # persisted by an earlier task, the object may have been created since
+            self.records(kind, scope, refresh=True)
+            found = self.byKey(kind, attribute, scope).get(str(value))
+        return found
+
+    def contains(self, kind, attribute, value, scope=None):
+        return self.get(kind, attribute, value, scope) is not None
+
+    def items(self, kind, attribute, values, scope=None):
+        """
+        {value: raw item} of the objects whose attribute is one of values, found in
+        a single pass over the collection (which is indexed again on the way)
+        """
+        wanted = set(str(value) for value in values)
+        found = {}
+        for item in self.fetch(
+            kind, scope, keep=lambda item: str(item.get(attribute)) in wanted
+        ):
+            found.setdefault(str(item.get(attribute)), item)
+        return found
+
+    def all(self, kind, scope=None):
+        """raw items of the whole collection, the index is refreshed on the way"""
+        return self.fetch(kind, scope, keep=lambda item: True)
+
+    def idpID(self, idp_name):
+        found = self.get("idp", "name", idp_name)
+        return found.get("id") if found else None
+
+    def resolveNames(self, refs):
+        """
+        indexed object (or None) of each (kind, name, IdP name) reference, in order.
+        IdP names are resolved first, then every other collection is fetched once.
+        """
+        idp_names = set(idp for kind, name, idp in refs if kind in IDP_SCOPED_KINDS)
+        wanted = set((kind, None) for kind, name, idp in refs)
+        wanted.difference_update((kind, None) for kind in IDP_SCOPED_KINDS)
+        if idp_names:
+            wanted.add(("idp", None))
+        self.prefetch(wanted)
+        idp_ids = dict((idp, self.idpID(idp)) for idp in idp_names)
+        self.prefetch(
+            (kind, idp_ids[idp])
+            for kind, name, idp in refs
+            if kind in IDP_SCOPED_KINDS and idp_ids[idp] is not None
+        )
+        results = []
+        for kind, name, idp in refs:
+            scope = idp_ids[idp] if kind in IDP_SCOPED_KINDS else None
+            if kind in IDP_SCOPED_KINDS and scope is None:
+                results.append(None)
+            else:
+                results.append(self.get(kind, "name", name, scope))
+        return results
+
+    def _getOne(self, kind, value):
+        response = self.rest.get(OBJECT_KINDS[kind][1] % (self.customer_id, value))
+        return response.status_code == 200
+
+    def exists(self, kind, value, scope=None):
+        """
+        True when the object of this kind referenced by value (its id, postureUdid
+        or networkId) exists, None otherwise. With scope, value is checked against
+        the collection of that IdP; without, against the collection when it is loaded
+        or can only be checked that way, otherwise with a single object GET.
+        Results are kept per (kind, value), whatever the scope.
+        """
+        value = str(value)
+        if (kind, value) in self._exists:
+            return self._exists[(kind, value)]
+        dummy, item_url, attribute = OBJECT_KINDS[kind]
+        if scope is not None:
+            found = self.exists("idp", scope) and self.contains(
+                kind, attribute, value, scope
+            )
+        elif self.loaded(kind) or item_url is None:
+            found = value in self.byKey(kind, attribute)
+            if not found and self._key(kind, None) in self._stale:
+                # persisted by an earlier task, the object may have been created since
+                if item_url is not None:
+                    found = self._getOne(kind, value)
+                else:
+                    found = self.contains(kind, attribute, value)
+        else:
+            found = self._getOne(kind, value)
+        result = True if found else None
+        self._exists[(kind, value)] = result
+        return result
+
+    def _plan(self, refs):
+        """
+        ({kind: values} of the unresolved refs, kinds checked against their whole
+        collection: the ones without single object URL and the ones whose collection
+        is known to take fewer requests than their values)
+        """
+        values_by_kind = {}
+        for kind, value in refs:
+            if (kind, str(value)) not in self._exists:
+                values_by_kind.setdefault(kind, set()).add(str(value))
+        collections = []
+        for kind, values in values_by_kind.items():
+            if kind in IDP_SCOPED_KINDS:
+                continue
+            if OBJECT_KINDS[kind][1] is None or self.worthFetching(kind, len(values)):
+                collections.append(kind)
+        return values_by_kind, collections
+
+    def resolve(self, refs, max_workers=1):
+        """
+        check every (kind, value) reference of refs: the collection fetches planned
+        by _plan and the single object GETs of the other values run concurrently, at
+        most max_workers at a time, after which exists() answers locally
+        """
+        values_by_kind, collections = self._plan(refs)
+        calls = [(self.records, (kind,)) for kind in collections]
+        for kind, values in values_by_kind.items():
+            if kind not in collections and not self.loaded(kind):
+                calls.extend((self.exists, (kind, value)) for value in sorted(values))
+        runConcurrently(self._module(), calls, max_workers)
+        for kind, value in refs:
+            self.exists(kind, value)
+
+
+def sharedIndex(rest, customer_id):
+    """
+    ObjectIndex shared by every service using the same client, kept on the client
+    itself so that it goes away with it; collections are persisted for
+    ZPA_REFERENCE_CACHE_TTL seconds
+    """
+    indexes = getattr(rest, "_shared_indexes", None)
+    if not isinstance(indexes, dict):
+        indexes = {}
+        setattr(rest, "_shared_indexes", indexes)
+    if customer_id not in indexes:
+        indexes[customer_id] = ObjectIndex(
+            rest, customer_id, ttl=env_int("ZPA_REFERENCE_CACHE_TTL", 0)
+        )
+    return indexes[customer_id]
@@ -7,15 +7,59 @@ import re
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
     camelcaseToSnakeCase,
-    delete_none,
+    writtenObject,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_object_index import (
+    sharedIndex,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_reorder import (
+    currentOrder,
+    planMoves,
+    targetOrder,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_validation import (
+    lhsWarn,
+    offlineValidation,
+    operandMessages,
+    rhsWarn,
+    validateRuleConditions,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_schema import (
+    POLICY_CONDITION,
+    REFERENCES,
+    Field,
+    Schema,
+)
+
+ACCESS_RULE = Schema(
+    Field("default_rule"),
+    Field("default_rule_name", write=False),
+    Field("description"),
+    Field("policy_type"),
+    Field("custom_msg"),
+    Field("policy_set_id"),
+    Field("id"),
+    Field("lss_default_rule"),
+    Field("action_id"),
+    Field("name"),
+    Field("app_connector_groups", kind=REFERENCES),
+    Field("action"),
+    Field("priority"),
+    Field("operator"),
+    Field("rule_order"),
+    Field("conditions", schema=POLICY_CONDITION),
+    Field("app_server_groups", kind=REFERENCES),
 )
 
 
 class PolicyAccessRuleService:
+    POLICY_TYPE = "ACCESS_POLICY"
+
     def __init__(self, module, customer_id, rest):
         self.module = module
         self.customer_id = customer_id
         self.rest = rest
+        self.index = sharedIndex(self.rest, customer_id)
 
     def getByIDOrName(self, id, name, policy_set_id, policy_type):
         policy_rule = None
@@ -56,147 +100,29 @@ class PolicyAccessRuleService:
             policy_rules.append(self.mapRespJSONToPolicy(policy_rule))
         return policy_rules
 
+    def iter_all(self, policy_type):
+        for policy_rule in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/policySet/rules/policyType/%s"
+            % (self.customer_id, policy_type),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToPolicy(policy_rule)
+
     def getByNameAndType(self, name, type):
-        policy_rules = self.getAllByPolicyType(type)
-        for policy_rule in policy_rules:
-            if policy_rule.get("name") == name:
-                return policy_rule
-        return None
-
-    def mapListJSONToList(self, entities):
-        if entities is None:
-            return []
-        l = []
-        for s in entities:
-            l.append(camelcaseToSnakeCase(s))
-        return l
-
-    def mapListToJSONObjList(self, entities):
-        if entities is None:
-            return []
-        l = []
-        for e in entities:
-            l.append(dict(id=e.get("id")))
-        return l
-
-    def mapOperandsToList(self, operandsJSON):
-        ops = []
-        for op in operandsJSON:
-            ops.append(
-                {
-                    "id": op.get("id"),
-                    "creation_time": op.get("creationTime"),
-                    "modified_by": op.get("modifiedBy"),
-                    "object_type": op.get("objectType"),
-                    "lhs": op.get("lhs"),
-                    "rhs": op.get("rhs"),
-                    "name": op.get("name"),
-                }
-            )
-        return ops
-
-    def mapOperandsToListJSON(self, operandsJSON):
-        ops = []
-        for op in operandsJSON:
-            ops.append(
-                {
-                    "objectType": op.get("object_type"),
-                    "lhs": op.get("lhs"),
-                    "rhs": op.get("rhs"),
-                    "name": op.get("name"),
-                    "idpId": op.get("idp_id"),
-                }
-            )
-        return ops
-
-    def mapConditionsToList(self, conditionsJSON):
-        conds = []
-        if conditionsJSON is None:
-            return conds
-        for cond in conditionsJSON:
-            """ """
-            conds.append(
-                {
-                    "id": cond.get("id"),
-                    "modified_time": cond.get("modifiedTime"),
-                    "creation_time": cond.get("creationTime"),
-                    "modified_by": cond.get("modifiedBy"),
-                    "operator": cond.get("operator"),
-                    "negated": cond.get("negated"),
-                    "operands": self.mapOperandsToList(cond.get("operands")),
-                }
-            )
-        return conds
-
-    def mapConditionsToJSONList(self, conditions):
-        conds = []
-        if conditions is None:
-            return conds
-        for cond in conditions:
-            """ """
-            conds.append(
-                {
-                    "operator": cond.get("operator"),
-                    "negated": cond.get("negated"),
-                    "operands": self.mapOperandsToListJSON(cond.get("operands")),
-                }
-            )
-        return conds
+        policy_rule = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/policySet/rules/policyType/%s"
+            % (self.customer_id, type),
+            name=name,
+        )
+        if policy_rule is None:
+            return None
+        return self.mapRespJSONToPolicy(policy_rule)
 
-    @delete_none
     def mapRespJSONToPolicy(self, resp_json):
-        if resp_json is None:
-            return {}
-        return {
-            "default_rule": resp_json.get("defaultRule"),
-            "default_rule_name": resp_json.get("defaultRuleName"),
-            "description": resp_json.get("description"),
-            "policy_type": resp_json.get("policyType"),
-            "custom_msg": resp_json.get("customMsg"),
-            "policy_set_id": resp_json.get("policySetId"),
-            "id": resp_json.get("id"),
-            "lss_default_rule": resp_json.get("lssDefaultRule"),
-            "action_id": resp_json.get("actionId"),
-            "name": resp_json.get("name"),
-            "app_connector_groups": self.mapListJSONToList(
-                resp_json.get("appConnectorGroups")
-            ),
-            "action": resp_json.get("action"),
-            "priority": resp_json.get("priority"),
-            "operator": resp_json.get("operator"),
-            "rule_order": resp_json.get("ruleOrder"),
-            "conditions": self.mapConditionsToList(resp_json.get("conditions")),
-            "app_server_groups": self.mapListJSONToList(
-                resp_json.get("appServerGroups")
-            ),
-        }
-
-    @delete_none
+        return ACCESS_RULE.fromJSON(resp_json)
+
     def mapAppToJSON(self, policy_rule):
-        if policy_rule is None:
-            return {}
-        return {
-            "defaultRule": policy_rule.get("default_rule"),
-            "description": policy_rule.get("description"),
-            "policyType": policy_rule.get("policy_type"),
-            "customMsg": policy_rule.get("custom_msg"),
-            "policySetId": policy_rule.get("policy_set_id"),
-            "id": policy_rule.get("id"),
-            "lssDefaultRule": policy_rule.get("lss_default_rule"),
-            "actionId": policy_rule.get("action_id"),
-            "name": policy_rule.get("name"),
-            "action": policy_rule.get("action"),
-            "priority": policy_rule.get("priority"),
-            "operator": policy_rule.get("operator"),
-            "ruleOrder": policy_rule.get("rule_order"),
-            "conditions": self.mapConditionsToJSONList(policy_rule.get("conditions")),
-            "appServerGroups": self.mapListToJSONObjList(
-                policy_rule.get("app_server_groups")
-            ),
-            "appConnectorGroups": self.mapListToJSONObjList(
-                policy_rule.get("app_connector_groups")
-            ),
-        }
+        return ACCESS_RULE.toJSON(policy_rule)
 
     def customValidate(self, operand, expectedLHS, expectedRHS, getByID):
         if operand.get("lhs", "") == "" or not operand.get("lhs") in expectedLHS:
@@ -208,23 +134,17 @@ class PolicyAccessRuleService:
                 operand.get("objectType"), expectedRHS, operand.get("rhs"), None
             )
         resp = getByID(operand.get("rhs"))
-        if resp:
+        if resp is True:
             return True
         return self.rhsWarn(
             operand.get("objectType"), expectedRHS, operand.get("rhs"), resp
         )
 
     def rhsWarn(self, objType, expected, rhs, err):
-        return (
-            '[WARN] when operand object type is %s RHS must be an existing %s, value is "%s", %s\n'
-            % (objType, expected, rhs, err)
-        )
+        return rhsWarn(objType, expected, rhs, err)
 
     def lhsWarn(self, objType, expected, lhs, err):
-        return (
-            '[WARN] when operand object type is %s LHS must be an existing %s value is "%s", %s\n'
-            % (objType, expected, lhs, err)
-        )
+        return lhsWarn(objType, expected, lhs, err)
 
     def reorder(self, rule_id, policy_set_id, order):
         """reorder the Policy rule"""
@@ -237,46 +157,36 @@ class PolicyAccessRuleService:
             return None
         return self.getByID(rule_id, policy_set_id)
 
+    def reorderAll(self, policy_set_id, policy_type, rule_orders, rules=None):
+        """
+        move rules to the {rule ID: order} positions with the fewest reorder calls,
+        without re-fetching the moved rules; returns the applied (rule ID, order)
+        moves, or None when a move failed
+        """
+        if rules is None:
+            rules = self.getAllByPolicyType(policy_type)
+        current = currentOrder(rules)
+        moves = planMoves(current, targetOrder(current, rule_orders))
+        for rule_id, order in moves:
+            response = self.rest.put(
+                "/mgmtconfig/v1/admin/customers/%s/policySet/%s/rule/%s/reorder/%s"
+                % (self.customer_id, policy_set_id, rule_id, order)
+            )
+            if response.status_code > 299:
+                return None
+        return moves
+
     def getAppSegmentByID(self, id):
-        response = self.rest.get(
-            "/mgmtconfig/v1/admin/customers/%s/application/%s" % (self.customer_id, id)
-        )
-        status_code = response.status_code
-        if status_code != 200:
-            return None
-        return True
+        return self.index.exists("application", id)
 
     def getSegmentGroupByID(self, id):
-        response = self.rest.get(
-            "/mgmtconfig/v1/admin/customers/%s/segmentGroup/%s"
-            % (self.customer_id, id),
-            fail_safe=True,
-        )
-        status_code = response.status_code
-        if status_code != 200:
-            return None
-        return True
+        return self.index.exists("segment_group", id)
 
     def getIDPControllerByID(self, id):
-        response = self.rest.get(
-            "/mgmtconfig/v1/admin/customers/%s/idp/%s" % (self.customer_id, id),
-            fail_safe=True,
-        )
-        status_code = response.status_code
-        if status_code != 200:
-            return None
-        return True
+        return self.index.exists("idp", id)
 
     def getCloudConnectorGroupByID(self, id):
-        response = self.rest.get(
-            "/mgmtconfig/v1/admin/customers/%s/cloudConnectorGroup/%s"
-            % (self.customer_id, id),
-            fail_safe=True,
-        )
-        status_code = response.status_code
-        if status_code != 200:
-            return None
-        return True
+        return self.index.exists("cloud_connector_group", id)
 
     def validClientType(self, id):
         if id not in [
@@ -295,106 +205,61 @@ class PolicyAccessRuleService:
         return True
 
     def getMachineGroupByID(self, id):
-        response = self.rest.get(
-            "/mgmtconfig/v1/admin/customers/%s/machineGroup/%s"
-            % (self.customer_id, id),
-            fail_safe=True,
-        )
-        status_code = response.status_code
-        if status_code != 200:
-            return None
-        return True
+        return self.index.exists("machine_group", id)
 
     def getByPostureUDID(self, postureUDID):
-        list = self.rest.get_paginated_data(
-            base_url="/mgmtconfig/v2/admin/customers/%s/posture" % (self.customer_id),
-            data_key_name="list",
-        )
-        for posture in list:
-            if posture.get("postureUdid") == postureUDID:
-                return True
-        return None
+        return self.index.exists("posture", postureUDID)
 
     def getTrustedNetworkByNetID(self, networkID):
-        list = self.rest.get_paginated_data(
-            base_url="/mgmtconfig/v2/admin/customers/%s/network" % (self.customer_id),
-            data_key_name="list",
-        )
-        for network in list:
-            if network.get("networkId") == networkID:
-                return True
-        return None
+        return self.index.exists("trusted_network", networkID)
 
     def getSamlAttribute(self, id):
-        response = self.rest.get(
-            "/mgmtconfig/v1/admin/customers/%s/samlAttribute/%s"
-            % (self.customer_id, id),
-            fail_safe=True,
-        )
-        status_code = response.status_code
-        if status_code != 200:
-            return None
-        return True
+        return self.index.exists("saml_attribute", id)
 
     def getScimAttributeByID(self, id):
-        response = self.rest.get(
-            "/mgmtconfig/v1/admin/customers/%s/idp/scimattribute/%s"
-            % (self.customer_id, id),
-            fail_safe=True,
-        )
-        status_code = response.status_code
-        if status_code != 200:
-            return None
-        return True
+        return self.index.exists("scim_attribute", id)
 
     def getScimGroupByID(self, id):
-        response = self.rest.get(
-            "/userconfig/v1/customers/%s/scimgroup/%s" % (self.customer_id, id),
-            fail_safe=True,
-        )
-        status_code = response.status_code
-        if status_code != 200:
-            return None
-        return True
+        return self.index.exists("scim_group", id)
 
     def validateOperand(self, operand):
         objType = operand.get("objectType")
+        lhsExpected, rhsExpected = operandMessages(objType, self.POLICY_TYPE)
         if objType == "APP":
             return self.customValidate(
-                operand, ["id"], "application segment ID", self.getAppSegmentByID
+                operand, ["id"], rhsExpected, self.getAppSegmentByID
             )
         elif objType == "APP_GROUP":
             return self.customValidate(
-                operand, ["id"], "Segment Group ID", self.getSegmentGroupByID
+                operand, ["id"], rhsExpected, self.getSegmentGroupByID
             )
         elif objType == "IDP":
             return self.customValidate(
-                operand, ["id"], "IDP ID", self.getIDPControllerByID
+                operand, ["id"], rhsExpected, self.getIDPControllerByID
             )
         elif objType == "EDGE_CONNECTOR_GROUP":
             return self.customValidate(
                 operand,
                 ["id"],
-                "cloud connector group ID",
+                rhsExpected,
                 self.getCloudConnectorGroupByID,
             )
         elif objType == "CLIENT_TYPE":
             return self.customValidate(
                 operand,
                 ["id"],
-                "'zpn_client_type_zapp' or 'zpn_client_type_exporter' or 'zpn_client_type_ip_anchoring'"
-                + " or 'zpn_client_type_browser_isolation' or 'zpn_client_type_machine_tunnel' or 'zpn_client_type_edge_connector'",
+                rhsExpected,
                 self.validClientType,
             )
         elif objType == "MACHINE_GRP":
             return self.customValidate(
-                operand, ["id"], "machine group ID", self.getMachineGroupByID
+                operand, ["id"], rhsExpected, self.getMachineGroupByID
             )
         elif objType == "POSTURE":
             if operand.get("lhs") is None or operand.get("lhs") == "":
                 return self.lhsWarn(
                     operand.get("objectType"),
-                    "valid posture network ID",
+                    lhsExpected,
                     operand.get("lhs"),
                     None,
                 )
@@ -402,14 +267,14 @@ class PolicyAccessRuleService:
             if not resp:
                 return self.lhsWarn(
                     operand.get("objectType"),
-                    "valid posture network ID",
+                    lhsExpected,
                     operand.get("lhs"),
                     resp,
                 )
             if not operand.get("rhs") in ["true", "false"]:
                 return self.rhsWarn(
                     operand.get("objectType"),
-                    '"true"/"false"',
+                    rhsExpected,
                     operand.get("rhs"),
                     None,
                 )
@@ -418,7 +283,7 @@ class PolicyAccessRuleService:
             if operand.get("lhs") is None or operand.get("lhs") == "":
                 return self.lhsWarn(
                     operand.get("objectType"),
-                    "valid trusted network ID",
+                    lhsExpected,
                     operand.get("lhs"),
                     None,
                 )
@@ -426,20 +291,20 @@ class PolicyAccessRuleService:
             if not resp:
                 return self.lhsWarn(
                     operand.get("objectType"),
-                    "valid trusted network ID",
+                    lhsExpected,
                     operand.get("lhs"),
                     resp,
                 )
             if operand.get("rhs") != "true":
                 return self.rhsWarn(
-                    operand.get("objectType"), '"true"', operand.get("rhs"), None
+                    operand.get("objectType"), rhsExpected, operand.get("rhs"), None
                 )
             return True
         elif objType == "SAML":
             if operand.get("lhs") is None or operand.get("lhs") == "":
                 return self.lhsWarn(
                     operand.get("objectType"),
-                    "valid SAML Attribute ID",
+                    lhsExpected,
                     operand.get("lhs"),
                     None,
                 )
@@ -447,14 +312,14 @@ class PolicyAccessRuleService:
             if not resp:
                 return self.lhsWarn(
                     operand.get("objectType"),
-                    "valid SAML Attribute ID",
+                    lhsExpected,
                     operand.get("lhs"),
                     resp,
                 )
             if operand.get("rhs") is None or operand.get("rhs") == "":
                 return self.rhsWarn(
                     operand.get("objectType"),
-                    "SAML Attribute Value",
+                    rhsExpected,
                     operand.get("rhs"),
                     None,
                 )
@@ -463,7 +328,7 @@ class PolicyAccessRuleService:
             if operand.get("lhs") is None or operand.get("lhs") == "":
                 return self.lhsWarn(
                     operand.get("objectType"),
-                    "valid SCIM Attribute ID",
+                    lhsExpected,
                     operand.get("lhs"),
                     None,
                 )
@@ -471,14 +336,14 @@ class PolicyAccessRuleService:
             if not resp:
                 return self.lhsWarn(
                     operand.get("objectType"),
-                    "valid SCIM Attribute ID",
+                    lhsExpected,
                     operand.get("lhs"),
                     resp,
                 )
             if operand.get("rhs") is None or operand.get("rhs") == "":
                 return self.rhsWarn(
                     operand.get("objectType"),
-                    "SCIM Attribute Value",
+                    rhsExpected,
                     operand.get("rhs"),
                     None,
                 )
@@ -487,7 +352,7 @@ class PolicyAccessRuleService:
             if operand.get("lhs") is None or operand.get("lhs") == "":
                 return self.lhsWarn(
                     operand.get("objectType"),
-                    "valid IDP Controller ID",
+                    lhsExpected,
                     operand.get("lhs"),
                     None,
                 )
@@ -495,18 +360,18 @@ class PolicyAccessRuleService:
             if not resp:
                 return self.lhsWarn(
                     operand.get("objectType"),
-                    "valid IDP Controller ID",
+                    lhsExpected,
                     operand.get("lhs"),
                     resp,
                 )
             if operand.get("rhs") is None or operand.get("rhs") == "":
                 return self.rhsWarn(
-                    operand.get("objectType"), "SCIM Group ID", operand.get("rhs"), None
+                    operand.get("objectType"), rhsExpected, operand.get("rhs"), None
                 )
             resp = self.getScimGroupByID(operand.get("rhs"))
             if not resp:
                 return self.rhsWarn(
-                    operand.get("objectType"), "SCIM Group ID", operand.get("rhs"), resp
+                    operand.get("objectType"), rhsExpected, operand.get("rhs"), resp
                 )
             return True
         else:
@@ -514,24 +379,29 @@ class PolicyAccessRuleService:
                 operand.get("objectType")
             )
 
-    def validateConditions(self, conditions):
-        for condition in conditions:
-            for operand in condition.get("operands"):
-                check = self.validateOperand(operand)
-                if check is not True:
-                    return check
-        return True
-
-    def create(self, policy_rule, policy_set_id):
-        """Create new Policy rule"""
+    def validateConditions(self, conditions, offline=None):
+        """
+        True, or the warnings of every invalid operand; offline (default: the module's
+        validation option) only checks the shape of the operands
+        """
+        if offline is None:
+            offline = offlineValidation(self.module)
+        return validateRuleConditions(self, conditions, offline=offline)
+
+    def create(self, policy_rule, policy_set_id, validate=True):
+        """
+        Create new Policy rule; validate=False skips the validation of the conditions, for
+        callers that validated them beforehand
+        """
         ruleJson = self.mapAppToJSON(policy_rule)
-        check = self.validateConditions(
-            [] if ruleJson is None else ruleJson.get("conditions")
-        )
-        if check is not True:
-            self.module.fail_json(
-                msg="validating policy rule conditions failed: %s" % (check)
+        if validate:
+            check = self.validateConditions(
+                [] if ruleJson is None else ruleJson.get("conditions")
             )
+            if check is not True:
+                self.module.fail_json(
+                    msg="validating policy rule conditions failed: %s" % (check)
+                )
         response = self.rest.post(
             "/mgmtconfig/v1/admin/customers/%s/policySet/%s/rule"
             % (self.customer_id, policy_set_id),
@@ -540,7 +410,11 @@ class PolicyAccessRuleService:
         status_code = response.status_code
         if status_code > 299:
             return None
-        rule = self.getByID(response.json.get("id"), policy_set_id)
+        written = writtenObject(self.rest, response, ruleJson)
+        if written is not None:
+            rule = self.mapRespJSONToPolicy(written)
+        else:
+            rule = self.getByID(response.json.get("id"), policy_set_id)
         if (
             policy_rule.get("rule_order") is not None
             and policy_rule.get("rule_order") != ""
@@ -550,16 +424,20 @@ class PolicyAccessRuleService:
             )
         return rule
 
-    def update(self, policy_rule, policy_set_id):
-        """update the Policy rule"""
+    def update(self, policy_rule, policy_set_id, validate=True):
+        """
+        update the Policy rule; validate=False skips the validation of the conditions, for
+        callers that validated them beforehand
+        """
         ruleJson = self.mapAppToJSON(policy_rule)
-        check = self.validateConditions(
-            [] if ruleJson is None else ruleJson.get("conditions")
-        )
-        if check is not True:
-            self.module.fail_json(
-                msg="validating policy rule conditions failed: %s" % (check)
+        if validate:
+            check = self.validateConditions(
+                [] if ruleJson is None else ruleJson.get("conditions")
             )
+            if check is not True:
+                self.module.fail_json(
+                    msg="validating policy rule conditions failed: %s" % (check)
+                )
         response = self.rest.put(
             "/mgmtconfig/v1/admin/customers/%s/policySet/%s/rule/%s"
             % (self.customer_id, policy_set_id, ruleJson.get("id")),
@@ -568,7 +446,11 @@ class PolicyAccessRuleService:
         status_code = response.status_code
         if status_code > 299:
             return None
-        rule = self.getByID(ruleJson.get("id"), policy_set_id)
+        written = writtenObject(self.rest, response, ruleJson)
+        if written is not None:
+            rule = self.mapRespJSONToPolicy(written)
+        else:
+            rule = self.getByID(ruleJson.get("id"), policy_set_id)
         if (
             policy_rule.get("rule_order") is not None
             and policy_rule.get("rule_order") != ""
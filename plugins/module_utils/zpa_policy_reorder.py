@@ -0,0 +1,84 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from bisect import bisect_left
+
+
+def currentOrder(rules):
+    """rule IDs of a policy set sorted by their current rule order"""
+    return [
+        r.get("id")
+        for r in sorted(rules, key=lambda r: int(r.get("rule_order") or 0))
+        if r.get("id") is not None
+    ]
+
+
+def targetOrder(current, rule_orders):
+    """
+    full desired order of the rule IDs in current: rules listed in rule_orders
+    ({rule ID: 1-based order}) are pinned to their order (the next free slot when
+    it is taken or out of range), the others keep their relative order
+    """
+    n = len(current)
+    slots = [None] * n
+    known = set(current)
+    pinned = [
+        (int(order), i, rule_id)
+        for i, (rule_id, order) in enumerate(rule_orders.items())
+        if rule_id in known
+    ]
+    for order, dummy, rule_id in sorted(pinned):
+        pos = min(max(order - 1, 0), n - 1)
+        free = [p for p in range(pos, n) if slots[p] is None] or [
+            p for p in range(pos, -1, -1) if slots[p] is None
+        ]
+        slots[free[0]] = rule_id
+    placed = set(slots)
+    rest = iter(r for r in current if r not in placed)
+    return [s if s is not None else next(rest) for s in slots]
+
+
+def longestIncreasingSubsequence(seq):
+    """indexes into seq of one longest strictly increasing subsequence"""
+    tails = []
+    tail_idx = []
+    prev = [None] * len(seq)
+    for i, value in enumerate(seq):
+        pos = bisect_left(tails, value)
+        if pos == len(tails):
+            tails.append(value)
+            tail_idx.append(i)
+        else:
+            tails[pos] = value
+            tail_idx[pos] = i
+        prev[i] = tail_idx[pos - 1] if pos > 0 else None
+    result = []
+    i = tail_idx[-1] if tail_idx else None
+    while i is not None:
+        result.append(i)
+        i = prev[i]
+    return result[::-1]
+
+
+def planMoves(current, target):
+    """
+    minimal list of (rule ID, 1-based order) reorder calls turning current into
+    target, where each call moves one rule and shifts the rules in between.
+    The rules on a longest increasing subsequence of current (by target position)
+    stay put, every other rule is moved once, right after its target predecessor.
+    """
+    position = dict((rule_id, i) for i, rule_id in enumerate(target))
+    keep = set(
+        current[i] for i in longestIncreasingSubsequence([position[r] for r in current])
+    )
+    order = list(current)
+    moves = []
+    for i, rule_id in enumerate(target):
+        if rule_id in keep:
+            continue
+        order.remove(rule_id)
+        pos = order.index(target[i - 1]) + 1 if i > 0 else 0
+        order.insert(pos, rule_id)
+        moves.append((rule_id, pos + 1))
+    return moves
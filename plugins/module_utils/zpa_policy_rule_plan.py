@@ -0,0 +1,129 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_compare import (
+    isEquivalent,
+)
+
+# rule options compared and written, the state suboption only drives the plan
+RULE_PARAMS = [
+    "default_rule",
+    "description",
+    "policy_type",
+    "custom_msg",
+    "policy_set_id",
+    "id",
+    "lss_default_rule",
+    "action_id",
+    "name",
+    "app_connector_groups",
+    "action",
+    "priority",
+    "operator",
+    "rule_order",
+    "conditions",
+    "app_server_groups",
+]
+
+
+def hasRuleOrder(policy):
+    return policy.get("rule_order") is not None and policy.get("rule_order") != ""
+
+
+def ruleChanged(service, existing, policy):
+    """True when policy differs from the existing rule, rule order aside"""
+    desired = service.mapAppToJSON(policy)
+    current = service.mapAppToJSON(existing)
+    desired.pop("ruleOrder", None)
+    current.pop("ruleOrder", None)
+    return not isEquivalent(desired, current)
+
+
+def orderChanged(existing, policy):
+    """True when policy asks for a rule order the existing rule (if any) does not have"""
+    if not hasRuleOrder(policy):
+        return False
+    return existing is None or str(existing.get("rule_order")) != str(
+        policy.get("rule_order")
+    )
+
+
+def planRules(service, rules, existing_rules):
+    """
+    [(action, policy, existing rule)] for the desired rules (module form), in their
+    order. Rules are matched to existing_rules by id, then by name; action is
+    "create", "update", "delete" or None when the rule already matches. Rules
+    absent from the tenant and with state absent are left out.
+    Raises ValueError when a rule name is listed more than once.
+    """
+    by_id = dict((r.get("id"), r) for r in existing_rules)
+    by_name = dict((r.get("name"), r) for r in existing_rules)
+    seen = set()
+    plan = []
+    for rule in rules:
+        name = rule.get("name")
+        if name in seen:
+            raise ValueError("policy rule %s is listed more than once" % (name))
+        seen.add(name)
+        policy = dict((p, rule.get(p)) for p in RULE_PARAMS)
+        existing = by_id.get(rule.get("id")) if rule.get("id") else None
+        if existing is None:
+            existing = by_name.get(name)
+        if rule.get("state") == "absent":
+            if existing is not None:
+                plan.append(("delete", policy, existing))
+            continue
+        if existing is None:
+            plan.append(("create", policy, None))
+            continue
+        merged = dict(existing)
+        merged.update(policy)
+        merged["id"] = existing.get("id")
+        if ruleChanged(service, existing, merged):
+            plan.append(("update", merged, existing))
+        else:
+            plan.append((None, merged, existing))
+    return plan
+
+
+def plannedReorders(plan):
+    """indexes of the plan steps whose rule order has to be applied"""
+    return [
+        i
+        for i, (action, policy, existing) in enumerate(plan)
+        if action != "delete" and orderChanged(existing, policy)
+    ]
+
+
+def planSummary(plan):
+    """
+    (created, updated, deleted) rule names of a plan, the rules only moved to
+    another rule order count as updated
+    """
+    created = [p.get("name") for a, p, e in plan if a == "create"]
+    updated = [p.get("name") for a, p, e in plan if a == "update"]
+    updated += [plan[i][1].get("name") for i in plannedReorders(plan) if not plan[i][0]]
+    deleted = [p.get("name") for a, p, e in plan if a == "delete"]
+    return created, updated, deleted
+
+
+def failedSteps(plan, results):
+    """names of the rules whose planned write or delete has no result"""
+    return [
+        policy.get("name")
+        for (action, policy, existing), result in zip(plan, results)
+        if action is not None and result is None
+    ]
+
+
+def pinnedOrders(plan, results):
+    """
+    {rule ID: rule order} of every kept, created or updated rule asking for a
+    rule order, so that reordering the others does not displace them
+    """
+    return dict(
+        (result.get("id"), policy.get("rule_order"))
+        for (action, policy, existing), result in zip(plan, results)
+        if action != "delete" and hasRuleOrder(policy)
+    )
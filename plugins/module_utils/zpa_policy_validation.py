@@ -0,0 +1,311 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    env_int,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_schema import (
+    POLICY_CONDITION,
+)
+
+ID_OBJECT_TYPES = ("APP", "APP_GROUP", "IDP", "EDGE_CONNECTOR_GROUP", "MACHINE_GRP")
+
+ALL_CLIENT_TYPES = (
+    "zpn_client_type_zapp",
+    "zpn_client_type_exporter",
+    "zpn_client_type_ip_anchoring",
+    "zpn_client_type_browser_isolation",
+    "zpn_client_type_machine_tunnel",
+    "zpn_client_type_edge_connector",
+)
+
+# policy type: (operand object types, client types accepted by CLIENT_TYPE operands)
+POLICY_OPERAND_TYPES = {
+    "ACCESS_POLICY": (
+        ID_OBJECT_TYPES
+        + ("CLIENT_TYPE", "POSTURE", "TRUSTED_NETWORK", "SAML", "SCIM", "SCIM_GROUP"),
+        ALL_CLIENT_TYPES,
+    ),
+    "BYPASS_POLICY": (
+        ID_OBJECT_TYPES
+        + ("CLIENT_TYPE", "POSTURE", "TRUSTED_NETWORK", "SAML", "SCIM", "SCIM_GROUP"),
+        ALL_CLIENT_TYPES,
+    ),
+    "TIMEOUT_POLICY": (
+        (
+            "APP",
+            "APP_GROUP",
+            "IDP",
+            "CLIENT_TYPE",
+            "POSTURE",
+            "SAML",
+            "SCIM",
+            "SCIM_GROUP",
+        ),
+        (
+            "zpn_client_type_zapp",
+            "zpn_client_type_exporter",
+            "zpn_client_type_browser_isolation",
+        ),
+    ),
+}
+
+# object type: (expected LHS, expected RHS), the wording of the warnings of both
+# the API and the offline validation; CLIENT_TYPE lists the client types of the policy
+OPERAND_MESSAGES = {
+    "APP": ("id", "application segment ID"),
+    "APP_GROUP": ("id", "Segment Group ID"),
+    "IDP": ("id", "IDP ID"),
+    "EDGE_CONNECTOR_GROUP": ("id", "cloud connector group ID"),
+    "MACHINE_GRP": ("id", "machine group ID"),
+    "CLIENT_TYPE": ("id", None),
+    "POSTURE": ("valid posture profile ID", '"true"/"false"'),
+    "TRUSTED_NETWORK": ("valid trusted network ID", '"true"'),
+    "SAML": ("valid SAML Attribute ID", "SAML Attribute Value"),
+    "SCIM": ("valid SCIM Attribute ID", "SCIM Attribute Value"),
+    "SCIM_GROUP": ("valid IDP Controller ID", "SCIM Group ID"),
+}
+
+# object type: (accepted LHS values, accepted RHS values), None accepts any non
+# empty value
+OPERAND_SHAPES = {
+    "APP": (("id",), None),
+    "APP_GROUP": (("id",), None),
+    "IDP": (("id",), None),
+    "EDGE_CONNECTOR_GROUP": (("id",), None),
+    "MACHINE_GRP": (("id",), None),
+    "CLIENT_TYPE": (("id",), None),
+    "POSTURE": (None, ("true", "false")),
+    "TRUSTED_NETWORK": (None, ("true",)),
+    "SAML": (None, None),
+    "SCIM": (None, None),
+    "SCIM_GROUP": (None, None),
+}
+
+# operand object type: (kind referenced by lhs, kind referenced by rhs)
+OPERAND_REFERENCES = {
+    "APP": (None, "application"),
+    "APP_GROUP": (None, "segment_group"),
+    "IDP": (None, "idp"),
+    "EDGE_CONNECTOR_GROUP": (None, "cloud_connector_group"),
+    "MACHINE_GRP": (None, "machine_group"),
+    "POSTURE": ("posture", None),
+    "TRUSTED_NETWORK": ("trusted_network", None),
+    "SAML": ("saml_attribute", None),
+    "SCIM": ("scim_attribute", None),
+    "SCIM_GROUP": ("idp", "scim_group"),
+}
+
+# operand object type: kind referenced by rhs, among the objects of the IdP in lhs
+IDP_SCOPED_OPERANDS = {"SCIM_GROUP": "scim_group"}
+
+
+def rhsWarn(objType, expected, rhs, err):
+    return (
+        '[WARN] when operand object type is %s RHS must be an existing %s, value is "%s", %s\n'
+        % (objType, expected, rhs, err)
+    )
+
+
+def lhsWarn(objType, expected, lhs, err):
+    return (
+        '[WARN] when operand object type is %s LHS must be an existing %s value is "%s", %s\n'
+        % (objType, expected, lhs, err)
+    )
+
+
+def operandMessages(object_type, policy_type="ACCESS_POLICY"):
+    """(expected LHS, expected RHS) of the warnings about an operand of object_type"""
+    lhs_expected, rhs_expected = OPERAND_MESSAGES.get(object_type, (None, None))
+    if object_type == "CLIENT_TYPE":
+        rhs_expected = " or ".join(
+            "'%s'" % (value) for value in POLICY_OPERAND_TYPES[policy_type][1]
+        )
+    return lhs_expected, rhs_expected
+
+
+def operandShape(operand, policy_type="ACCESS_POLICY"):
+    """
+    True when an operand (API JSON form) is well formed for the policy type, without
+    looking up the objects it references, otherwise a warning
+    """
+    object_type = operand.get("objectType")
+    object_types, client_types = POLICY_OPERAND_TYPES[policy_type]
+    if object_type not in object_types:
+        return "[WARN] invalid operand object type %s\n" % (object_type)
+    lhs_values, rhs_values = OPERAND_SHAPES[object_type]
+    lhs_expected, rhs_expected = operandMessages(object_type, policy_type)
+    if object_type == "CLIENT_TYPE":
+        rhs_values = client_types
+    lhs = operand.get("lhs")
+    if not lhs or (lhs_values is not None and lhs not in lhs_values):
+        return lhsWarn(object_type, lhs_expected, lhs, None)
+    rhs = operand.get("rhs")
+    if not rhs or (rhs_values is not None and rhs not in rhs_values):
+        return rhsWarn(object_type, rhs_expected, rhs, None)
+    return True
+
+
+def validationWorkers():
+    """number of concurrent lookups used to validate operands (ZPA_VALIDATION_WORKERS)"""
+    return max(1, env_int("ZPA_VALIDATION_WORKERS", 8))
+
+
+def offlineValidation(module):
+    """True when the module asked for offline (shape only) validation"""
+    return module.params.get("validation") == "offline"
+
+
+def conditionsOperands(conditions):
+    for condition in conditions or []:
+        for operand in condition.get("operands") or []:
+            yield operand
+
+
+def operandReferences(operand):
+    """list of (kind, value) pairs an operand (API JSON form) refers to"""
+    refs = []
+    lhs_kind, rhs_kind = OPERAND_REFERENCES.get(operand.get("objectType"), (None, None))
+    if lhs_kind is not None and operand.get("lhs"):
+        refs.append((lhs_kind, str(operand.get("lhs"))))
+    if rhs_kind is not None and operand.get("rhs"):
+        refs.append((rhs_kind, str(operand.get("rhs"))))
+    return refs
+
+
+def conditionsReferences(conditions):
+    refs = []
+    for operand in conditionsOperands(conditions):
+        refs.extend(operandReferences(operand))
+    return refs
+
+
+def conditionsScopedReferences(conditions):
+    """list of (kind, IdP id, value) triples for the operands referring to objects of an IdP"""
+    refs = []
+    for operand in conditionsOperands(conditions):
+        kind = IDP_SCOPED_OPERANDS.get(operand.get("objectType"))
+        if kind is not None and operand.get("lhs") and operand.get("rhs"):
+            refs.append((kind, str(operand.get("lhs")), str(operand.get("rhs"))))
+    return refs
+
+
+def resolveConditions(index, conditions, max_workers=1):
+    """
+    resolve every object referenced by the operands of conditions in the ObjectIndex,
+    see ObjectIndex.resolve(). The SCIM groups of an IdP are checked against the
+    collection of the IdP instead of one GET each only when that collection is
+    known to take fewer requests; SCIM directories can span hundreds of pages.
+    """
+    values_by_scope = {}
+    for kind, idp_id, value in conditionsScopedReferences(conditions):
+        values_by_scope.setdefault((kind, idp_id), set()).add(value)
+    bulk = dict(
+        (scope, values)
+        for scope, values in values_by_scope.items()
+        if index.worthFetching(scope[0], len(values), scope[1])
+    )
+    skipped = set(
+        (kind, value) for (kind, dummy), values in bulk.items() for value in values
+    )
+    index.resolve(
+        [ref for ref in conditionsReferences(conditions) if ref not in skipped],
+        max_workers,
+    )
+    # the IdPs have been resolved with the other references
+    index.prefetch(scope for scope in bulk if index.exists("idp", scope[1]))
+    for (kind, idp_id), values in bulk.items():
+        for value in values:
+            index.exists(kind, value, scope=idp_id)
+
+
+def _joinErrors(errors):
+    if not errors:
+        return True
+    return "".join(error if error.endswith("\n") else error + "\n" for error in errors)
+
+
+def validateConditionsOffline(conditions, policy_type="ACCESS_POLICY"):
+    """
+    shape checks of every operand of conditions (API JSON form), without any API call.
+    Returns True, or the warnings of every malformed operand.
+    """
+    errors = []
+    for operand in conditionsOperands(conditions):
+        check = operandShape(operand, policy_type)
+        if check is not True:
+            errors.append(check)
+    return _joinErrors(errors)
+
+
+def validateRulesOffline(rules, policy_type="ACCESS_POLICY"):
+    """
+    validateConditionsOffline for rules in module form (snake_case, as written in
+    playbooks), e.g. to lint rule definitions in CI.
+    Returns {rule name: warnings} for the rules with malformed operands.
+    """
+    invalid = {}
+    for index, rule in enumerate(rules):
+        conditions = [
+            POLICY_CONDITION.toJSON(condition)
+            for condition in rule.get("conditions") or []
+        ]
+        check = validateConditionsOffline(conditions, policy_type)
+        if check is not True:
+            invalid[rule.get("name") or "#%d" % (index)] = check
+    return invalid
+
+
+def validateRulesConditions(service, rules_conditions, max_workers=None, offline=False):
+    """
+    validate every operand of the conditions (API JSON form) of several rules, one
+    list of conditions per rule. The shape of each operand is checked locally first;
+    unless offline, the objects referenced by the well formed operands of all the
+    rules are then resolved at once through the service's ObjectIndex, concurrently,
+    and checked with the rule service's validateOperand.
+    Returns one result per rule: True, or the warnings of every invalid operand.
+    """
+    operands = [list(conditionsOperands(conditions)) for conditions in rules_conditions]
+    checks = [
+        [operandShape(operand, service.POLICY_TYPE) for operand in rule_operands]
+        for rule_operands in operands
+    ]
+    if not offline:
+        valid = [
+            operand
+            for rule_operands, rule_checks in zip(operands, checks)
+            for operand, check in zip(rule_operands, rule_checks)
+            if check is True
+        ]
+        if max_workers is None:
+            max_workers = validationWorkers()
+        resolveConditions(service.index, [{"operands": valid}], max_workers)
+        checks = [
+            [
+                service.validateOperand(operand) if check is True else check
+                for operand, check in zip(rule_operands, rule_checks)
+            ]
+            for rule_operands, rule_checks in zip(operands, checks)
+        ]
+    return [
+        _joinErrors([check for check in rule_checks if check is not True])
+        for rule_checks in checks
+    ]
+
+
+def validateRuleConditions(service, conditions, max_workers=None, offline=False):
+    """
+    validate every operand of conditions (API JSON form), see validateRulesConditions.
+    Returns True, or the warnings of every invalid operand.
+    """
+    return validateRulesConditions(service, [conditions], max_workers, offline)[0]
+
+
+def failOnInvalidConditions(module, service, policy_rule):
+    """fail the module when the conditions of policy_rule (module form) are invalid"""
+    check = service.validateConditions(
+        service.mapAppToJSON(policy_rule).get("conditions") or []
+    )
+    if check is not True:
+        module.fail_json(msg="validating policy rule conditions failed: %s" % (check))
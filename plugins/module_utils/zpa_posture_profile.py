@@ -3,8 +3,11 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     delete_none,
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_object_index import (
+    sharedIndex,
 )
 
 
@@ -12,7 +15,8 @@ class PostureProfileService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
+        self.index = sharedIndex(self.rest, customer_id)
 
     def getByIDOrName(self, id, name):
         posture = None
@@ -32,21 +36,34 @@ class PostureProfileService:
         return self.mapRespJSONToApp(response.json)
 
     def getAll(self):
-        list = self.rest.get_paginated_data(
-            base_url="/mgmtconfig/v2/admin/customers/%s/posture" % (self.customer_id),
-            data_key_name="list",
-        )
+        # also refreshes the index shared with the policy rule validation
+        list = self.index.all("posture")
         postures = []
         for posture in list:
             postures.append(self.mapRespJSONToApp(posture))
         return postures
 
+    def iter_all(self):
+        for posture in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v2/admin/customers/%s/posture" % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(posture)
+
+    def getByUDID(self, udid):
+        posture = self.index.get("posture", "postureUdid", udid)
+        if posture is None:
+            return None
+        return self.getByID(posture.get("id"))
+
     def getByName(self, name):
-        postures = self.getAll()
-        for posture in postures:
-            if posture.get("name") == name:
-                return posture
-        return None
+        posture = self.rest.find_by_name(
+            base_url="/mgmtconfig/v2/admin/customers/%s/posture" % (self.customer_id),
+            name=name,
+        )
+        if posture is None:
+            return None
+        return self.mapRespJSONToApp(posture)
 
     @delete_none
     def mapRespJSONToApp(self, resp_json):
@@ -5,8 +5,9 @@ __metaclass__ = type
 import re
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     delete_none,
+    sharedClient,
+    writtenObject,
 )
 
 
@@ -14,7 +15,7 @@ class ProvisioningKeyService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
         self.association_types = ["CONNECTOR_GRP", "SERVICE_EDGE_GRP"]
 
     def getByIDOrName(self, id, name, association_type):
@@ -60,12 +61,23 @@ class ProvisioningKeyService:
                 return pro_key
             return None
 
+    def iter_all(self, association_type):
+        for provisioning_key in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/associationType/%s/provisioningKey"
+            % (self.customer_id, association_type),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(provisioning_key)
+
     def getByName(self, name, association_type):
-        provisioning_keys = self.getAll(association_type)
-        for provisioning_key in provisioning_keys:
-            if provisioning_key.get("name") == name:
-                return provisioning_key
-        return None
+        provisioning_key = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/associationType/%s/provisioningKey"
+            % (self.customer_id, association_type),
+            name=name,
+        )
+        if provisioning_key is None:
+            return None
+        return self.mapRespJSONToApp(provisioning_key)
 
     @delete_none
     def mapRespJSONToApp(self, resp_json):
@@ -128,6 +140,11 @@ class ProvisioningKeyService:
         status_code = response.status_code
         if status_code > 299:
             return None
+        written = writtenObject(
+            self.rest, response, provisioningKeyJson, required=("id", "provisioningKey")
+        )
+        if written is not None:
+            return self.mapRespJSONToApp(written)
         return self.getByID(response.json.get("id"), association_type)
 
     def update(self, provisioning_key, association_type):
@@ -141,6 +158,11 @@ class ProvisioningKeyService:
         status_code = response.status_code
         if status_code > 299:
             return None
+        written = writtenObject(
+            self.rest, response, provisioningKeyJson, required=("id", "provisioningKey")
+        )
+        if written is not None:
+            return self.mapRespJSONToApp(written)
         return self.getByID(provisioningKeyJson.get("id"), association_type)
 
     def delete(self, id, association_type):
@@ -0,0 +1,189 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import fcntl
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from email.utils import parsedate_tz, mktime_tz
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_cache_utils import (
+    default_cache_dir,
+    read_json,
+    write_json_atomic,
+)
+
+# per tenant quotas enforced by ZPA: bucket -> (requests, per seconds)
+DEFAULT_LIMITS = {
+    "read": (20, 10.0),
+    "write": (10, 10.0),
+}
+
+REMAINING_HEADERS = ("x-ratelimit-remaining", "ratelimit-remaining")
+RESET_HEADERS = ("x-ratelimit-reset", "ratelimit-reset")
+
+# values above this are epoch timestamps rather than a number of seconds
+EPOCH_THRESHOLD = 10**9
+
+
+def bucketFor(method):
+    return "read" if method in ("GET", "HEAD") else "write"
+
+
+def _header(headers, names):
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+    return None
+
+
+def _seconds(value, now):
+    """number of seconds from now described by a header value, None if not parseable"""
+    if value is None:
+        return None
+    value = str(value).strip()
+    match = re.match(r"^(\d+(?:\.\d+)?)\s*(s|sec|secs|seconds?)?$", value, re.I)
+    if match:
+        seconds = float(match.group(1))
+        if seconds > EPOCH_THRESHOLD:
+            seconds -= now
+        return max(seconds, 0.0)
+    parsed = parsedate_tz(value)
+    if parsed is not None:
+        return max(mktime_tz(parsed) - now, 0.0)
+    return None
+
+
+def retryAfter(headers, now=None):
+    """seconds to wait according to the Retry-After header, None when absent"""
+    if not headers:
+        return None
+    return _seconds(headers.get("retry-after"), time.time() if now is None else now)
+
+
+class RateLimiter:
+    """
+    Client-side token buckets pacing requests below the tenant quotas, one bucket
+    for GETs and one for writes. The bucket state lives in a file under the cache
+    directory, updated under an exclusive lock, so every fork and every module
+    execution on the controller draws from the same buckets. Retry-After and
+    rate-limit response headers drain the buckets and block them until the
+    advertised reset. Falls back to per-process buckets when the directory is not
+    writable.
+    """
+
+    def __init__(self, key, limits=None, cache_dir=None, clock=None, sleep=None):
+        self.limits = limits or DEFAULT_LIMITS
+        self.cache_dir = cache_dir or default_cache_dir()
+        self.path = os.path.join(self.cache_dir, "ratelimit-%s.json" % key)
+        self.lock_path = self.path + ".lock"
+        self.clock = clock or time.time
+        self.sleep = sleep or time.sleep
+        self.shared = True
+        self._local_state = {}
+        self._local_lock = threading.Lock()
+
+    def _open_lock(self):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, mode=0o700)
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        fcntl.flock(fd, fcntl.LOCK_EX)
+        return fd
+
+    @contextmanager
+    def _state(self):
+        """bucket state, loaded and saved back under the lock"""
+        fd = None
+        if self.shared:
+            try:
+                fd = self._open_lock()
+            except (IOError, OSError):
+                self.shared = False
+        if fd is None:
+            with self._local_lock:
+                yield self._local_state
+            return
+        try:
+            state = read_json(self.path)
+            if not isinstance(state, dict):
+                state = {}
+            yield state
+            try:
+                write_json_atomic(self.path, state)
+            except (IOError, OSError):
+                self.shared = False
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
+
+    def _bucket(self, state, name, now):
+        capacity, interval = self.limits[name]
+        bucket = state.get(name)
+        if not isinstance(bucket, dict):
+            bucket = {"tokens": float(capacity), "updated": now, "blocked_until": 0}
+            state[name] = bucket
+        elapsed = max(now - float(bucket.get("updated", now)), 0.0)
+        bucket["tokens"] = min(
+            float(capacity),
+            float(bucket.get("tokens", capacity)) + elapsed * capacity / interval,
+        )
+        bucket["updated"] = now
+        return bucket
+
+    def acquire(self, method):
+        """wait until a request of this method may be sent, returns the seconds waited"""
+        name = bucketFor(method)
+        capacity, interval = self.limits[name]
+        waited = 0.0
+        while True:
+            with self._state() as state:
+                now = self.clock()
+                bucket = self._bucket(state, name, now)
+                wait = float(bucket.get("blocked_until", 0)) - now
+                if wait <= 0:
+                    if bucket.get("blocked_until"):
+                        # the advertised reset has passed, the quota is available again
+                        bucket["tokens"] = max(bucket["tokens"], 1.0)
+                        bucket["blocked_until"] = 0
+                    if bucket["tokens"] >= 1:
+                        bucket["tokens"] -= 1
+                        return waited
+                    wait = (1 - bucket["tokens"]) * interval / capacity
+            self.sleep(wait)
+            waited += wait
+
+    def update(self, method, status_code, headers):
+        """feed back the rate-limit information of a response"""
+        headers = headers or {}
+        now = self.clock()
+        retry_after = retryAfter(headers, now)
+        remaining = _header(headers, REMAINING_HEADERS)
+        reset = _seconds(_header(headers, RESET_HEADERS), now)
+        if status_code != 429 and retry_after is None and remaining is None:
+            return
+        try:
+            remaining = int(remaining) if remaining is not None else None
+        except ValueError:
+            remaining = None
+        name = bucketFor(method)
+        capacity, interval = self.limits[name]
+        blocked_until = 0
+        if retry_after is not None and status_code in (429, 503):
+            blocked_until = now + retry_after
+        elif status_code == 429:
+            blocked_until = now + (reset if reset is not None else interval / capacity)
+        elif remaining == 0 and reset is not None:
+            blocked_until = now + reset
+        with self._state() as state:
+            bucket = self._bucket(state, name, now)
+            if remaining is not None:
+                bucket["tokens"] = min(bucket["tokens"], float(remaining))
+            if status_code == 429:
+                bucket["tokens"] = 0.0
+            bucket["blocked_until"] = max(
+                float(bucket.get("blocked_until", 0)), blocked_until
+            )
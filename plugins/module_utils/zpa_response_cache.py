@@ -0,0 +1,148 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import re
+import time
+
+from ansible.module_utils._text import to_bytes, to_text
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_cache_utils import (
+    cache_key,
+    default_cache_dir,
+    read_json,
+    write_json_atomic,
+)
+
+# resource classes, the first matching pattern wins; anything else is "config"
+RESOURCE_CLASSES = [
+    ("static", re.compile(r"/lssConfig/(clientTypes|statusCodes|logType/formats)")),
+    (
+        "reference",
+        re.compile(
+            r"/(idp|samlAttribute|scimattribute|scimgroup|posture|network|machineGroup"
+            r"|cloudConnectorGroup|enrollmentCert|clientlessCertificate"
+            r"|visible/versionProfiles)(/|\?|$)"
+        ),
+    ),
+]
+
+# seconds a cached response stays valid, per resource class
+DEFAULT_TTLS = {"static": 86400, "reference": 900, "config": 60}
+
+# a write to the key resource also changes what is returned for these resources
+RELATED_RESOURCES = {
+    "application": ("segmentGroup", "serverGroup"),
+    "segmentGroup": ("application",),
+    "serverGroup": ("application", "appConnectorGroup"),
+    "server": ("serverGroup",),
+    "appConnectorGroup": ("serverGroup", "connector", "associationType"),
+    "connector": ("appConnectorGroup",),
+    "serviceEdgeGroup": ("associationType",),
+}
+
+CUSTOMER_RESOURCE = re.compile(r"/customers/[^/]+/([^/?]+)")
+ADMIN_RESOURCE = re.compile(r"/admin/([^/?]+)")
+
+
+def resourceOf(path):
+    """first path segment after the customer (or admin) part, e.g. application"""
+    match = CUSTOMER_RESOURCE.search(path) or ADMIN_RESOURCE.search(path)
+    if match is None:
+        return "other"
+    return match.group(1)
+
+
+def resourceClass(path):
+    for name, pattern in RESOURCE_CLASSES:
+        if pattern.search(path):
+            return name
+    return "config"
+
+
+def parseTTLs(value):
+    """DEFAULT_TTLS updated from a "static=86400,config=30" string"""
+    ttls = dict(DEFAULT_TTLS)
+    for item in (value or "").split(","):
+        name, sep, seconds = item.partition("=")
+        name = name.strip()
+        if sep and name in ttls:
+            try:
+                ttls[name] = int(seconds)
+            except ValueError:
+                pass
+    return ttls
+
+
+class ResponseCache:
+    """
+    Controller-side cache of successful GET responses, keyed by customer, base URL
+    and request path (query included), shared by every task and fork through files
+    under ZPA_CACHE_DIR. Entries expire after the TTL of their resource class
+    (ZPA_RESPONSE_CACHE_TTL overrides DEFAULT_TTLS); a write to a resource drops the
+    cached entries of that resource and of the resources embedding it.
+    """
+
+    def __init__(self, customer_id, baseurl, ttls=None, cache_dir=None, clock=None):
+        if ttls is None:
+            ttls = parseTTLs(os.environ.get("ZPA_RESPONSE_CACHE_TTL"))
+        self.ttls = ttls
+        self.clock = clock or time.time
+        self.path = os.path.join(
+            cache_dir or default_cache_dir(),
+            "responses-%s" % cache_key(customer_id, baseurl),
+        )
+
+    def _entry_path(self, path):
+        return os.path.join(
+            self.path, "%s-%s.json" % (resourceOf(path), cache_key(path))
+        )
+
+    def get(self, path):
+        """(status, body) cached for path, or None"""
+        entry_path = self._entry_path(path)
+        entry = read_json(entry_path)
+        if not isinstance(entry, dict) or entry.get("path") != path:
+            return None
+        if self.clock() >= entry.get("expires", 0):
+            self._remove(entry_path)
+            return None
+        return entry.get("status"), to_bytes(entry.get("body", ""))
+
+    def put(self, path, status, body):
+        ttl = self.ttls.get(resourceClass(path), 0)
+        if ttl <= 0 or status != 200 or not body:
+            return
+        try:
+            write_json_atomic(
+                self._entry_path(path),
+                {
+                    "path": path,
+                    "expires": self.clock() + ttl,
+                    "status": status,
+                    "body": to_text(body, errors="surrogate_or_strict"),
+                },
+            )
+        except (IOError, OSError):
+            # caching is best effort, an unwritable directory only costs requests
+            pass
+
+    def invalidate(self, path):
+        """drop the entries a write to path may have made stale"""
+        resource = resourceOf(path)
+        prefixes = tuple(
+            "%s-" % name for name in (resource,) + RELATED_RESOURCES.get(resource, ())
+        )
+        try:
+            names = os.listdir(self.path)
+        except (IOError, OSError):
+            return
+        for name in names:
+            if name.startswith(prefixes):
+                self._remove(os.path.join(self.path, name))
+
+    def _remove(self, entry_path):
+        try:
+            os.remove(entry_path)
+        except (IOError, OSError):
+            pass
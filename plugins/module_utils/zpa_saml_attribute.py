@@ -3,8 +3,8 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     delete_none,
+    sharedClient,
 )
 
 
@@ -12,7 +12,7 @@ class SamlAttributeService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
 
     def getByIDOrName(self, id, name):
         samlAttribute = None
@@ -43,12 +43,23 @@ class SamlAttributeService:
             samlAttributes.append(self.mapRespJSONToApp(samlAttribute))
         return samlAttributes
 
+    def iter_all(self):
+        for samlAttribute in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v2/admin/customers/%s/samlAttribute"
+            % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(samlAttribute)
+
     def getByName(self, name):
-        samlAttributes = self.getAll()
-        for samlAttribute in samlAttributes:
-            if samlAttribute.get("name") == name:
-                return samlAttribute
-        return None
+        samlAttribute = self.rest.find_by_name(
+            base_url="/mgmtconfig/v2/admin/customers/%s/samlAttribute"
+            % (self.customer_id),
+            name=name,
+        )
+        if samlAttribute is None:
+            return None
+        return self.mapRespJSONToApp(samlAttribute)
 
     @delete_none
     def mapRespJSONToApp(self, resp_json):
@@ -0,0 +1,166 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    camelCaseKey,
+    snakeCaseKey,
+)
+
+# field kinds
+VALUE = "value"
+# list of objects whose keys are translated, in both directions
+ENTITIES = "entities"
+# list of referenced objects: translated from the API, sent back as [{"id": ...}]
+REFERENCES = "references"
+
+CONTAINERS = (dict, list, tuple, set)
+
+
+def pruneNone(value):
+    """copy of value without None dict values or None items, at any depth"""
+    if isinstance(value, dict):
+        return {
+            k: pruneNone(v) if type(v) in CONTAINERS else v
+            for k, v in value.items()
+            if v is not None and k is not None
+        }
+    if isinstance(value, (list, tuple, set)):
+        return type(value)(
+            pruneNone(v) if type(v) in CONTAINERS else v for v in value if v is not None
+        )
+    return value
+
+
+def _entities(convert_key):
+    def convert(items):
+        if items is None:
+            return []
+        return [
+            {
+                convert_key(k): pruneNone(v) if type(v) in CONTAINERS else v
+                for k, v in item.items()
+                if v is not None
+            }
+            for item in items
+        ]
+
+    return convert
+
+
+def _references(items):
+    if items is None:
+        return []
+    refs = []
+    for item in items:
+        id = item.get("id")
+        refs.append({"id": id} if id is not None else {})
+    return refs
+
+
+def _nested(convert):
+    def convertList(items):
+        if items is None:
+            return []
+        return [convert(item) for item in items]
+
+    return convertList
+
+
+def _build(obj, plan):
+    result = {}
+    get = obj.get
+    for src, dst, convert in plan:
+        value = get(src)
+        if convert is not None:
+            value = convert(value)
+        elif value is None:
+            continue
+        elif type(value) in CONTAINERS:
+            value = pruneNone(value)
+        result[dst] = value
+    return result
+
+
+class Field:
+    """
+    One attribute of a resource: name is the module (snake_case) name, key the API
+    (camelCase) name, derived from name when omitted. kind is VALUE, ENTITIES or
+    REFERENCES, or a list of nested objects described by schema. Fields computed by
+    the API are declared with write=False, fields the API does not return with
+    read=False.
+    """
+
+    def __init__(self, name, key=None, kind=VALUE, schema=None, read=True, write=True):
+        self.name = name
+        self.key = key or camelCaseKey(name)
+        self.kind = kind
+        self.schema = schema
+        self.read = read
+        self.write = write
+
+    def converter(self, reading):
+        if self.schema is not None:
+            if reading:
+                return _nested(self.schema.fromJSON)
+            return _nested(self.schema.toJSON)
+        if self.kind == ENTITIES:
+            return _entities(snakeCaseKey if reading else camelCaseKey)
+        if self.kind == REFERENCES:
+            return _entities(snakeCaseKey) if reading else _references
+        return None
+
+
+class Schema:
+    """
+    Declarative mapping between an API object and the module representation of a
+    resource. Both converters are planned once, skip None values while building the
+    result (the output matches the former hand-written mappers followed by
+    deleteNone) and never modify their input.
+    """
+
+    def __init__(self, *fields):
+        self.fields = fields
+        self.readPlan = tuple(
+            (f.key, f.name, f.converter(True)) for f in fields if f.read
+        )
+        self.writePlan = tuple(
+            (f.name, f.key, f.converter(False)) for f in fields if f.write
+        )
+
+    def fromJSON(self, resp_json):
+        """module representation of an API object"""
+        if resp_json is None:
+            return {}
+        return _build(resp_json, self.readPlan)
+
+    def toJSON(self, obj):
+        """API object for a module representation"""
+        if obj is None:
+            return {}
+        return _build(obj, self.writePlan)
+
+
+# conditions shared by the policy rule services
+POLICY_OPERAND = Schema(
+    Field("id", write=False),
+    Field("creation_time", write=False),
+    Field("modified_by", write=False),
+    Field("object_type"),
+    Field("lhs"),
+    Field("rhs"),
+    Field("name"),
+    # read back as well (the former mapper dropped it) so that operands set with an
+    # idp_id compare equal to the rule ZPA returns
+    Field("idp_id"),
+)
+
+POLICY_CONDITION = Schema(
+    Field("id", write=False),
+    Field("modified_time", write=False),
+    Field("creation_time", write=False),
+    Field("modified_by", write=False),
+    Field("operator"),
+    Field("negated"),
+    Field("operands", schema=POLICY_OPERAND),
+)
@@ -3,8 +3,11 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     delete_none,
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_object_index import (
+    sharedIndex,
 )
 
 
@@ -12,7 +15,8 @@ class ScimAttributeHeaderService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
+        self.index = sharedIndex(self.rest, customer_id)
 
     def getByIDOrName(self, attribute_id, name):
         scimAttribute = None
@@ -43,11 +47,10 @@ class ScimAttributeHeaderService:
         return list
 
     def getIDPByName(self, idpName):
-        idps = self.getAllIDPControllersRaw()
-        for idp in idps:
-            if idp.get("name") == idpName:
-                return idp
-        return None
+        return self.rest.find_by_name(
+            base_url="/mgmtconfig/v2/admin/customers/%s/idp" % (self.customer_id),
+            name=idpName,
+        )
 
     def getAllByIDPName(self, idpName):
         idp = self.getIDPByName(idpName)
@@ -63,12 +66,34 @@ class ScimAttributeHeaderService:
             scimAttributes.append(self.mapRespJSONToApp(scimAttribute))
         return scimAttributes
 
+    def iter_all(self, idp_id):
+        for scimAttribute in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/idp/%s/scimattribute"
+            % (self.customer_id, idp_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(scimAttribute)
+
     def getByName(self, name, idpName):
-        samlAttributes = self.getAllByIDPName(idpName)
-        for samlAttribute in samlAttributes:
-            if samlAttribute.get("name") == name:
-                return samlAttribute
-        return None
+        idp = self.getIDPByName(idpName)
+        if idp is None or idp.get("id") is None:
+            return None
+        scimAttribute = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/idp/%s/scimattribute"
+            % (self.customer_id, idp.get("id")),
+            name=name,
+        )
+        if scimAttribute is None:
+            return None
+        return self.mapRespJSONToApp(scimAttribute)
+
+    def getByNames(self, names, idpName):
+        """{name: attribute} of the named SCIM attributes of an IdP, found in one pass"""
+        idp_id = self.index.idpID(idpName)
+        if idp_id is None:
+            return {}
+        found = self.index.items("scim_attribute", "name", names, scope=idp_id)
+        return dict((name, self.mapRespJSONToApp(item)) for name, item in found.items())
 
     @delete_none
     def mapRespJSONToApp(self, resp_json):
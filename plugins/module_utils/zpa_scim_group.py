@@ -3,8 +3,11 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     delete_none,
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_object_index import (
+    sharedIndex,
 )
 
 
@@ -12,7 +15,8 @@ class ScimGroupService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
+        self.index = sharedIndex(self.rest, customer_id)
 
     def getByIDOrName(self, id, name, idpName):
         group = None
@@ -39,11 +43,10 @@ class ScimGroupService:
         return list
 
     def getIDPByName(self, idpName):
-        idps = self.getAllIDPControllersRaw()
-        for idp in idps:
-            if idp.get("name") == idpName:
-                return idp
-        return None
+        return self.rest.find_by_name(
+            base_url="/mgmtconfig/v2/admin/customers/%s/idp" % (self.customer_id),
+            name=idpName,
+        )
 
     def getAllByIDPName(self, idpName):
         idp = self.getIDPByName(idpName)
@@ -62,12 +65,34 @@ class ScimGroupService:
             groups.append(self.mapRespJSONToApp(group))
         return groups
 
+    def iter_all(self, idp_id):
+        for group in self.rest.iter_paginated_data(
+            base_url="/userconfig/v1/customers/%s/scimgroup/idpId/%s"
+            % (self.customer_id, idp_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(group)
+
     def getByName(self, name, idpName):
-        groups = self.getAllByIDPName(idpName)
-        for group in groups:
-            if group.get("name") == name:
-                return group
-        return None
+        idp = self.getIDPByName(idpName)
+        if idp is None:
+            return None
+        group = self.rest.find_by_name(
+            base_url="/userconfig/v1/customers/%s/scimgroup/idpId/%s"
+            % (self.customer_id, idp.get("id")),
+            name=name,
+        )
+        if group is None:
+            return None
+        return self.mapRespJSONToApp(group)
+
+    def getByNames(self, names, idpName):
+        """{name: group} of the named SCIM groups of an IdP, found in one pass"""
+        idp_id = self.index.idpID(idpName)
+        if idp_id is None:
+            return {}
+        found = self.index.items("scim_group", "name", names, scope=idp_id)
+        return dict((name, self.mapRespJSONToApp(item)) for name, item in found.items())
 
     @delete_none
     def mapRespJSONToApp(self, resp_json):
@@ -7,6 +7,7 @@ import re
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     camelcaseToSnakeCase,
     delete_none,
+    writtenObject,
 )
 
 
@@ -44,12 +45,23 @@ class SegmentGroupService:
             segment_groups.append(self.mapRespJSONToApp(segment_group))
         return segment_groups
 
+    def iter_all(self):
+        for segment_group in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/segmentGroup"
+            % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(segment_group)
+
     def getByName(self, name):
-        segment_groups = self.getAll()
-        for segment_group in segment_groups:
-            if segment_group.get("name") == name:
-                return segment_group
-        return None
+        segment_group = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/segmentGroup"
+            % (self.customer_id),
+            name=name,
+        )
+        if segment_group is None:
+            return None
+        return self.mapRespJSONToApp(segment_group)
 
     def mapListJSONToList(self, entities):
         if entities is None:
@@ -109,6 +121,9 @@ class SegmentGroupService:
         status_code = response.status_code
         if status_code > 299:
             return None
+        written = writtenObject(self.rest, response, segmentGroupJson)
+        if written is not None:
+            return self.mapRespJSONToApp(written)
         return self.getByID(response.json.get("id"))
 
     def update(self, segment_group):
@@ -122,6 +137,9 @@ class SegmentGroupService:
         status_code = response.status_code
         if status_code > 299:
             return None
+        written = writtenObject(self.rest, response, segmentGroupJson)
+        if written is not None:
+            return self.mapRespJSONToApp(written)
         return self.getByID(segmentGroupJson.get("id"))
 
     def delete(self, id):
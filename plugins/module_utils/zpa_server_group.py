@@ -7,6 +7,7 @@ import re
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     camelcaseToSnakeCase,
     delete_none,
+    writtenObject,
 )
 
 
@@ -44,12 +45,23 @@ class ServerGroupService:
             server_groups.append(self.mapRespJSONToApp(server_group))
         return server_groups
 
+    def iter_all(self):
+        for server_group in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/serverGroup"
+            % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(server_group)
+
     def getByName(self, name):
-        server_groups = self.getAll()
-        for server_group in server_groups:
-            if server_group.get("name") == name:
-                return server_group
-        return None
+        server_group = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/serverGroup"
+            % (self.customer_id),
+            name=name,
+        )
+        if server_group is None:
+            return None
+        return self.mapRespJSONToApp(server_group)
 
     def mapListJSONToList(self, entities):
         if entities is None:
@@ -115,6 +127,9 @@ class ServerGroupService:
         status_code = response.status_code
         if status_code > 299:
             return None
+        written = writtenObject(self.rest, response, serverGroupJson)
+        if written is not None:
+            return self.mapRespJSONToApp(written)
         return self.getByID(response.json.get("id"))
 
     def update(self, server_group):
@@ -128,6 +143,9 @@ class ServerGroupService:
         status_code = response.status_code
         if status_code > 299:
             return None
+        written = writtenObject(self.rest, response, serverGroupJson)
+        if written is not None:
+            return self.mapRespJSONToApp(written)
         return self.getByID(serverGroupJson.get("id"))
 
     def delete(self, id):
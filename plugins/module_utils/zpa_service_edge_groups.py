@@ -5,17 +5,42 @@ __metaclass__ = type
 import re
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
-    camelcaseToSnakeCase,
-    delete_none,
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_schema import (
+    REFERENCES,
+    Field,
+    Schema,
+)
+
+SERVICE_EDGE_GROUP = Schema(
+    Field("city_country"),
+    Field("country_code"),
+    Field("description"),
+    Field("enabled"),
+    Field("geolocation_id", "geoLocationId"),
+    Field("id"),
+    Field("is_public"),
+    Field("latitude"),
+    Field("location"),
+    Field("longitude"),
+    Field("name"),
+    Field("override_version_profile"),
+    Field("upgrade_day"),
+    Field("upgrade_time_in_secs"),
+    Field("version_profile_id"),
+    Field("version_profile_name", write=False),
+    Field("version_profile_visibility_scope"),
+    Field("service_edges", kind=REFERENCES),
+    Field("trusted_networks", kind=REFERENCES),
 )
 
 
 class ServiceEdgeGroupService:
-    def __init__(self, module, customer_id):
+    def __init__(self, module, customer_id, rest=None):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = rest or sharedClient(module)
 
     def getByIDOrName(self, id, name):
         app = None
@@ -46,111 +71,29 @@ class ServiceEdgeGroupService:
             apps.append(self.mapRespJSONToApp(app))
         return apps
 
+    def iter_all(self):
+        for app in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v1/admin/customers/%s/serviceEdgeGroup"
+            % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(app)
+
     def getByName(self, name):
-        apps = self.getAll()
-        for app in apps:
-            if app.get("name") == name:
-                return app
-        return None
-
-    def mapServiceEdgesJSONToList(self, serviceEdges):
-        if serviceEdges is None:
-            return []
-        l = []
-        for s in serviceEdges:
-            d = camelcaseToSnakeCase(s)
-            l.append(d)
-        return l
-
-    def mapServiceEdgesListToJSON(self, serviceEdges):
-        if serviceEdges is None:
-            return []
-        l = []
-        for s in serviceEdges:
-            d = dict(id=s.get("id"))
-            l.append(d)
-        return l
-
-    def mapTrustedNetworksJSONToList(self, trustedNetworks):
-        if trustedNetworks is None:
-            return []
-        l = []
-        for app in trustedNetworks:
-            d = camelcaseToSnakeCase(app)
-            l.append(d)
-        return l
-
-    def mapTrustedNetworksListToJSON(self, trustedNetworks):
-        if trustedNetworks is None:
-            return []
-        l = []
-        for s in trustedNetworks:
-            d = dict(id=s.get("id"))
-            l.append(d)
-        return l
-
-    @delete_none
+        app = self.rest.find_by_name(
+            base_url="/mgmtconfig/v1/admin/customers/%s/serviceEdgeGroup"
+            % (self.customer_id),
+            name=name,
+        )
+        if app is None:
+            return None
+        return self.mapRespJSONToApp(app)
+
     def mapRespJSONToApp(self, resp_json):
-        if resp_json is None:
-            return {}
-        return {
-            "city_country": resp_json.get("cityCountry"),
-            "country_code": resp_json.get("countryCode"),
-            "description": resp_json.get("description"),
-            "enabled": resp_json.get("enabled"),
-            "geolocation_id": resp_json.get("geoLocationId"),
-            "id": resp_json.get("id"),
-            "is_public": resp_json.get("isPublic"),
-            "latitude": resp_json.get("latitude"),
-            "location": resp_json.get("location"),
-            "longitude": resp_json.get("longitude"),
-            "name": resp_json.get("name"),
-            "override_version_profile": resp_json.get("overrideVersionProfile"),
-            "upgrade_day": resp_json.get("upgradeDay"),
-            "upgrade_time_in_secs": resp_json.get("upgradeTimeInSecs"),
-            "version_profile_id": resp_json.get("versionProfileId"),
-            "version_profile_name": resp_json.get("versionProfileName"),
-            "version_profile_visibility_scope": resp_json.get(
-                "versionProfileVisibilityScope"
-            ),
-            "service_edges": self.mapServiceEdgesJSONToList(
-                resp_json.get("serviceEdges")
-            ),
-            "trusted_networks": self.mapTrustedNetworksJSONToList(
-                resp_json.get("trustedNetworks")
-            ),
-        }
-
-    @delete_none
+        return SERVICE_EDGE_GROUP.fromJSON(resp_json)
+
     def mapAppToJSON(self, serviceEdge):
-        if serviceEdge is None:
-            return {}
-        return {
-            "cityCountry": serviceEdge.get("city_country"),
-            "countryCode": serviceEdge.get("country_code"),
-            "description": serviceEdge.get("description"),
-            "enabled": serviceEdge.get("enabled"),
-            "geoLocationId": serviceEdge.get("geolocation_id"),
-            "id": serviceEdge.get("id"),
-            "isPublic": serviceEdge.get("is_public"),
-            "latitude": serviceEdge.get("latitude"),
-            "location": serviceEdge.get("location"),
-            "longitude": serviceEdge.get("longitude"),
-            "name": serviceEdge.get("name"),
-            "overrideVersionProfile": serviceEdge.get("override_version_profile"),
-            "upgradeDay": serviceEdge.get("upgrade_day"),
-            "upgradeTimeInSecs": serviceEdge.get("upgrade_time_in_secs"),
-            "versionProfileId": serviceEdge.get("version_profile_id"),
-            "versionProfileVisibilityScope": serviceEdge.get(
-                "version_profile_visibility_scope"
-            ),
-            "serviceEdges": self.mapServiceEdgesListToJSON(
-                serviceEdge.get("service_edges")
-            ),
-            "trustedNetworks": self.mapTrustedNetworksListToJSON(
-                serviceEdge.get("trusted_networks")
-            ),
-        }
+        return SERVICE_EDGE_GROUP.toJSON(serviceEdge)
 
     def create(self, app):
         """Create new ServiceEdgeGroup"""
@@ -0,0 +1,156 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import time
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_cache_utils import (
+    write_json_atomic,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    runConcurrently,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_object_index import (
+    collectionURL,
+)
+
+MANIFEST = "manifest.json"
+SNAPSHOT_VERSION = 1
+
+# collection name -> ObjectIndex kind of its objects
+COLLECTIONS = {
+    "app_connector_groups": "app_connector_group",
+    "app_connectors": "app_connector",
+    "application_segments": "application",
+    "application_servers": "application_server",
+    "ba_certificates": "ba_certificate",
+    "cloud_connector_groups": "cloud_connector_group",
+    "customer_version_profiles": "customer_version_profile",
+    "enrollment_certificates": "enrollment_certificate",
+    "idp_controllers": "idp",
+    "lss_configs": "lss_config",
+    "machine_groups": "machine_group",
+    "policy_access_rules": "policy_access_rule",
+    "policy_forwarding_rules": "policy_forwarding_rule",
+    "policy_timeout_rules": "policy_timeout_rule",
+    "posture_profiles": "posture",
+    "provisioning_keys_connector": "provisioning_key_connector",
+    "provisioning_keys_service_edge": "provisioning_key_service_edge",
+    "saml_attributes": "saml_attribute",
+    "segment_groups": "segment_group",
+    "server_groups": "server_group",
+    "service_edge_groups": "service_edge_group",
+    "trusted_networks": "trusted_network",
+}
+
+
+def highWaterMark(items):
+    """latest modifiedTime (or creationTime) of a collection, 0 when it has none"""
+    mark = 0
+    for item in items:
+        value = item.get("modifiedTime") or item.get("creationTime")
+        try:
+            value = int(value)
+        except (TypeError, ValueError):
+            continue
+        if value > mark:
+            mark = value
+    return mark
+
+
+class TenantSnapshot:
+    """
+    On-disk snapshot of a tenant: one compact JSON file per collection (the API
+    objects, sorted by id) and a manifest holding, per collection, its object count
+    and modifiedTime high-water mark.
+
+    The API has no modified-since filter, so every sync still lists the selected
+    collections (concurrently, over one client); a collection file is only rewritten
+    when its high-water mark or its count (which catches deletions) has changed.
+    The manifest is written last, so it always describes complete files.
+    """
+
+    def __init__(self, rest, customer_id, path):
+        self.rest = rest
+        self.customer_id = customer_id
+        self.path = path
+
+    def manifestPath(self):
+        return os.path.join(self.path, MANIFEST)
+
+    def loadManifest(self):
+        try:
+            with open(self.manifestPath(), "rb") as f:
+                manifest = json.loads(f.read().decode("utf-8"))
+        except (IOError, OSError, ValueError):
+            return None
+        if (
+            not isinstance(manifest, dict)
+            or manifest.get("version") != SNAPSHOT_VERSION
+            or manifest.get("customer_id") != self.customer_id
+        ):
+            return None
+        return manifest
+
+    def fetchCollection(self, name):
+        return self.rest.get_paginated_data(
+            base_url=collectionURL(COLLECTIONS[name], self.customer_id),
+            data_key_name="list",
+        )
+
+    def fetch(self, names, max_workers=4):
+        """{name: list of API objects} for the given collections, fetched concurrently"""
+        results = runConcurrently(
+            getattr(self.rest, "module", None),
+            [(self.fetchCollection, (name,)) for name in names],
+            max_workers,
+        )
+        return dict(zip(names, results))
+
+    def isCurrent(self, entry, count, mark):
+        return (
+            entry is not None
+            and entry.get("count") == count
+            and entry.get("modified_time") == mark
+            and os.path.exists(os.path.join(self.path, entry.get("file", "")))
+        )
+
+    def sync(self, names=None, max_workers=4, force=False, check_mode=False):
+        """
+        refresh the snapshot for the given collections (all when None)
+        Returns: (list of refreshed collection names, {name: summary})
+        """
+        if names is None:
+            names = sorted(COLLECTIONS)
+        manifest = self.loadManifest() or {
+            "version": SNAPSHOT_VERSION,
+            "customer_id": self.customer_id,
+            "collections": {},
+        }
+        entries = manifest["collections"]
+        refreshed = []
+        summary = {}
+        now = int(time.time())
+        for name, items in self.fetch(names, max_workers).items():
+            count = len(items)
+            mark = highWaterMark(items)
+            summary[name] = dict(count=count, modified_time=mark, refreshed=False)
+            if not force and self.isCurrent(entries.get(name), count, mark):
+                continue
+            summary[name]["refreshed"] = True
+            refreshed.append(name)
+            if check_mode:
+                continue
+            items = sorted(items, key=lambda item: str(item.get("id")))
+            write_json_atomic(
+                os.path.join(self.path, name + ".json"), items, sort_keys=True
+            )
+            entries[name] = dict(
+                file=name + ".json", count=count, modified_time=mark, refreshed_at=now
+            )
+        if refreshed and not check_mode:
+            manifest["taken_at"] = now
+            write_json_atomic(self.manifestPath(), manifest, sort_keys=True)
+        return sorted(refreshed), summary
@@ -0,0 +1,85 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import fcntl
+import os
+import time
+from contextlib import contextmanager
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_cache_utils import (
+    cache_key,
+    default_cache_dir,
+    read_json,
+    write_json_atomic,
+)
+
+# tokens are considered expired this many seconds before ZPA says they are,
+# so a request started right before the deadline does not go out with a dead token
+EXPIRY_SKEW_SECONDS = 60
+
+
+class TokenCache:
+    """
+    On-disk bearer token cache shared by every module execution (and every fork)
+    running on the same controller with the same credentials.
+    Entries are keyed by a digest of client_id/customer_id (plus the secret and
+    base URL, so a wrong secret can never pick up someone else's token), written
+    atomically and refreshed under an exclusive file lock.
+    """
+
+    def __init__(self, client_id, client_secret, customer_id, baseurl, cache_dir=None):
+        self.cache_dir = cache_dir or default_cache_dir()
+        digest = cache_key(client_id, client_secret, customer_id, baseurl)
+        self.path = os.path.join(self.cache_dir, "token-%s.json" % digest)
+        self.lock_path = self.path + ".lock"
+
+    def _ensure_dir(self):
+        if not os.path.isdir(self.cache_dir):
+            os.makedirs(self.cache_dir, mode=0o700)
+
+    def get(self):
+        """return the cached access token, or None when missing or expired"""
+        entry = read_json(self.path)
+        if not isinstance(entry, dict) or not entry.get("access_token"):
+            return None
+        if float(entry.get("expires_at", 0)) <= time.time():
+            return None
+        return entry.get("access_token")
+
+    def set(self, access_token, expires_in):
+        """atomically store a token that ZPA reported valid for expires_in seconds"""
+        try:
+            expires_in = int(expires_in)
+        except (TypeError, ValueError):
+            expires_in = 0
+        expires_at = time.time() + expires_in - EXPIRY_SKEW_SECONDS
+        if not access_token or expires_at <= time.time():
+            return
+        write_json_atomic(
+            self.path, {"access_token": access_token, "expires_at": expires_at}
+        )
+
+    def invalidate(self, access_token=None):
+        """
+        drop the cached token; when access_token is given, only drop it if it is
+        still the cached one (another fork may have refreshed it already)
+        """
+        if access_token is not None and self.get() != access_token:
+            return
+        try:
+            os.remove(self.path)
+        except OSError:
+            pass
+
+    @contextmanager
+    def lock(self):
+        """exclusive lock serializing sign-ins for these credentials across processes"""
+        self._ensure_dir()
+        fd = os.open(self.lock_path, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            fcntl.flock(fd, fcntl.LOCK_EX)
+            yield
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+            os.close(fd)
@@ -3,8 +3,11 @@ from __future__ import absolute_import, division, print_function
 __metaclass__ = type
 
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
-    ZPAClientHelper,
     delete_none,
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_object_index import (
+    sharedIndex,
 )
 
 
@@ -12,7 +15,8 @@ class TrustedNetworksService:
     def __init__(self, module, customer_id):
         self.module = module
         self.customer_id = customer_id
-        self.rest = ZPAClientHelper(module)
+        self.rest = sharedClient(module)
+        self.index = sharedIndex(self.rest, customer_id)
 
     def getByIDOrName(self, id, name):
         network = None
@@ -32,21 +36,34 @@ class TrustedNetworksService:
         return self.mapRespJSONToApp(response.json)
 
     def getAll(self):
-        list = self.rest.get_paginated_data(
-            base_url="/mgmtconfig/v2/admin/customers/%s/network" % (self.customer_id),
-            data_key_name="list",
-        )
+        # also refreshes the index shared with the policy rule validation
+        list = self.index.all("trusted_network")
         networks = []
         for network in list:
             networks.append(self.mapRespJSONToApp(network))
         return networks
 
+    def iter_all(self):
+        for network in self.rest.iter_paginated_data(
+            base_url="/mgmtconfig/v2/admin/customers/%s/network" % (self.customer_id),
+            data_key_name="list",
+        ):
+            yield self.mapRespJSONToApp(network)
+
+    def getByNetworkID(self, network_id):
+        network = self.index.get("trusted_network", "networkId", network_id)
+        if network is None:
+            return None
+        return self.getByID(network.get("id"))
+
     def getByName(self, name):
-        networks = self.getAll()
-        for network in networks:
-            if network.get("name") == name:
-                return network
-        return None
+        network = self.rest.find_by_name(
+            base_url="/mgmtconfig/v2/admin/customers/%s/network" % (self.customer_id),
+            name=name,
+        )
+        if network is None:
+            return None
+        return self.mapRespJSONToApp(network)
 
     @delete_none
     def mapRespJSONToApp(self, resp_json):
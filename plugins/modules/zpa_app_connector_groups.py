@@ -172,13 +172,17 @@ from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_app_connect
 )
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_compare import (
+    isEquivalent,
 )
 
 
 def core(module):
     state = module.params.get("state", None)
     customer_id = module.params.get("customer_id", None)
-    service = AppConnectorGroupService(module, customer_id, ZPAClientHelper(module))
+    service = AppConnectorGroupService(module, customer_id, sharedClient(module))
     app = dict()
     params = [
         "id",
@@ -200,20 +204,32 @@ def core(module):
         app[param_name] = module.params.get(param_name, None)
     existing_app = service.getByIDOrName(app.get("id"), app.get("name"))
     if existing_app is not None:
+        current_app = dict(existing_app)
         id = existing_app.get("id")
         existing_app.update(app)
         existing_app["id"] = id
     if state == "present":
         if existing_app is not None:
+            if isEquivalent(
+                service.mapAppToJSON(existing_app), service.mapAppToJSON(current_app)
+            ):
+                """No changes"""
+                module.exit_json(changed=False, data=current_app)
             """Update"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=existing_app)
             service.update(existing_app)
             module.exit_json(changed=True, data=existing_app)
         else:
             """Create"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=app)
             app = service.create(app)
-            module.exit_json(changed=False, data=app)
+            module.exit_json(changed=True, data=app)
     elif state == "absent":
         if existing_app is not None:
+            if module.check_mode:
+                module.exit_json(changed=True, data=current_app)
             service.delete(existing_app.get("id"))
             module.exit_json(changed=True, data=existing_app)
     module.exit_json(changed=False, data={})
@@ -69,6 +69,7 @@ from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_app_connect
 )
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
+    sharedClient,
 )
 
 
@@ -76,7 +77,7 @@ def core(module):
     app_name = module.params.get("name", None)
     app_id = module.params.get("id", None)
     customer_id = module.params.get("customer_id", None)
-    service = AppConnectorGroupService(module, customer_id, ZPAClientHelper(module))
+    service = AppConnectorGroupService(module, customer_id, sharedClient(module))
     apps = []
     if app_id is not None:
         app = service.getByID(app_id)
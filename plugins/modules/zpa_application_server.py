@@ -100,6 +100,9 @@ from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_application
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_compare import (
+    isEquivalent,
+)
 
 
 def core(module):
@@ -122,22 +125,35 @@ def core(module):
         application_server.get("id"), application_server.get("name")
     )
     if existing_application_server is not None:
+        current_application_server = dict(existing_application_server)
         id = existing_application_server.get("id")
         existing_application_server.update(application_server)
         existing_application_server["id"] = id
     if state == "present":
         if existing_application_server is not None:
+            if isEquivalent(
+                service.mapAppToJSON(existing_application_server),
+                service.mapAppToJSON(current_application_server),
+            ):
+                """No changes"""
+                module.exit_json(changed=False, data=current_application_server)
             """Update"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=existing_application_server)
             service.update(existing_application_server)
             module.exit_json(changed=True, data=existing_application_server)
         else:
             """Create"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=application_server)
             application_server = service.create(application_server)
-            module.exit_json(changed=False, data=application_server)
+            module.exit_json(changed=True, data=application_server)
     elif state == "absent":
         if existing_application_server is not None:
+            if module.check_mode:
+                module.exit_json(changed=True, data=current_application_server)
             service.delete(existing_application_server.get("id"))
-            module.exit_json(changed=False, data=existing_application_server)
+            module.exit_json(changed=True, data=existing_application_server)
     module.exit_json(changed=False, data={})
 
 
@@ -253,6 +253,9 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_compare import (
+    isEquivalent,
+)
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_lss_config_controller import (
     LSSConfigControllerService,
 )
@@ -270,22 +273,35 @@ def core(module):
         lss_config.get("id"), lss_config.get("config", {}).get("name")
     )
     if existing_lss_config is not None:
+        current_lss_config = dict(existing_lss_config)
         id = existing_lss_config.get("id")
         existing_lss_config.update(lss_config)
         existing_lss_config["id"] = id
     if state == "present":
         if existing_lss_config is not None:
+            if isEquivalent(
+                service.mapAppToJSON(existing_lss_config),
+                service.mapAppToJSON(current_lss_config),
+            ):
+                """No changes"""
+                module.exit_json(changed=False, data=current_lss_config)
             """Update"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=existing_lss_config)
             lss_config = service.update(existing_lss_config)
             module.exit_json(changed=True, data=lss_config)
         else:
             """Create"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=lss_config)
             lss_config = service.create(lss_config)
-            module.exit_json(changed=False, data=lss_config)
+            module.exit_json(changed=True, data=lss_config)
     elif state == "absent":
         if existing_lss_config is not None:
+            if module.check_mode:
+                module.exit_json(changed=True, data=current_lss_config)
             service.delete(existing_lss_config.get("id"))
-            module.exit_json(changed=False, data=existing_lss_config)
+            module.exit_json(changed=True, data=existing_lss_config)
     module.exit_json(changed=False, data={})
 
 
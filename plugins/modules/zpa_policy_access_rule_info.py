@@ -56,6 +56,7 @@ EXAMPLES = """
 
 RETURN = """
 # Returns information on a specified Policy Access Rule.
+# The operands of their conditions include the idp_id returned by the API.
 """
 
 from re import T
@@ -65,6 +66,7 @@ from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
+    sharedClient,
 )
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_access_rule import (
     PolicyAccessRuleService,
@@ -75,7 +77,7 @@ def core(module):
     policy_rule_name = module.params.get("name", None)
     policy_rule_id = module.params.get("id", None)
     customer_id = module.params.get("customer_id", None)
-    service = PolicyAccessRuleService(module, customer_id, ZPAClientHelper(module))
+    service = PolicyAccessRuleService(module, customer_id, sharedClient(module))
     global_policy_set = service.getByPolicyType("ACCESS_POLICY")
     if global_policy_set is None or global_policy_set.get("id") is None:
         module.fail_json(msg="Unable to get global policy set")
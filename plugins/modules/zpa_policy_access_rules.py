@@ -0,0 +1,491 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2022, William Guilherme <wguilherme@securitygeek.io>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: zpa_policy_access_rules
+short_description: Create/Update/Delete many Policy Access Rules at once
+description:
+  - This module create/update/delete a list of Policy Access Rules in the ZPA Cloud in one task.
+  - The global access policy set and the existing rules are fetched once, the
+    desired rules are compared locally and only the rules that differ are created,
+    updated or deleted.
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.0.0"
+options:
+  client_id:
+    description: ""
+    required: false
+    type: str
+  client_secret:
+    description: ""
+    required: false
+    type: str
+  customer_id:
+    description: ""
+    required: false
+    type: str
+  rules:
+    description:
+      - List of policy access rules, each one with the options of M(willguibr.zpacloud.zpa_policy_access_rule).
+      - Rules are matched to existing rules by I(id) when given, otherwise by I(name).
+    type: list
+    elements: dict
+    required: true
+    suboptions:
+        action:
+          description:
+            - This is for providing the rule action.
+          type: str
+          required: false
+          choices:
+            - ALLOW
+            - DENY
+        action_id:
+          type: str
+          required: false
+          description:
+            - This field defines the description of the server.
+        priority:
+          description: ""
+          type: str
+          required: false
+        id:
+          type: str
+          description: ""
+        default_rule_name:
+          type: str
+          description: ""
+        description:
+          type: str
+          description: ""
+        policy_type:
+          description: ""
+          type: str
+          required: false
+        rule_order:
+          description: ""
+          type: str
+          required: false
+        default_rule:
+          description:
+            - This is for providing a customer message for the user.
+          type: bool
+          required: false
+        operator:
+          description:
+            - This denotes the operation type.
+          type: str
+          required: false
+          choices:
+            - AND
+            - OR
+        app_connector_groups:
+          description:
+            - List of the app connector group IDs.
+          type: list
+          elements: dict
+          required: false
+          suboptions:
+            name:
+              required: false
+              type: str
+              description: ""
+            id:
+              required: true
+              type: str
+              description: ""
+        app_server_groups:
+          type: list
+          elements: dict
+          required: false
+          description:
+            - List of the server group IDs.
+          suboptions:
+            name:
+              required: false
+              type: str
+              description: ""
+            id:
+              required: true
+              type: str
+              description: ""
+        custom_msg:
+          description:
+            - This is for providing a customer message for the user.
+          type: str
+          required: false
+        lss_default_rule:
+          description: ""
+          type: bool
+          required: False
+        name:
+          description:
+            - This is the name of the policy.
+          type: str
+          required: True
+        conditions:
+          type: list
+          elements: dict
+          required: False
+          description: ""
+          suboptions:
+            id:
+              description: ""
+              type: str
+            negated:
+              description: ""
+              type: bool
+              required: False
+            operator:
+              description: ""
+              type: str
+              required: True
+              choices: ["AND", "OR"]
+            operands:
+              required: False
+              description: ""
+              type: list
+              elements: dict
+              suboptions:
+                id:
+                  description: ""
+                  type: str
+                idp_id:
+                  description: ""
+                  type: str
+                  required: False
+                name:
+                  description: ""
+                  type: str
+                  required: False
+                lhs:
+                  description: ""
+                  type: str
+                  required: True
+                rhs:
+                  description: ""
+                  type: str
+                  required: False
+                rhs_list:
+                  description: ""
+                  type: list
+                  elements: str
+                  required: False
+                object_type:
+                  description: ""
+                  type: str
+                  required: True
+                  choices:
+                    - APP
+                    - APP_GROUP
+                    - SAML
+                    - IDP
+                    - CLIENT_TYPE
+                    - TRUSTED_NETWORK
+                    - MACHINE_GRP
+                    - POSTURE
+                    - SCIM
+                    - SCIM_GROUP
+                    - EDGE_CONNECTOR_GROUP
+        state:
+          description: "Whether the rule should be present or absent."
+          type: str
+          choices:
+            - present
+            - absent
+          default: present
+  max_workers:
+    description:
+      - Maximum number of rules created, updated or deleted concurrently.
+    type: int
+    required: false
+    default: 4
+  validation:
+    description:
+      - How the rule conditions are validated before any rule is written, also in check mode.
+      - C(api) checks the shape of every operand and looks up the objects they reference.
+      - C(offline) only checks the shape of the operands (LHS and RHS per object type, client types,
+        posture and trusted network values) without any API call; references to missing objects
+        are then only reported by the API when the rules are written.
+    type: str
+    choices: ["api", "offline"]
+    default: api
+"""
+
+EXAMPLES = """
+- name: Access Policy - Intranet Web Apps
+  willguibr.zpacloud.zpa_policy_access_rules:
+    max_workers: 8
+    rules:
+      - name: "Intranet Web Apps"
+        description: "Intranet Web Apps"
+        action: "ALLOW"
+        rule_order: 1
+        operator: "AND"
+        conditions:
+          - negated: false
+            operator: "OR"
+            operands:
+              - name: "app_seg_intranet"
+                object_type: "APP"
+                lhs: "id"
+                rhs: "{{ app_seg_intranet.data.id }}"
+      - name: "Block Legacy Apps"
+        action: "DENY"
+        rule_order: 2
+        conditions:
+          - negated: false
+            operator: "OR"
+            operands:
+              - name: "sg_legacy"
+                object_type: "APP_GROUP"
+                lhs: "id"
+                rhs: "{{ seg_legacy.data.id }}"
+      - name: "Retired Rule"
+        state: absent
+"""
+
+RETURN = """
+data:
+  description:
+    - The resulting policy access rule resource records, in the order of the rules option.
+    - In check mode, the rules as they would be written; deleted rules are returned as they exist.
+    - The operands of their conditions include the idp_id returned by the API.
+  returned: always
+  type: list
+  elements: dict
+created:
+  description: Names of the rules that were created.
+  returned: always
+  type: list
+updated:
+  description: Names of the rules that were updated or reordered.
+  returned: always
+  type: list
+deleted:
+  description: Names of the rules that were deleted.
+  returned: always
+  type: list
+"""
+
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+    runConcurrently,
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_access_rule import (
+    PolicyAccessRuleService,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_rule_plan import (
+    failedSteps,
+    pinnedOrders,
+    planRules,
+    planSummary,
+    plannedReorders,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_validation import (
+    offlineValidation,
+    validateRulesConditions,
+)
+
+
+def core(module):
+    customer_id = module.params.get("customer_id", None)
+    max_workers = max(1, module.params.get("max_workers") or 1)
+    service = PolicyAccessRuleService(module, customer_id, sharedClient(module))
+    global_policy_set = service.getByPolicyType("ACCESS_POLICY")
+    if global_policy_set is None or global_policy_set.get("id") is None:
+        module.fail_json(msg="Unable to get global policy set")
+    policy_set_id = global_policy_set.get("id")
+
+    try:
+        plan = planRules(
+            service,
+            module.params.get("rules"),
+            service.getAllByPolicyType("ACCESS_POLICY"),
+        )
+    except ValueError as e:
+        module.fail_json(msg=to_native(e))
+
+    # validate every rule that will be written before touching the tenant, the
+    # objects referenced by all of them are looked up in one pass
+    written = [
+        policy for action, policy, existing in plan if action in ("create", "update")
+    ]
+    checks = validateRulesConditions(
+        service,
+        [service.mapAppToJSON(policy).get("conditions") or [] for policy in written],
+        offline=offlineValidation(module),
+    )
+    errors = [
+        "%s: %s" % (policy.get("name"), check)
+        for policy, check in zip(written, checks)
+        if check is not True
+    ]
+    if errors:
+        module.fail_json(
+            msg="validating policy rule conditions failed: %s" % (" ".join(errors))
+        )
+
+    reorders = plannedReorders(plan)
+    created, updated, deleted = planSummary(plan)
+    changed = bool(created or updated or deleted)
+    if module.check_mode:
+        module.exit_json(
+            changed=changed,
+            data=[p if a in ("create", "update") else e for a, p, e in plan],
+            created=created,
+            updated=updated,
+            deleted=deleted,
+        )
+
+    def apply(step):
+        action, policy, existing = step
+        if action == "delete":
+            status_code = service.delete(existing.get("id"), policy_set_id)
+            return existing if status_code < 300 else None
+        if action is None:
+            return existing
+        # rule order is applied afterwards, moves are not independent
+        payload = dict(policy)
+        payload["rule_order"] = None
+        # conditions were all validated above, before the first write
+        if action == "create":
+            return service.create(payload, policy_set_id, validate=False)
+        return service.update(payload, policy_set_id, validate=False)
+
+    # deletes go first so that names they free can be reused by creates
+    deletes = [i for i, step in enumerate(plan) if step[0] == "delete"]
+    writes = [i for i, step in enumerate(plan) if step[0] != "delete"]
+    results = [None] * len(plan)
+    for indexes in (deletes, writes):
+        for i, result in zip(
+            indexes,
+            runConcurrently(
+                module, [(apply, (plan[i],)) for i in indexes], max_workers
+            ),
+        ):
+            results[i] = result
+    failed = failedSteps(plan, results)
+    if failed:
+        module.fail_json(
+            msg="failed to apply policy rules: %s" % (", ".join(failed)),
+            created=created,
+            updated=updated,
+            deleted=deleted,
+        )
+
+    if reorders:
+        # one listing of the rules as they are now, then only the planned moves;
+        # every rule with a rule_order is pinned so the moves do not displace it
+        rule_orders = pinnedOrders(plan, results)
+        moves = service.reorderAll(policy_set_id, "ACCESS_POLICY", rule_orders)
+        if moves is None:
+            module.fail_json(msg="failed to reorder policy rules")
+        for result in results:
+            if result is not None and result.get("id") in rule_orders:
+                result["rule_order"] = rule_orders[result.get("id")]
+    module.exit_json(
+        changed=changed,
+        data=results,
+        created=created,
+        updated=updated,
+        deleted=deleted,
+    )
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    id_name_spec = dict(
+        type="list",
+        elements="dict",
+        options=dict(
+            id=dict(type="str", required=True), name=dict(type="str", required=False)
+        ),
+        required=False,
+    )
+    rule_spec = dict(
+        default_rule=dict(type="bool", required=False),
+        default_rule_name=dict(type="str", required=False),
+        description=dict(type="str", required=False),
+        policy_type=dict(type="str", required=False),
+        custom_msg=dict(type="str", required=False),
+        id=dict(type="str"),
+        lss_default_rule=dict(type="bool", required=False),
+        action_id=dict(type="str", required=False),
+        name=dict(type="str", required=True),
+        app_connector_groups=id_name_spec,
+        action=dict(type="str", required=False, choices=["ALLOW", "DENY"]),
+        priority=dict(type="str", required=False),
+        operator=dict(type="str", required=False, choices=["AND", "OR"]),
+        rule_order=dict(type="str", required=False),
+        conditions=dict(
+            type="list",
+            elements="dict",
+            options=dict(
+                id=dict(type="str"),
+                negated=dict(type="bool", required=False),
+                operator=dict(type="str", required=True, choices=["AND", "OR"]),
+                operands=dict(
+                    type="list",
+                    elements="dict",
+                    options=dict(
+                        id=dict(type="str"),
+                        idp_id=dict(type="str", required=False),
+                        name=dict(type="str", required=False),
+                        lhs=dict(type="str", required=True),
+                        rhs=dict(type="str", required=False),
+                        rhs_list=dict(type="list", elements="str", required=False),
+                        object_type=dict(
+                            type="str",
+                            required=True,
+                            choices=[
+                                "APP",
+                                "APP_GROUP",
+                                "SAML",
+                                "IDP",
+                                "CLIENT_TYPE",
+                                "TRUSTED_NETWORK",
+                                "MACHINE_GRP",
+                                "POSTURE",
+                                "SCIM",
+                                "SCIM_GROUP",
+                                "EDGE_CONNECTOR_GROUP",
+                            ],
+                        ),
+                    ),
+                    required=False,
+                ),
+            ),
+            required=False,
+        ),
+        app_server_groups=id_name_spec,
+        state=dict(type="str", choices=["present", "absent"], default="present"),
+    )
+    argument_spec.update(
+        rules=dict(type="list", elements="dict", options=rule_spec, required=True),
+        max_workers=dict(type="int", required=False, default=4),
+        validation=dict(type="str", choices=["api", "offline"], default="api"),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    try:
+        core(module)
+    except Exception as e:
+        module.fail_json(msg=to_native(e), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
@@ -151,6 +151,16 @@ options:
                 "SCIM_GROUP",
                 "EDGE_CONNECTOR_GROUP",
               ]
+  validation:
+    description:
+      - How the rule conditions are validated before the rule is written, and in check mode.
+      - C(api) checks the shape of every operand and looks up the objects they reference.
+      - C(offline) only checks the shape of the operands (LHS and RHS per object type, client types,
+        posture and trusted network values) without any API call; references to missing objects
+        are then only reported by the API when the rule is written.
+    type: str
+    choices: ["api", "offline"]
+    default: api
   state:
     description: ""
     type: str
@@ -207,6 +217,7 @@ EXAMPLES = """
 
 RETURN = """
 # The newly created access client forwarding policy rule resource record.
+# The operands of its conditions include the idp_id returned by the API.
 """
 
 from traceback import format_exc
@@ -216,9 +227,15 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_compare import (
+    isEquivalent,
+)
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_forwarding_rule import (
     PolicyForwardingRuleService,
 )
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_validation import (
+    failOnInvalidConditions,
+)
 
 
 def core(module):
@@ -253,22 +270,37 @@ def core(module):
         policy.get("id"), policy.get("name"), policy_set_id, "BYPASS_POLICY"
     )
     if existing_policy is not None:
+        current_policy = dict(existing_policy)
         id = existing_policy.get("id")
         existing_policy.update(policy)
         existing_policy["id"] = id
     if state == "present":
         if existing_policy is not None:
+            if isEquivalent(
+                service.mapAppToJSON(existing_policy),
+                service.mapAppToJSON(current_policy),
+            ):
+                """No changes"""
+                module.exit_json(changed=False, data=current_policy)
             """Update"""
+            if module.check_mode:
+                failOnInvalidConditions(module, service, existing_policy)
+                module.exit_json(changed=True, data=existing_policy)
             existing_policy = service.update(existing_policy, policy_set_id)
             module.exit_json(changed=True, data=existing_policy)
         else:
             """Create"""
+            if module.check_mode:
+                failOnInvalidConditions(module, service, policy)
+                module.exit_json(changed=True, data=policy)
             policy = service.create(policy, policy_set_id)
-            module.exit_json(changed=False, data=policy)
+            module.exit_json(changed=True, data=policy)
     elif state == "absent":
         if existing_policy is not None:
+            if module.check_mode:
+                module.exit_json(changed=True, data=current_policy)
             service.delete(existing_policy.get("id"), policy_set_id)
-            module.exit_json(changed=False, data=existing_policy)
+            module.exit_json(changed=True, data=existing_policy)
     module.exit_json(changed=False, data={})
 
 
@@ -335,6 +367,7 @@ def main():
             required=False,
         ),
         state=dict(type="str", choices=["present", "absent"], default="present"),
+        validation=dict(type="str", choices=["api", "offline"], default="api"),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
     try:
@@ -56,6 +56,7 @@ EXAMPLES = """
 
 RETURN = """
 # Returns information on a specified policy forwarding rule.
+# The operands of their conditions include the idp_id returned by the API.
 """
 
 from re import T
@@ -41,6 +41,11 @@ options:
       - ID of the posture profile.
     required: false
     type: str
+  posture_udid:
+    description:
+      - UDID of the posture profile, as used in policy rule operands.
+    required: false
+    type: str
 """
 
 EXAMPLES = """
@@ -53,6 +58,9 @@ EXAMPLES = """
 - name: Get Details of a Specific Posture Profile by Name
   willguibr.zpacloud.zpa_posture_profile_info:
     name: CrowdStrike_ZPA_Pre-ZTA
+- name: Get Details of a Specific Posture Profile by UDID
+  willguibr.zpacloud.zpa_posture_profile_info:
+    posture_udid: "fc92ead2-4046-428d-bf3f-6e534a53194b"
 """
 
 RETURN = """
@@ -75,6 +83,7 @@ from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_posture_pro
 def core(module):
     posture_name = module.params.get("name", None)
     posture_id = module.params.get("id", None)
+    posture_udid = module.params.get("posture_udid", None)
     customer_id = module.params.get("customer_id", None)
     service = PostureProfileService(module, customer_id)
     postures = []
@@ -90,6 +99,13 @@ def core(module):
                 msg="Failed to retrieve Posture Profile Name: '%s'" % (posture_name)
             )
         postures = [posture]
+    elif posture_udid is not None:
+        posture = service.getByUDID(posture_udid)
+        if posture is None:
+            module.fail_json(
+                msg="Failed to retrieve Posture Profile UDID: '%s'" % (posture_udid)
+            )
+        postures = [posture]
     else:
         postures = service.getAll()
     module.exit_json(changed=False, data=postures)
@@ -100,6 +116,7 @@ def main():
     argument_spec.update(
         name=dict(type="str", required=False),
         id=dict(type="str", required=False),
+        posture_udid=dict(type="str", required=False),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
     try:
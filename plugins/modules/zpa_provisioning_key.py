@@ -145,6 +145,9 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_compare import (
+    isEquivalent,
+)
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_provisioning_key import (
     ProvisioningKeyService,
 )
@@ -183,22 +186,34 @@ def core(module):
         provisioning_key.get("id"), provisioning_key.get("name"), association_type
     )
     if existing_key is not None:
+        current_key = dict(existing_key)
         id = existing_key.get("id")
         existing_key.update(provisioning_key)
         existing_key["id"] = id
     if state == "present":
         if existing_key is not None:
+            if isEquivalent(
+                service.mapAppToJSON(existing_key), service.mapAppToJSON(current_key)
+            ):
+                """No changes"""
+                module.exit_json(changed=False, data=current_key)
             """Update"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=existing_key)
             existing_key = service.update(existing_key, association_type)
             module.exit_json(changed=True, data=existing_key)
         else:
             """Create"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=provisioning_key)
             provisioning_key = service.create(provisioning_key, association_type)
-            module.exit_json(changed=False, data=provisioning_key)
+            module.exit_json(changed=True, data=provisioning_key)
     elif state == "absent":
         if existing_key is not None:
+            if module.check_mode:
+                module.exit_json(changed=True, data=current_key)
             service.delete(existing_key.get("id"), association_type)
-            module.exit_json(changed=False, data=existing_key)
+            module.exit_json(changed=True, data=existing_key)
     module.exit_json(changed=False, data={})
 
 
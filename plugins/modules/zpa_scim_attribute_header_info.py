@@ -36,6 +36,12 @@ options:
       - Name of the scim attribute.
     required: false
     type: str
+  names:
+    description:
+      - Names of several scim attributes, all resolved in one pass over the IDP's scim attributes.
+    required: false
+    type: list
+    elements: str
   idp_name:
     description:
       - Name of the IDP, required when ID is not sepcified.
@@ -56,6 +62,12 @@ EXAMPLES = """
   willguibr.zpacloud.zpa_scim_attribute_header_info:
     name: costCenter
     idp_name: IdP_Name
+- name: Get Information About several SCIM Attributes by Name
+  willguibr.zpacloud.zpa_scim_attribute_header_info:
+    names:
+      - costCenter
+      - department
+    idp_name: IdP_Name
 - name: Get Information About the SCIM Attribute by ID
   willguibr.zpacloud.zpa_scim_attribute_header_info:
     id: 216196257331285842
@@ -81,6 +93,7 @@ from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_scim_attrib
 
 def core(module):
     scim_attr_name = module.params.get("name", None)
+    scim_attr_names = module.params.get("names", None)
     idp_name = module.params.get("idp_name", None)
     scim_attr_id = module.params.get("id", None)
     customer_id = module.params.get("customer_id", None)
@@ -101,6 +114,15 @@ def core(module):
                 % (scim_attr_name)
             )
         attributes = [attribute]
+    elif scim_attr_names:
+        found = service.getByNames(scim_attr_names, idp_name)
+        missing = [name for name in scim_attr_names if name not in found]
+        if missing:
+            module.fail_json(
+                msg="Failed to retrieve scim attribute header Names: '%s'"
+                % ("', '".join(missing))
+            )
+        attributes = [found[name] for name in scim_attr_names]
     else:
         attributes = service.getAllByIDPName(idp_name)
     module.exit_json(changed=False, data=attributes)
@@ -110,10 +132,15 @@ def main():
     argument_spec = ZPAClientHelper.zpa_argument_spec()
     argument_spec.update(
         name=dict(type="str", required=False),
+        names=dict(type="list", elements="str", required=False),
         id=dict(type="str", required=False),
         idp_name=dict(type="str", required=True),
     )
-    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        mutually_exclusive=[("id", "name", "names")],
+    )
     try:
         core(module)
     except Exception as e:
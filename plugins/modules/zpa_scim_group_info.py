@@ -36,6 +36,12 @@ options:
       - Name of the scim group.
     required: false
     type: str
+  names:
+    description:
+      - Names of several scim groups, all resolved in one pass over the IDP's scim groups.
+    required: false
+    type: list
+    elements: str
   idp_name:
     description:
       - Name of the IDP.
@@ -60,6 +66,12 @@ EXAMPLES = """
   willguibr.zpacloud.zpa_scim_attribute_header_info:
     name: "Finance"
     idp_name: "IdP_Name"
+- name: Get Information About several SCIM Groups by Name
+  willguibr.zpacloud.zpa_scim_group_info:
+    names:
+      - "Finance"
+      - "Engineering"
+    idp_name: "IdP_Name"
 """
 
 RETURN = """
@@ -81,6 +93,7 @@ from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_scim_group
 
 def core(module):
     scim_name = module.params.get("name", None)
+    scim_names = module.params.get("names", None)
     scim_id = module.params.get("id", None)
     idp_name = module.params.get("idp_name", None)
     customer_id = module.params.get("customer_id", None)
@@ -98,6 +111,14 @@ def core(module):
                 msg="Failed to retrieve scim group Name: '%s'" % (scim_name)
             )
         attributes = [attribute]
+    elif scim_names:
+        found = service.getByNames(scim_names, idp_name)
+        missing = [name for name in scim_names if name not in found]
+        if missing:
+            module.fail_json(
+                msg="Failed to retrieve scim group Names: '%s'" % ("', '".join(missing))
+            )
+        attributes = [found[name] for name in scim_names]
     else:
         attributes = service.getAllByIDPName(idp_name)
     module.exit_json(changed=False, data=attributes)
@@ -107,10 +128,15 @@ def main():
     argument_spec = ZPAClientHelper.zpa_argument_spec()
     argument_spec.update(
         name=dict(type="str", required=False),
+        names=dict(type="list", elements="str", required=False),
         id=dict(type="str", required=False),
         idp_name=dict(type="str", required=True),
     )
-    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    module = AnsibleModule(
+        argument_spec=argument_spec,
+        supports_check_mode=True,
+        mutually_exclusive=[("id", "name", "names")],
+    )
     try:
         core(module)
     except Exception as e:
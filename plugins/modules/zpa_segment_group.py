@@ -101,6 +101,10 @@ from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_compare import (
+    isEquivalent,
 )
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_segment_group import (
     SegmentGroupService,
@@ -110,7 +114,7 @@ from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_segment_gro
 def core(module):
     state = module.params.get("state", None)
     customer_id = module.params.get("customer_id", None)
-    service = SegmentGroupService(module, customer_id, ZPAClientHelper(module))
+    service = SegmentGroupService(module, customer_id, sharedClient(module))
     segment_group = dict()
     params = [
         "applications",
@@ -128,20 +132,33 @@ def core(module):
         segment_group.get("id"), segment_group.get("name")
     )
     if existing_segment_group is not None:
+        current_segment_group = dict(existing_segment_group)
         id = existing_segment_group.get("id")
         existing_segment_group.update(segment_group)
         existing_segment_group["id"] = id
     if state == "present":
         if existing_segment_group is not None:
+            if isEquivalent(
+                service.mapAppToJSON(existing_segment_group),
+                service.mapAppToJSON(current_segment_group),
+            ):
+                """No changes"""
+                module.exit_json(changed=False, data=current_segment_group)
             """Update"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=existing_segment_group)
             segment_group = service.update(existing_segment_group)
             module.exit_json(changed=True, data=segment_group)
         else:
             """Create"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=segment_group)
             segment_group = service.create(segment_group)
-            module.exit_json(changed=False, data=segment_group)
+            module.exit_json(changed=True, data=segment_group)
     elif state == "absent":
         if existing_segment_group is not None:
+            if module.check_mode:
+                module.exit_json(changed=True, data=current_segment_group)
             service.delete(existing_segment_group.get("id"))
             module.exit_json(changed=True, data=existing_segment_group)
     module.exit_json(changed=False, data={})
@@ -66,6 +66,7 @@ from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
+    sharedClient,
 )
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_segment_group import (
     SegmentGroupService,
@@ -76,7 +77,7 @@ def core(module):
     segment_group_name = module.params.get("name", None)
     segment_group_id = module.params.get("id", None)
     customer_id = module.params.get("customer_id", None)
-    service = SegmentGroupService(module, customer_id, ZPAClientHelper(module))
+    service = SegmentGroupService(module, customer_id, sharedClient(module))
     segment_groups = []
     if segment_group_id is not None:
         segment_group = service.getByID(segment_group_id)
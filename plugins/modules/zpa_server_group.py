@@ -148,6 +148,10 @@ from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_compare import (
+    isEquivalent,
 )
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_server_group import (
     ServerGroupService,
@@ -157,7 +161,7 @@ from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_server_grou
 def core(module):
     state = module.params.get("state", None)
     customer_id = module.params.get("customer_id", None)
-    service = ServerGroupService(module, customer_id, ZPAClientHelper(module))
+    service = ServerGroupService(module, customer_id, sharedClient(module))
     server_group = dict()
     params = [
         "id",
@@ -177,20 +181,33 @@ def core(module):
         server_group.get("id"), server_group.get("name")
     )
     if existing_server_group is not None:
+        current_server_group = dict(existing_server_group)
         id = existing_server_group.get("id")
         existing_server_group.update(server_group)
         existing_server_group["id"] = id
     if state == "present":
         if existing_server_group is not None:
+            if isEquivalent(
+                service.mapAppToJSON(existing_server_group),
+                service.mapAppToJSON(current_server_group),
+            ):
+                """No changes"""
+                module.exit_json(changed=False, data=current_server_group)
             """Update"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=existing_server_group)
             server_group = service.update(existing_server_group)
             module.exit_json(changed=True, data=server_group)
         else:
             """Create"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=server_group)
             server_group = service.create(server_group)
-            module.exit_json(changed=False, data=server_group)
+            module.exit_json(changed=True, data=server_group)
     elif state == "absent":
         if existing_server_group is not None:
+            if module.check_mode:
+                module.exit_json(changed=True, data=current_server_group)
             service.delete(existing_server_group.get("id"))
             module.exit_json(changed=True, data=existing_server_group)
     module.exit_json(changed=False, data={})
@@ -66,6 +66,7 @@ from ansible.module_utils._text import to_native
 from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
+    sharedClient,
 )
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_server_group import (
     ServerGroupService,
@@ -76,7 +77,7 @@ def core(module):
     server_group_name = module.params.get("name", None)
     server_group_id = module.params.get("id", None)
     customer_id = module.params.get("customer_id", None)
-    service = ServerGroupService(module, customer_id, ZPAClientHelper(module))
+    service = ServerGroupService(module, customer_id, sharedClient(module))
     server_groups = []
     if server_group_id is not None:
         server_group = service.getByID(server_group_id)
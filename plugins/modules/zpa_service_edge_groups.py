@@ -168,6 +168,9 @@ from ansible.module_utils.basic import AnsibleModule
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
     ZPAClientHelper,
 )
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_compare import (
+    isEquivalent,
+)
 from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_service_edge_groups import (
     ServiceEdgeGroupService,
 )
@@ -203,22 +206,34 @@ def core(module):
         service_edge.get("id"), service_edge.get("name")
     )
     if existing_edge is not None:
+        current_edge = dict(existing_edge)
         id = existing_edge.get("id")
         existing_edge.update(service_edge)
         existing_edge["id"] = id
     if state == "present":
         if existing_edge is not None:
+            if isEquivalent(
+                service.mapAppToJSON(existing_edge), service.mapAppToJSON(current_edge)
+            ):
+                """No changes"""
+                module.exit_json(changed=False, data=current_edge)
             """Update"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=existing_edge)
             service.update(existing_edge)
             module.exit_json(changed=True, data=existing_edge)
         else:
             """Create"""
+            if module.check_mode:
+                module.exit_json(changed=True, data=service_edge)
             service_edge = service.create(service_edge)
-            module.exit_json(changed=False, data=service_edge)
+            module.exit_json(changed=True, data=service_edge)
     elif state == "absent":
         if existing_edge is not None:
+            if module.check_mode:
+                module.exit_json(changed=True, data=current_edge)
             service.delete(existing_edge.get("id"))
-            module.exit_json(changed=False, data=existing_edge)
+            module.exit_json(changed=True, data=existing_edge)
     module.exit_json(changed=False, data={})
 
 
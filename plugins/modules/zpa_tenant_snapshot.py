@@ -0,0 +1,169 @@
+#!/usr/bin/python
+# -*- coding: utf-8 -*-
+#
+# Copyright: (c) 2022, William Guilherme <wguilherme@securitygeek.io>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+DOCUMENTATION = """
+---
+module: zpa_tenant_snapshot
+short_description: Writes a snapshot of the ZPA tenant configuration to disk.
+description:
+  - This module fetches the configuration collections of a tenant concurrently,
+    over one authenticated client, and writes them to a directory, one compact
+    JSON file per collection plus a C(manifest.json).
+  - The manifest records, per collection, the number of objects and the latest
+    C(modifiedTime). On later runs a collection file is only rewritten when
+    either of them changed.
+  - The API offers no modified-since filter, so every run still lists the
+    selected collections; only unchanged collections are spared from being
+    rewritten.
+author:
+  - William Guilherme (@willguibr)
+version_added: "1.0.0"
+options:
+  client_id:
+    description: ""
+    required: false
+    type: str
+  client_secret:
+    description: ""
+    required: false
+    type: str
+  customer_id:
+    description: ""
+    required: false
+    type: str
+  path:
+    description:
+      - Directory the snapshot is written to, created when missing.
+    type: path
+    required: true
+  collections:
+    description:
+      - Collections to refresh, all of them when omitted.
+      - Collections that are not selected are kept as they are in the snapshot.
+    type: list
+    elements: str
+    required: false
+    choices:
+      - app_connector_groups
+      - app_connectors
+      - application_segments
+      - application_servers
+      - ba_certificates
+      - cloud_connector_groups
+      - customer_version_profiles
+      - enrollment_certificates
+      - idp_controllers
+      - lss_configs
+      - machine_groups
+      - policy_access_rules
+      - policy_forwarding_rules
+      - policy_timeout_rules
+      - posture_profiles
+      - provisioning_keys_connector
+      - provisioning_keys_service_edge
+      - saml_attributes
+      - segment_groups
+      - server_groups
+      - service_edge_groups
+      - trusted_networks
+  force:
+    description:
+      - Rewrite every selected collection, even when it did not change.
+    type: bool
+    required: false
+    default: false
+  max_workers:
+    description:
+      - Maximum number of collections fetched concurrently.
+    type: int
+    required: false
+    default: 4
+"""
+
+EXAMPLES = """
+- name: Snapshot the whole tenant
+  willguibr.zpacloud.zpa_tenant_snapshot:
+    path: "/var/backups/zpa"
+
+- name: Refresh the policy rules only
+  willguibr.zpacloud.zpa_tenant_snapshot:
+    path: "/var/backups/zpa"
+    collections:
+      - policy_access_rules
+      - policy_timeout_rules
+      - policy_forwarding_rules
+"""
+
+RETURN = """
+path:
+  description: Directory holding the snapshot.
+  returned: always
+  type: str
+refreshed:
+  description: Names of the collections that were (or, in check mode, would be) rewritten.
+  returned: always
+  type: list
+collections:
+  description: Per collection, its number of objects, its latest modifiedTime and whether it was refreshed.
+  returned: always
+  type: dict
+"""
+
+from traceback import format_exc
+
+from ansible.module_utils._text import to_native
+from ansible.module_utils.basic import AnsibleModule
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    ZPAClientHelper,
+    sharedClient,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_tenant_snapshot import (
+    COLLECTIONS,
+    TenantSnapshot,
+)
+
+
+def core(module):
+    customer_id = module.params.get("customer_id", None)
+    path = module.params.get("path")
+    snapshot = TenantSnapshot(sharedClient(module), customer_id, path)
+    refreshed, collections = snapshot.sync(
+        names=module.params.get("collections"),
+        max_workers=module.params.get("max_workers"),
+        force=module.params.get("force"),
+        check_mode=module.check_mode,
+    )
+    module.exit_json(
+        changed=len(refreshed) > 0,
+        path=path,
+        refreshed=refreshed,
+        collections=collections,
+    )
+
+
+def main():
+    argument_spec = ZPAClientHelper.zpa_argument_spec()
+    argument_spec.update(
+        path=dict(type="path", required=True),
+        collections=dict(
+            type="list", elements="str", required=False, choices=sorted(COLLECTIONS)
+        ),
+        force=dict(type="bool", required=False, default=False),
+        max_workers=dict(type="int", required=False, default=4),
+    )
+    module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
+    try:
+        core(module)
+    except Exception as e:
+        module.fail_json(msg=to_native(e), exception=format_exc())
+
+
+if __name__ == "__main__":
+    main()
@@ -41,6 +41,11 @@ options:
       - ID of the trusted network.
     required: false
     type: str
+  network_id:
+    description:
+      - Network ID of the trusted network, as used in policy rule operands.
+    required: false
+    type: str
 
 """
 
@@ -53,6 +58,9 @@ EXAMPLES = """
 - name: Get information about Trusted Networks by ID
   willguibr.zpacloud.zpa_trusted_network_info:
     id: 216196257331282234
+- name: Get Details of a Specific Trusted Network by Network ID
+  willguibr.zpacloud.zpa_trusted_network_info:
+    network_id: "869f3b9c-bc2a-4ea2-9d22-9ecdfbbbe0b4"
 """
 
 RETURN = """
@@ -75,6 +83,7 @@ from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_trusted_net
 def core(module):
     app_name = module.params.get("name", None)
     app_id = module.params.get("id", None)
+    network_id = module.params.get("network_id", None)
     customer_id = module.params.get("customer_id", None)
     service = TrustedNetworksService(module, customer_id)
     apps = []
@@ -90,6 +99,14 @@ def core(module):
                 msg="Failed to retrieve Trusted Network Name: '%s'" % (app_name)
             )
         apps = [app]
+    elif network_id is not None:
+        app = service.getByNetworkID(network_id)
+        if app is None:
+            module.fail_json(
+                msg="Failed to retrieve Trusted Network with Network ID: '%s'"
+                % (network_id)
+            )
+        apps = [app]
     else:
         apps = service.getAll()
     module.exit_json(changed=False, data=apps)
@@ -100,6 +117,7 @@ def main():
     argument_spec.update(
         name=dict(type="str", required=False),
         id=dict(type="str", required=False),
+        network_id=dict(type="str", required=False),
     )
     module = AnsibleModule(argument_spec=argument_spec, supports_check_mode=True)
     try:
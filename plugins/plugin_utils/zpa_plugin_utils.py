@@ -0,0 +1,57 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import tempfile
+
+from ansible.errors import AnsibleError
+from ansible.module_utils.common.text.converters import jsonify
+from ansible.utils.display import Display
+
+display = Display()
+
+# credential options shared by the controller side plugins, with their environment fallbacks
+CREDENTIAL_OPTIONS = {
+    "client_id": "ZPA_CLIENT_ID",
+    "client_secret": "ZPA_CLIENT_SECRET",
+    "customer_id": "ZPA_CUSTOMER_ID",
+}
+
+
+class PluginModule:
+    """
+    Stand-in for AnsibleModule that lets controller side plugins (inventory, lookup)
+    drive ZPAClientHelper and the services: params hold the credentials, failures
+    raise AnsibleError and client log lines go to the verbose display.
+    """
+
+    def __init__(self, params, name):
+        self.params = params
+        self._name = name
+        self.check_mode = False
+        self.tmpdir = tempfile.gettempdir()
+
+    def fail_json(self, msg, **kwargs):
+        raise AnsibleError(msg)
+
+    def jsonify(self, data):
+        return jsonify(data)
+
+    def log(self, msg):
+        display.vvvv("%s: %s" % (self._name, msg))
+
+
+def pluginModule(plugin, name):
+    """PluginModule holding the credential options of a plugin"""
+    params = dict((option, plugin.get_option(option)) for option in CREDENTIAL_OPTIONS)
+    missing = [option for option, value in params.items() if not value]
+    if missing:
+        raise AnsibleError(
+            "%s requires %s (or the %s environment variables)"
+            % (
+                name,
+                ", ".join(missing),
+                ", ".join(CREDENTIAL_OPTIONS[option] for option in missing),
+            )
+        )
+    return PluginModule(params, name)
@@ -0,0 +1,118 @@
+#!/usr/bin/env python
+"""
+Compare per-call latency of a fresh TLS connection per request (what
+fetch_url does) with the keep-alive HTTPSConnectionPool used by
+ZPAClientHelper, against a local stand-in HTTPS server.
+
+    PYTHONPATH=<dir containing ansible_collections> python tests/benchmarks/bench_connection_pool.py [calls]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import os
+import shutil
+import ssl
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_connection_pool import (
+    HTTPSConnectionPool,
+)
+
+BODY = b'{"totalPages":"1","list":[{"id":"1","name":"Example"}]}'
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+def make_cert(tmpdir):
+    cert = os.path.join(tmpdir, "cert.pem")
+    key = os.path.join(tmpdir, "key.pem")
+    subprocess.check_call(
+        [
+            "openssl",
+            "req",
+            "-x509",
+            "-newkey",
+            "rsa:2048",
+            "-nodes",
+            "-days",
+            "1",
+            "-subj",
+            "/CN=localhost",
+            "-addext",
+            "subjectAltName=DNS:localhost",
+            "-keyout",
+            key,
+            "-out",
+            cert,
+        ],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
+    return cert, key
+
+
+def timed(label, calls, fn):
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    elapsed = time.perf_counter() - start
+    print("%-28s %8.2f ms/call" % (label, elapsed * 1000 / calls))
+    return elapsed / calls
+
+
+def main():
+    calls = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    tmpdir = tempfile.mkdtemp()
+    try:
+        cert, key = make_cert(tmpdir)
+        server = ThreadingHTTPServer(("localhost", 0), Handler)
+        server_ctx = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        server_ctx.load_cert_chain(cert, key)
+        server.socket = server_ctx.wrap_socket(server.socket, server_side=True)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        url = "https://localhost:%d/mgmtconfig/v1/admin/customers/1/segmentGroup" % (
+            server.server_address[1]
+        )
+        client_ctx = ssl.create_default_context(cafile=cert)
+
+        def fresh_connection():
+            with urllib.request.urlopen(url, context=client_ctx) as resp:
+                resp.read()
+
+        pool = HTTPSConnectionPool(url, context=client_ctx)
+
+        def pooled_connection():
+            pool.request("GET", url)
+
+        fresh = timed("new connection per call", calls, fresh_connection)
+        pooled = timed("keep-alive pool", calls, pooled_connection)
+        print("%-28s %8.2f ms/call" % ("saved", (fresh - pooled) * 1000))
+        pool.close()
+        server.shutdown()
+    finally:
+        shutil.rmtree(tmpdir)
+
+
+if __name__ == "__main__":
+    main()
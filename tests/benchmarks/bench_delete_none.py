@@ -0,0 +1,111 @@
+#!/usr/bin/env python
+"""
+CPU time of deleteNone on a large set of access rules (conditions with many
+operands, a third of the values None), comparing the former recursive version,
+which rebuilt every list, with the in-place stack based one. Also prunes a
+deeply nested condition tree that the recursive version cannot handle.
+
+    PYTHONPATH=<dir containing ansible_collections> python tests/benchmarks/bench_delete_none.py [rules] [conditions] [operands]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import copy
+import sys
+import time
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    deleteNone,
+)
+
+DEPTH = 5000
+
+
+def legacyDeleteNone(_dict):
+    if isinstance(_dict, dict):
+        for key, value in list(_dict.items()):
+            if isinstance(value, (list, dict, tuple, set)):
+                _dict[key] = legacyDeleteNone(value)
+            elif value is None or key is None:
+                del _dict[key]
+    elif isinstance(_dict, (list, set, tuple)):
+        _dict = type(_dict)(
+            legacyDeleteNone(item) for item in _dict if item is not None
+        )
+    return _dict
+
+
+def rules(count, conditions, operands):
+    return [
+        {
+            "id": str(216196257331300000 + i),
+            "name": "rule-%d" % i,
+            "description": None,
+            "action": "ALLOW",
+            "rule_order": str(i + 1),
+            "custom_msg": None,
+            "app_server_groups": [],
+            "conditions": [
+                {
+                    "id": str(216196257331310000 + c),
+                    "modified_time": None,
+                    "operator": "OR",
+                    "negated": False,
+                    "operands": [
+                        {
+                            "id": str(216196257331320000 + o),
+                            "object_type": "APP",
+                            "lhs": "id",
+                            "rhs": str(216196257331280000 + o),
+                            "name": None,
+                            "idp_id": None,
+                        }
+                        for o in range(operands)
+                    ],
+                }
+                for c in range(conditions)
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def nested(depth):
+    obj = leaf = {}
+    for dummy in range(depth):
+        leaf["operands"] = [{"rhs": None, "lhs": "id"}]
+        leaf = leaf["operands"][0]
+    return obj
+
+
+def timed(label, func, obj):
+    start = time.process_time()
+    try:
+        func(obj)
+    except RecursionError:
+        print("%-30s RecursionError" % label)
+        return
+    print("%-30s %8.1f ms" % (label, (time.process_time() - start) * 1000))
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    conditions = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    operands = int(sys.argv[3]) if len(sys.argv) > 3 else 20
+    data = rules(count, conditions, operands)
+    print("%d rules x %d conditions x %d operands" % (count, conditions, operands))
+    timed("legacy recursive", legacyDeleteNone, copy.deepcopy(data))
+    timed("in place, stack based", deleteNone, copy.deepcopy(data))
+    # prune again an already clean structure, as repeated decorator calls do
+    clean = deleteNone(copy.deepcopy(data))
+    timed("legacy recursive, clean", legacyDeleteNone, clean)
+    timed("in place, clean", deleteNone, clean)
+    print("condition tree %d levels deep" % DEPTH)
+    timed("legacy recursive", legacyDeleteNone, nested(DEPTH))
+    timed("in place, stack based", deleteNone, nested(DEPTH))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python
+"""
+Time camelCase <-> snake_case key conversion over a 10k application segment
+payload: the former per-key re.sub / split-capitalize-join functions against
+the cached key translation, shallow (per entity, as mapListJSONToList does)
+and recursive (whole payload in one pass).
+
+    PYTHONPATH=<dir containing ansible_collections> python tests/benchmarks/bench_key_conversion.py [apps]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import re
+import sys
+import time
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    camelcaseToSnakeCase,
+    snakecaseToCamelcase,
+)
+
+
+def legacyCamelcaseToSnakeCase(obj):
+    new_obj = dict()
+    for key, value in obj.items():
+        if value is not None:
+            new_obj[re.sub(r"(?<!^)(?=[A-Z])", "_", key).lower()] = value
+    return new_obj
+
+
+def legacySnakecaseToCamelcase(obj):
+    new_obj = dict()
+    for key, value in obj.items():
+        if value is not None:
+            newKey = "".join(x.capitalize() or "_" for x in key.split("_"))
+            newKey = newKey[:1].lower() + newKey[1:]
+            new_obj[newKey] = value
+    return new_obj
+
+
+def legacyRecursive(obj, convert):
+    if isinstance(obj, dict):
+        return convert(dict((k, legacyRecursive(v, convert)) for k, v in obj.items()))
+    if isinstance(obj, list):
+        return [legacyRecursive(v, convert) for v in obj]
+    return obj
+
+
+def applications(count):
+    return [
+        {
+            "id": str(216196257331280000 + i),
+            "name": "app-segment-%d" % i,
+            "description": "Application segment %d" % i,
+            "enabled": True,
+            "doubleEncrypt": False,
+            "bypassType": "NEVER",
+            "healthCheckType": "DEFAULT",
+            "healthReporting": "ON_ACCESS",
+            "icmpAccessType": "NONE",
+            "ipAnchored": False,
+            "isCnameEnabled": True,
+            "passiveHealthEnabled": True,
+            "domainNames": ["app%d.example.com" % i],
+            "tcpPortRanges": ["443", "443"],
+            "segmentGroupId": "216196257331291000",
+            "segmentGroupName": "Example",
+            "creationTime": "1640000000",
+            "modifiedBy": "216196257331282000",
+            "modifiedTime": "1650000000",
+            "defaultIdleTimeout": None,
+            "serverGroups": [
+                {
+                    "id": str(216196257331290000 + i),
+                    "name": "sg-%d" % i,
+                    "configSpace": "DEFAULT",
+                    "dynamicDiscovery": True,
+                    "enabled": True,
+                }
+            ],
+        }
+        for i in range(count)
+    ]
+
+
+def timed(label, func, *args):
+    start = time.process_time()
+    result = func(*args)
+    print("%-42s %8.1f ms" % (label, (time.process_time() - start) * 1000))
+    return result
+
+
+def shallow(apps, convert):
+    out = []
+    for app in apps:
+        app = convert(app)
+        app["server_groups"] = [convert(sg) for sg in app.get("server_groups", [])]
+        out.append(app)
+    return out
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    apps = applications(count)
+    print("%d applications" % count)
+    timed("legacy camel->snake, per entity", shallow, apps, legacyCamelcaseToSnakeCase)
+    timed("cached camel->snake, per entity", shallow, apps, camelcaseToSnakeCase)
+    snake = timed(
+        "legacy camel->snake, recursive",
+        legacyRecursive,
+        apps,
+        legacyCamelcaseToSnakeCase,
+    )
+    timed(
+        "cached camel->snake, recursive single pass",
+        camelcaseToSnakeCase,
+        {"list": apps},
+        True,
+    )
+    timed(
+        "legacy snake->camel, recursive",
+        legacyRecursive,
+        snake,
+        legacySnakecaseToCamelcase,
+    )
+    timed(
+        "cached snake->camel, recursive single pass",
+        snakecaseToCamelcase,
+        {"list": snake},
+        True,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python
+"""
+Wall time of validating the conditions of one access rule whose operands all need
+a single object lookup, against a fake tenant answering each GET after a fixed
+latency, with one worker (the former serial walk) and with a worker pool.
+
+    PYTHONPATH=<dir containing ansible_collections> python tests/benchmarks/bench_operand_validation.py [operands] [latency ms] [workers]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+import time
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_access_rule import (
+    PolicyAccessRuleService,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_validation import (
+    validateRuleConditions,
+)
+
+
+class Response:
+    status_code = 200
+
+
+class Module:
+    def fail_json(self, msg, **kwargs):
+        raise Exception(msg)
+
+
+class LatentTenant:
+    def __init__(self, latency, groups):
+        self.baseurl = "https://bench"
+        self.latency = latency
+        self.groups = groups
+        self.calls = 0
+
+    def get(self, url):
+        self.calls += 1
+        time.sleep(self.latency)
+        return Response()
+
+    def iter_paginated_data(self, base_url=None, data_key_name=None):
+        # the SCIM groups of the IdP, 500 per page
+        for i in range(self.groups):
+            if i % 500 == 0:
+                self.calls += 1
+                time.sleep(self.latency)
+            yield {"id": "g%d" % i}
+
+
+def conditions(operands):
+    # one IdP referenced by SCIM groups, looked up one by one as long as the size of
+    # its directory is unknown
+    return [
+        {"operands": [{"objectType": "SCIM_GROUP", "lhs": "idp", "rhs": "g%d" % i}]}
+        for i in range(operands)
+    ]
+
+
+def measure(label, operands, latency, workers):
+    tenant = LatentTenant(latency, operands)
+    service = PolicyAccessRuleService(Module(), "bench", tenant)
+    start = time.time()
+    check = validateRuleConditions(service, conditions(operands), max_workers=workers)
+    elapsed = time.time() - start
+    assert check is True
+    print("%-22s %8.1f ms %4d requests" % (label, elapsed * 1000, tenant.calls))
+
+
+def main():
+    operands = int(sys.argv[1]) if len(sys.argv) > 1 else 19
+    latency = float(sys.argv[2]) / 1000.0 if len(sys.argv) > 2 else 0.05
+    workers = int(sys.argv[3]) if len(sys.argv) > 3 else 32
+    print("%d operands, %.0f ms per request" % (operands, latency * 1000))
+    measure("serial", operands, latency, 1)
+    measure("%d workers" % workers, operands, latency, workers)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+#!/usr/bin/env python
+"""
+Per-page CPU time spent decoding a 500 item collection page, comparing the
+former Response (json.loads on every .json access) with the memoized one,
+using the stdlib json module and orjson when it is installed.
+
+    PYTHONPATH=<dir containing ansible_collections> python tests/benchmarks/bench_response_json.py [pages]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import io
+import json
+import sys
+import time
+
+from ansible.module_utils._text import to_text
+from ansible_collections.willguibr.zpacloud.plugins.module_utils import zpa_client
+
+# .json reads per page in the former send() + get_paginated_data() path
+ACCESSES_PER_PAGE = 7
+
+
+class LegacyResponse(object):
+    """Response as it was before decoding was memoized"""
+
+    def __init__(self, resp, info):
+        self.body = None
+        if resp:
+            self.body = resp.read()
+        self.info = info
+
+    @property
+    def json(self):
+        if not self.body:
+            if "body" in self.info:
+                return json.loads(to_text(self.info.get("body")))
+            return None
+        try:
+            return json.loads(to_text(self.body))
+        except ValueError:
+            return None
+
+
+def page_body(items=500):
+    apps = [
+        {
+            "id": str(216196257331280000 + i),
+            "name": "app-segment-%d" % i,
+            "description": "Application segment %d" % i,
+            "enabled": True,
+            "domainNames": ["app%d.example.com" % i, "app%d.internal" % i],
+            "tcpPortRanges": ["80", "80", "443", "443"],
+            "serverGroups": [{"id": str(216196257331290000 + i), "name": "sg-%d" % i}],
+            "segmentGroupId": "216196257331291000",
+            "segmentGroupName": "Example",
+            "healthReporting": "ON_ACCESS",
+            "creationTime": "1640000000",
+            "modifiedTime": "1650000000",
+        }
+        for i in range(items)
+    ]
+    return json.dumps({"totalPages": "1", "list": apps}).encode("utf-8")
+
+
+def run(response_class, body, pages):
+    start = time.process_time()
+    for dummy in range(pages):
+        response = response_class(io.BytesIO(body), {"status": 200})
+        for dummy in range(ACCESSES_PER_PAGE):
+            response.json
+    return (time.process_time() - start) / pages * 1000
+
+
+def main():
+    pages = int(sys.argv[1]) if len(sys.argv) > 1 else 50
+    body = page_body()
+    print(
+        "page size: %d bytes, %d .json reads per page" % (len(body), ACCESSES_PER_PAGE)
+    )
+    print("legacy Response, json:     %.2f ms/page" % run(LegacyResponse, body, pages))
+    has_orjson = zpa_client.HAS_ORJSON
+    zpa_client.HAS_ORJSON = False
+    print(
+        "memoized Response, json:   %.2f ms/page"
+        % run(zpa_client.Response, body, pages)
+    )
+    zpa_client.HAS_ORJSON = has_orjson
+    if has_orjson:
+        print(
+            "memoized Response, orjson: %.2f ms/page"
+            % run(zpa_client.Response, body, pages)
+        )
+    else:
+        print("orjson not installed")
+
+
+if __name__ == "__main__":
+    main()
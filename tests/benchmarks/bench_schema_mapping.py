@@ -0,0 +1,249 @@
+#!/usr/bin/env python
+"""
+Convert a synthetic tenant dump (application segments and access rules with
+conditions) in both directions with the former hand-written mappers followed by
+deleteNone and with the declarative schemas, reporting CPU time and the peak
+memory allocated while converting.
+
+    PYTHONPATH=<dir containing ansible_collections> python tests/benchmarks/bench_schema_mapping.py [apps] [rules]
+"""
+
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import sys
+import time
+import tracemalloc
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_application_segment import (
+    APPLICATION_SEGMENT,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    camelcaseToSnakeCase,
+    deleteNone,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_access_rule import (
+    ACCESS_RULE,
+)
+
+APP_FIELDS = [
+    ("tcp_port_range", "tcpPortRange"),
+    ("enabled", "enabled"),
+    ("bypass_type", "bypassType"),
+    ("udp_port_range", "udpPortRange"),
+    ("config_space", "configSpace"),
+    ("health_reporting", "healthReporting"),
+    ("segment_group_id", "segmentGroupId"),
+    ("double_encrypt", "doubleEncrypt"),
+    ("health_check_type", "healthCheckType"),
+    ("is_cname_enabled", "isCnameEnabled"),
+    ("passive_health_enabled", "passiveHealthEnabled"),
+    ("ip_anchored", "ipAnchored"),
+    ("name", "name"),
+    ("description", "description"),
+    ("icmp_access_type", "icmpAccessType"),
+    ("creation_time", "creationTime"),
+    ("modifiedby", "modifiedBy"),
+    ("id", "id"),
+    ("segment_group_name", "segmentGroupName"),
+    ("domain_names", "domainNames"),
+    ("default_idle_timeout", "defaultIdleTimeout"),
+    ("default_max_age", "defaultMaxAge"),
+]
+
+RULE_FIELDS = [
+    ("default_rule", "defaultRule"),
+    ("description", "description"),
+    ("policy_type", "policyType"),
+    ("custom_msg", "customMsg"),
+    ("policy_set_id", "policySetId"),
+    ("id", "id"),
+    ("lss_default_rule", "lssDefaultRule"),
+    ("action_id", "actionId"),
+    ("name", "name"),
+    ("action", "action"),
+    ("priority", "priority"),
+    ("operator", "operator"),
+    ("rule_order", "ruleOrder"),
+]
+
+
+def legacyEntities(entities):
+    if entities is None:
+        return []
+    return [camelcaseToSnakeCase(e) for e in entities]
+
+
+def legacyRefs(entities):
+    if entities is None:
+        return []
+    return [dict(id=e.get("id")) for e in entities]
+
+
+def legacyAppFromJSON(resp_json):
+    app = dict((name, resp_json.get(key)) for name, key in APP_FIELDS)
+    app["server_groups"] = legacyEntities(resp_json.get("serverGroups"))
+    app["clientless_apps"] = legacyEntities(resp_json.get("clientlessApps"))
+    return deleteNone(app)
+
+
+def legacyAppToJSON(app):
+    resp_json = dict((key, app.get(name)) for name, key in APP_FIELDS)
+    resp_json["serverGroups"] = legacyRefs(app.get("server_groups"))
+    return deleteNone(resp_json)
+
+
+def legacyRuleFromJSON(resp_json):
+    rule = dict((name, resp_json.get(key)) for name, key in RULE_FIELDS)
+    rule["default_rule_name"] = resp_json.get("defaultRuleName")
+    rule["app_connector_groups"] = legacyEntities(resp_json.get("appConnectorGroups"))
+    rule["app_server_groups"] = legacyEntities(resp_json.get("appServerGroups"))
+    rule["conditions"] = [
+        {
+            "id": cond.get("id"),
+            "modified_time": cond.get("modifiedTime"),
+            "creation_time": cond.get("creationTime"),
+            "modified_by": cond.get("modifiedBy"),
+            "operator": cond.get("operator"),
+            "negated": cond.get("negated"),
+            "operands": [
+                {
+                    "id": op.get("id"),
+                    "creation_time": op.get("creationTime"),
+                    "modified_by": op.get("modifiedBy"),
+                    "object_type": op.get("objectType"),
+                    "lhs": op.get("lhs"),
+                    "rhs": op.get("rhs"),
+                    "name": op.get("name"),
+                    "idp_id": op.get("idpId"),
+                }
+                for op in cond.get("operands")
+            ],
+        }
+        for cond in resp_json.get("conditions") or []
+    ]
+    return deleteNone(rule)
+
+
+def legacyRuleToJSON(rule):
+    resp_json = dict((key, rule.get(name)) for name, key in RULE_FIELDS)
+    resp_json["appConnectorGroups"] = legacyRefs(rule.get("app_connector_groups"))
+    resp_json["appServerGroups"] = legacyRefs(rule.get("app_server_groups"))
+    resp_json["conditions"] = [
+        {
+            "operator": cond.get("operator"),
+            "negated": cond.get("negated"),
+            "operands": [
+                {
+                    "objectType": op.get("object_type"),
+                    "lhs": op.get("lhs"),
+                    "rhs": op.get("rhs"),
+                    "name": op.get("name"),
+                    "idpId": op.get("idp_id"),
+                }
+                for op in cond.get("operands")
+            ],
+        }
+        for cond in rule.get("conditions") or []
+    ]
+    return deleteNone(resp_json)
+
+
+def tenant(apps, rules):
+    segments = [
+        {
+            "id": str(216196257331280000 + i),
+            "name": "app-segment-%d" % i,
+            "description": None,
+            "enabled": True,
+            "doubleEncrypt": False,
+            "bypassType": "NEVER",
+            "healthReporting": "ON_ACCESS",
+            "domainNames": ["app%d.example.com" % i],
+            "tcpPortRange": [{"from": "443", "to": "443"}],
+            "udpPortRange": None,
+            "segmentGroupId": "216196257331291000",
+            "segmentGroupName": "Example",
+            "creationTime": "1640000000",
+            "modifiedBy": "216196257331282000",
+            "defaultIdleTimeout": None,
+            "serverGroups": [
+                {
+                    "id": str(216196257331290000 + i),
+                    "name": "sg-%d" % i,
+                    "configSpace": "DEFAULT",
+                    "description": None,
+                }
+            ],
+        }
+        for i in range(apps)
+    ]
+    access_rules = [
+        {
+            "id": str(216196257331300000 + i),
+            "name": "rule-%d" % i,
+            "description": None,
+            "action": "ALLOW",
+            "ruleOrder": str(i + 1),
+            "policySetId": "216196257331281000",
+            "policyType": "1",
+            "customMsg": None,
+            "appConnectorGroups": None,
+            "appServerGroups": None,
+            "conditions": [
+                {
+                    "id": str(216196257331310000 + i * 2 + c),
+                    "operator": "OR",
+                    "negated": False,
+                    "modifiedTime": None,
+                    "operands": [
+                        {
+                            "id": str(216196257331320000 + i * 8 + c * 4 + o),
+                            "objectType": "APP",
+                            "lhs": "id",
+                            "rhs": str(216196257331280000 + o),
+                            "name": None,
+                            "idpId": None,
+                        }
+                        for o in range(4)
+                    ],
+                }
+                for c in range(2)
+            ],
+        }
+        for i in range(rules)
+    ]
+    return segments, access_rules
+
+
+def measure(label, convert, items):
+    tracemalloc.start()
+    start = time.process_time()
+    result = [convert(item) for item in items]
+    elapsed = time.process_time() - start
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    print("%-34s %8.1f ms %8.1f KiB peak" % (label, elapsed * 1000, peak / 1024.0))
+    return result
+
+
+def main():
+    apps = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rules = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    segments, access_rules = tenant(apps, rules)
+    print("%d application segments, %d access rules" % (apps, rules))
+    for label, items, old_read, old_write, schema in (
+        ("segments", segments, legacyAppFromJSON, legacyAppToJSON, APPLICATION_SEGMENT),
+        ("rules", access_rules, legacyRuleFromJSON, legacyRuleToJSON, ACCESS_RULE),
+    ):
+        old = measure("legacy %s fromJSON" % label, old_read, items)
+        new = measure("schema %s fromJSON" % label, schema.fromJSON, items)
+        assert old == new
+        old = measure("legacy %s toJSON" % label, old_write, new)
+        new = measure("schema %s toJSON" % label, schema.toJSON, new)
+        assert old == new
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible.inventory.data import InventoryData
+from ansible.parsing.dataloader import DataLoader
+from ansible.template import Templar
+from ansible_collections.willguibr.zpacloud.plugins.inventory import zpa
+
+try:
+    from ansible.template import trust_as_template
+except ImportError:
+    # ansible-core < 2.19 does not tag templates
+
+    def trust_as_template(value):
+        return value
+
+
+OPTIONS = {
+    "include": ["app_connectors", "service_edges"],
+    "ansible_host": "private_ip",
+    "strict": False,
+    "compose": {},
+    "groups": {},
+    "keyed_groups": [
+        {"key": trust_as_template("current_version"), "prefix": "version"}
+    ],
+    "leading_separator": True,
+    "use_extra_vars": False,
+    "cache": True,
+    "client_id": "id",
+    "client_secret": "secret",
+    "customer_id": "c1",
+}
+
+RESULTS = {
+    "app_connectors": [
+        {
+            "name": "connector-1",
+            "app_connector_group_name": "DC East",
+            "private_ip": "10.0.0.1",
+            "public_ip": "1.2.3.4",
+            "current_version": "21.1",
+        },
+        {"name": "connector-2", "app_connector_group_name": "DC West"},
+    ],
+    "service_edge_groups": [
+        {
+            "id": "7",
+            "name": "Edges",
+            "service_edges": [{"name": "edge-1", "private_ip": "10.1.0.1"}],
+        }
+    ],
+}
+
+
+def plugin(options=None):
+    inventory = zpa.InventoryModule()
+    inventory.inventory = InventoryData()
+    inventory.templar = Templar(loader=DataLoader())
+    opts = dict(OPTIONS, **(options or {}))
+    inventory.get_option = MagicMock(side_effect=opts.get)
+    return inventory
+
+
+class TestInventory(unittest.TestCase):
+    def test_groups_and_host_vars(self):
+        inventory = plugin()
+        inventory.populate(RESULTS)
+        data = inventory.inventory
+        self.assertEqual(
+            sorted(h.name for h in data.groups["app_connectors"].get_hosts()),
+            ["connector-1", "connector-2"],
+        )
+        self.assertEqual(
+            [h.name for h in data.groups["DC_East"].get_hosts()], ["connector-1"]
+        )
+        self.assertIn(
+            data.groups["DC_East"], data.groups["app_connectors"].child_groups
+        )
+        host = data.get_host("connector-1")
+        self.assertEqual(host.vars["ansible_host"], "10.0.0.1")
+        self.assertEqual(host.vars["public_ip"], "1.2.3.4")
+        edge = data.get_host("edge-1")
+        self.assertEqual(edge.vars["service_edge_group_name"], "Edges")
+        self.assertIn("Edges", data.groups)
+        self.assertIn(host, data.groups["version_21_1"].get_hosts())
+
+    def test_fetch_shares_one_client(self):
+        inventory = plugin({"include": ["app_connectors", "service_edges"]})
+        with patch.object(zpa, "sharedClient") as helper, patch.object(
+            zpa, "AppConnectorControllerService"
+        ) as connectors, patch.object(zpa, "ServiceEdgeGroupService") as edges:
+            connectors.return_value.getAll.return_value = RESULTS["app_connectors"]
+            edges.return_value.getAll.return_value = RESULTS["service_edge_groups"]
+            self.assertEqual(inventory.fetch(), RESULTS)
+        helper.assert_called_once()
+        self.assertIs(connectors.call_args[0][2], helper.return_value)
+        self.assertIs(edges.call_args[0][2], helper.return_value)
+
+    def test_parse_uses_the_inventory_cache(self):
+        inventory = plugin()
+        inventory._read_config_data = MagicMock()
+        inventory.get_cache_key = MagicMock(return_value="key")
+        inventory._cache = {"key": RESULTS}
+        inventory.fetch = MagicMock()
+        with patch.object(zpa.BaseInventoryPlugin, "parse"):
+            inventory.parse(inventory.inventory, None, "zpa.yml", cache=True)
+        inventory.fetch.assert_not_called()
+        self.assertIsNotNone(inventory.inventory.get_host("edge-1"))
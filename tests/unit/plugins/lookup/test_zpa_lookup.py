@@ -0,0 +1,72 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import patch
+
+import yaml
+from ansible.constants import config
+from ansible.errors import AnsibleError
+from ansible_collections.willguibr.zpacloud.plugins.lookup import zpa_lookup
+
+CREDENTIALS = {"client_id": "id", "client_secret": "secret", "customer_id": "c1"}
+
+
+class TestLookup(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        # the options are registered by the plugin loader when run by Ansible
+        config.initialize_plugin_configuration_definitions(
+            "lookup",
+            zpa_lookup.LookupModule.NAME,
+            yaml.safe_load(zpa_lookup.DOCUMENTATION)["options"],
+        )
+
+    def run_lookup(self, terms, resolved, **kwargs):
+        lookup = zpa_lookup.LookupModule()
+        lookup._load_name = zpa_lookup.LookupModule.NAME
+        with patch.object(zpa_lookup, "sharedClient"), patch.object(
+            zpa_lookup, "ObjectIndex"
+        ) as index:
+            index.return_value.resolveNames.return_value = resolved
+            values = lookup.run(terms, {}, **dict(CREDENTIALS, **kwargs))
+        return values, index
+
+    def test_terms_are_resolved_in_one_batch(self):
+        values, index = self.run_lookup(
+            ["segment_group:Apps", "scim_group:Okta/Eng/Ops", "idp:Okta"],
+            [{"id": "1"}, {"id": "2"}, {"id": "3"}],
+        )
+        self.assertEqual(values, ["1", "2", "3"])
+        index.return_value.resolveNames.assert_called_once_with(
+            [
+                ("segment_group", "Apps", None),
+                ("scim_group", "Eng/Ops", "Okta"),
+                ("idp", "Okta", None),
+            ]
+        )
+        self.assertIs(index.call_args[1]["memo"], zpa_lookup.MEMO)
+
+    def test_resource_and_field_options(self):
+        values, index = self.run_lookup(
+            ["CrowdStrike"],
+            [{"id": "1", "postureUdid": "udid-1"}],
+            resource="posture",
+            field="postureUdid",
+        )
+        self.assertEqual(values, ["udid-1"])
+
+    def test_errors(self):
+        with self.assertRaises(AnsibleError):
+            self.run_lookup(["segment_group:Missing"], [None])
+        values, index = self.run_lookup(
+            ["segment_group:Missing"], [None], errors="ignore"
+        )
+        self.assertEqual(values, [None])
+        with self.assertRaises(AnsibleError):
+            self.run_lookup(["Missing"], [None], resource="scim_group")
+        with self.assertRaises(AnsibleError):
+            self.run_lookup(
+                ["Apps"], [None], resource="segment_group", field="networkId"
+            )
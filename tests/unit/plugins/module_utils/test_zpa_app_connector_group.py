@@ -38,11 +38,12 @@ class TestAppConnectorGroupService(unittest.TestCase):
     def test_get_by_name_when_ok(self):
         module = MagicMock()
         rest = MagicMock()
-        rest.get_paginated_data = MagicMock()
-        rest.get_paginated_data.return_value = [
-            {"name": "bar1", "id": "test1", "connectors": [{"someField": "value1"}]},
-            {"name": "bar2", "id": "test2", "connectors": [{"someField": "value2"}]},
-        ]
+        rest.find_by_name = MagicMock()
+        rest.find_by_name.return_value = {
+            "name": "bar2",
+            "id": "test2",
+            "connectors": [{"someField": "value2"}],
+        }
         k = AppConnectorGroupService(module, "", rest)
         self.assertEqual(
             k.getByName("bar2"),
@@ -54,6 +55,7 @@ class TestAppConnectorGroupService(unittest.TestCase):
         rest = MagicMock()
         rest.get = MagicMock()
         rest.get.return_value.status_code = 400
+        rest.find_by_name = MagicMock(return_value=None)
         k = AppConnectorGroupService(module, "", rest)
         self.assertIsNone(k.getByName("test"))
 
@@ -33,21 +33,13 @@ class TestApplicationSegmentService(unittest.TestCase):
     def test_get_by_name_when_ok(self):
         module = MagicMock()
         rest = MagicMock()
-        rest.get_paginated_data = MagicMock()
-        rest.get_paginated_data.return_value = [
-            {
-                "name": "bar1",
-                "id": "test1",
-                "server_groups": [],
-                "clientless_apps": []
-            },
-            {
-                "name": "bar2",
-                "id": "test2",
-                "server_groups": [],
-                "clientless_apps": []
-            }
-        ]
+        rest.find_by_name = MagicMock()
+        rest.find_by_name.return_value = {
+            "name": "bar2",
+            "id": "test2",
+            "server_groups": [],
+            "clientless_apps": []
+        }
         k = ApplicationSegmentService(module, "", rest)
         self.assertEqual(k.getByName("bar2"), {
             "name": "bar2",
@@ -62,6 +54,7 @@ class TestApplicationSegmentService(unittest.TestCase):
         rest = MagicMock()
         rest.get = MagicMock()
         rest.get.return_value.status_code = 400
+        rest.find_by_name = MagicMock(return_value=None)
         k = ApplicationSegmentService(module, "", rest)
         self.assertIsNone(k.getByName("test"))
 
@@ -0,0 +1,363 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import gc
+import io
+import re
+import unittest
+import weakref
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils import zpa_client
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    Response,
+    ZPAClientHelper,
+    camelcaseToSnakeCase,
+    deleteNone,
+    sharedClient,
+    snakecaseToCamelcase,
+    writtenObject,
+)
+
+
+def page_response(status_code, json):
+    response = MagicMock()
+    response.status_code = status_code
+    response.json = json
+    return response
+
+
+def paginated_client(pages, failing_page=None):
+    """client whose get() serves the given list of pages (1-based)"""
+    rest = ZPAClientHelper.__new__(ZPAClientHelper)
+    rest.module = MagicMock()
+    rest.module.fail_json.side_effect = SystemExit
+
+    def get(url):
+        page = int(re.search(r"page=(\d+)", url).group(1))
+        if page == failing_page:
+            return page_response(500, {"message": "boom"})
+        return page_response(
+            200, {"totalPages": str(len(pages)), "list": pages[page - 1]}
+        )
+
+    rest.get = MagicMock(side_effect=get)
+    return rest
+
+
+class TestZPAClientHelperPagination(unittest.TestCase):
+    def test_single_page(self):
+        rest = paginated_client([[{"id": "1"}, {"id": "2"}]])
+        self.assertEqual(
+            rest.get_paginated_data(base_url="/x", data_key_name="list"),
+            [{"id": "1"}, {"id": "2"}],
+        )
+        self.assertEqual(rest.get.call_count, 1)
+
+    def test_concurrent_pages_keep_page_order(self):
+        pages = [[{"id": str(p * 10 + i)} for i in range(3)] for p in range(12)]
+        rest = paginated_client(pages)
+        data = rest.get_paginated_data(
+            base_url="/x", data_key_name="list", max_workers=4
+        )
+        self.assertEqual(data, [item for page in pages for item in page])
+        self.assertEqual(rest.get.call_count, 12)
+
+    def test_sequential_pages(self):
+        pages = [[{"id": "1"}], [{"id": "2"}], [{"id": "3"}]]
+        rest = paginated_client(pages)
+        data = rest.get_paginated_data(
+            base_url="/x", data_key_name="list", max_workers=1
+        )
+        self.assertEqual(data, [{"id": "1"}, {"id": "2"}, {"id": "3"}])
+
+    def test_fails_on_first_non_200(self):
+        pages = [[{"id": str(p)}] for p in range(6)]
+        rest = paginated_client(pages, failing_page=3)
+        with self.assertRaises(SystemExit):
+            rest.get_paginated_data(base_url="/x", data_key_name="list")
+        rest.module.fail_json.assert_called_once_with(
+            msg="Failed to fetch list from /x due to error : boom"
+        )
+
+    def test_failure_in_a_worker_is_reported_once_by_the_caller(self):
+        pages = [[{"id": str(p)}] for p in range(6)]
+        rest = paginated_client(pages)
+        get = rest.get.side_effect
+        threads = []
+
+        def failing_get(url):
+            if "page=1&" not in url:
+                threads.append(zpa_client.threading.current_thread())
+                zpa_client.failJson(rest.module, "sign-in failed")
+            return get(url)
+
+        rest.get.side_effect = failing_get
+        with self.assertRaises(SystemExit):
+            rest.get_paginated_data(base_url="/x", data_key_name="list")
+        rest.module.fail_json.assert_called_once_with(msg="sign-in failed")
+        self.assertNotIn(zpa_client.threading.main_thread(), threads)
+
+    def test_run_concurrently(self):
+        module = MagicMock()
+        module.fail_json.side_effect = SystemExit
+
+        def fail(msg):
+            zpa_client.failJson(module, msg)
+
+        calls = [(str, (i,)) for i in range(5)]
+        self.assertEqual(
+            zpa_client.runConcurrently(module, calls, 3), ["0", "1", "2", "3", "4"]
+        )
+        with self.assertRaises(SystemExit):
+            zpa_client.runConcurrently(module, calls + [(fail, ("boom",))] * 2, 3)
+        module.fail_json.assert_called_once_with(msg="boom")
+        with self.assertRaises(zpa_client.WorkerFailure):
+            zpa_client.runConcurrently(None, calls + [(fail, ("boom",))], 3)
+
+    def test_empty_collection(self):
+        rest = ZPAClientHelper.__new__(ZPAClientHelper)
+        rest.module = MagicMock()
+        rest.get = MagicMock(return_value=page_response(200, {"totalPages": "0"}))
+        self.assertEqual(
+            rest.get_paginated_data(base_url="/x", data_key_name="list"), []
+        )
+
+    def test_iter_yields_every_page(self):
+        pages = [[{"id": "1"}, {"id": "2"}], [{"id": "3"}], [{"id": "4"}]]
+        rest = paginated_client(pages)
+        self.assertEqual(
+            list(rest.iter_paginated_data(base_url="/x", data_key_name="list")),
+            [{"id": "1"}, {"id": "2"}, {"id": "3"}, {"id": "4"}],
+        )
+
+    def test_iter_stops_fetching_when_caller_stops(self):
+        pages = [[{"id": "1"}], [{"id": "2"}], [{"id": "3"}]]
+        rest = paginated_client(pages)
+        for item in rest.iter_paginated_data(base_url="/x", data_key_name="list"):
+            if item["id"] == "2":
+                break
+        self.assertEqual(rest.get.call_count, 2)
+
+
+def search_client(names, honors_search=True):
+    """client whose get() serves one page per request, filtering on search when honored"""
+    rest = ZPAClientHelper.__new__(ZPAClientHelper)
+    rest.module = MagicMock()
+
+    def get(url):
+        search = re.search(r"search=([^&]*)", url)
+        items = [{"id": str(i), "name": n} for i, n in enumerate(names)]
+        if search and honors_search:
+            needle = search.group(1).lower()
+            items = [i for i in items if needle in i["name"].lower()]
+        return page_response(200, {"totalPages": "1", "list": items})
+
+    rest.get = MagicMock(side_effect=get)
+    return rest
+
+
+class TestZPAClientHelperFindByName(unittest.TestCase):
+    def test_search_exact_match(self):
+        rest = search_client(["web", "web-prod", "db"])
+        self.assertEqual(
+            rest.find_by_name(base_url="/x", name="web"), {"id": "0", "name": "web"}
+        )
+        self.assertEqual(rest.get.call_count, 1)
+        self.assertIn("search=web", rest.get.call_args[0][0])
+
+    def test_search_without_exact_match(self):
+        rest = search_client(["web-prod", "db"])
+        self.assertIsNone(rest.find_by_name(base_url="/x", name="web"))
+        self.assertEqual(rest.get.call_count, 1)
+
+    def test_full_scan_when_search_returns_nothing(self):
+        rest = search_client(["db"])
+        self.assertIsNone(rest.find_by_name(base_url="/x", name="web"))
+        self.assertEqual(rest.get.call_count, 2)
+        self.assertNotIn("search=", rest.get.call_args[0][0])
+
+    def test_full_scan_when_search_spans_too_many_pages(self):
+        rest = ZPAClientHelper.__new__(ZPAClientHelper)
+        rest.module = MagicMock()
+
+        def get(url):
+            if "search=" in url:
+                names = ["web-%d" % i for i in range(20)]
+                return page_response(
+                    200, {"totalPages": "40", "list": [{"name": n} for n in names]}
+                )
+            return page_response(
+                200, {"totalPages": "1", "list": [{"id": "1", "name": "web"}]}
+            )
+
+        rest.get = MagicMock(side_effect=get)
+        self.assertEqual(
+            rest.find_by_name(base_url="/x", name="web"), {"id": "1", "name": "web"}
+        )
+        self.assertEqual(rest.get.call_count, 2)
+
+    def test_full_scan_when_search_is_ignored(self):
+        rest = search_client(["db", "web"], honors_search=False)
+        self.assertEqual(
+            rest.find_by_name(base_url="/x", name="web"), {"id": "1", "name": "web"}
+        )
+
+
+class TestResponse(unittest.TestCase):
+    def test_json_is_decoded_once(self):
+        response = Response(io.BytesIO(b'{"list": [{"id": "1"}]}'), {"status": 200})
+        with patch.object(
+            zpa_client, "json_loads", wraps=zpa_client.json_loads
+        ) as json_loads:
+            self.assertEqual(response.json, {"list": [{"id": "1"}]})
+            self.assertIs(response.json, response.json)
+        json_loads.assert_called_once()
+
+    def test_error_body(self):
+        response = Response(None, {"status": 404, "body": b'{"message": "gone"}'})
+        self.assertEqual(response.json, {"message": "gone"})
+
+    def test_undecodable_body(self):
+        self.assertIsNone(Response(io.BytesIO(b"<html>"), {"status": 200}).json)
+        self.assertIsNone(Response(None, {"status": 502, "body": b"<html>"}).json)
+        self.assertIsNone(Response(None, {"status": -1}).json)
+
+
+class TestKeyConversion(unittest.TestCase):
+    def test_shallow_conversion_drops_none(self):
+        self.assertEqual(
+            camelcaseToSnakeCase(
+                {"appConnectorGroups": [{"appId": "1"}], "ipACL": "x", "id": None}
+            ),
+            {"app_connector_groups": [{"appId": "1"}], "ip_a_c_l": "x"},
+        )
+        self.assertEqual(
+            snakecaseToCamelcase({"tcp_keep_alive_enabled": "1", "name": None}),
+            {"tcpKeepAliveEnabled": "1"},
+        )
+
+    def test_recursive_conversion(self):
+        obj = {
+            "serverGroups": [{"appServerGroupIds": ["1"], "configSpace": None}],
+            "policyRule": {"conditions": [{"operands": [{"objectType": "APP"}]}]},
+        }
+        snake = camelcaseToSnakeCase(obj, recursive=True)
+        self.assertEqual(
+            snake,
+            {
+                "server_groups": [{"app_server_group_ids": ["1"]}],
+                "policy_rule": {"conditions": [{"operands": [{"object_type": "APP"}]}]},
+            },
+        )
+        self.assertEqual(
+            snakecaseToCamelcase(snake, recursive=True),
+            {
+                "serverGroups": [{"appServerGroupIds": ["1"]}],
+                "policyRule": {"conditions": [{"operands": [{"objectType": "APP"}]}]},
+            },
+        )
+
+
+class TestDeleteNone(unittest.TestCase):
+    def test_prunes_in_place(self):
+        conditions = [{"id": None, "operands": [None, {"lhs": "id", "rhs": None}]}]
+        obj = {"name": "rule", "description": None, "conditions": conditions}
+        self.assertIs(deleteNone(obj), obj)
+        self.assertIs(obj["conditions"], conditions)
+        self.assertEqual(
+            obj, {"name": "rule", "conditions": [{"operands": [{"lhs": "id"}]}]}
+        )
+
+    def test_tuples_and_sets(self):
+        self.assertEqual(
+            deleteNone({"a": (None, {"b": None}, (1, None)), "c": {None, 2}}),
+            {"a": ({}, (1,)), "c": {2}},
+        )
+        self.assertEqual(deleteNone((None, [None])), ([],))
+
+    def test_deep_nesting(self):
+        obj = leaf = {}
+        for dummy in range(10000):
+            leaf["operands"] = [{"rhs": None}]
+            leaf = leaf["operands"][0]
+        deleteNone(obj)
+        self.assertEqual(leaf, {})
+
+
+class TestWrittenObject(unittest.TestCase):
+    def client(self, trust=True):
+        rest = MagicMock()
+        rest.trust_write_response = trust
+        return rest
+
+    def test_off_by_default(self):
+        response = page_response(201, {"id": "1", "name": "web"})
+        self.assertIsNone(writtenObject(MagicMock(), response, {"name": "web"}))
+        self.assertIsNone(writtenObject(self.client(False), response, {}))
+
+    def test_response_laid_over_payload(self):
+        response = page_response(201, {"id": "1", "modifiedTime": "2"})
+        self.assertEqual(
+            writtenObject(self.client(), response, {"name": "web", "enabled": True}),
+            {"id": "1", "modifiedTime": "2", "name": "web", "enabled": True},
+        )
+
+    def test_empty_body_falls_back_to_payload(self):
+        response = page_response(204, None)
+        self.assertEqual(
+            writtenObject(self.client(), response, {"id": "1", "name": "web"}),
+            {"id": "1", "name": "web"},
+        )
+
+    def test_incomplete_result(self):
+        self.assertIsNone(
+            writtenObject(self.client(), page_response(204, None), {"name": "web"})
+        )
+        self.assertIsNone(
+            writtenObject(
+                self.client(),
+                page_response(204, None),
+                {"id": "1"},
+                required=("id", "provisioningKey"),
+            )
+        )
+
+
+class TestSharedClient(unittest.TestCase):
+    def module(self, client_id="id"):
+        module = MagicMock()
+        module.params = {
+            "client_id": client_id,
+            "client_secret": "secret",
+            "customer_id": "c1",
+        }
+        return module
+
+    def test_one_client_per_module_and_credentials(self):
+        module = self.module()
+        with patch.object(zpa_client, "ZPAClientHelper") as helper:
+            helper.side_effect = lambda module: MagicMock()
+            client = sharedClient(module)
+            self.assertIs(sharedClient(module), client)
+            self.assertIsNot(sharedClient(self.module()), client)
+            module.params["client_id"] = "other"
+            self.assertIsNot(sharedClient(module), client)
+        self.assertEqual(helper.call_count, 3)
+
+    def test_clients_go_away_with_the_module(self):
+        class Module:
+            params = {"client_id": "id", "client_secret": "secret", "customer_id": "c1"}
+
+        class Client:
+            def __init__(self, module):
+                self.module = module
+
+        module = Module()
+        with patch.object(zpa_client, "ZPAClientHelper", Client):
+            client = weakref.ref(sharedClient(module))
+        module = weakref.ref(module)
+        gc.collect()
+        self.assertIsNone(module())
+        self.assertIsNone(client())
@@ -0,0 +1,144 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import MagicMock
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_application_segment import (
+    ApplicationSegmentService,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_compare import (
+    isEquivalent,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_segment_group import (
+    SegmentGroupService,
+)
+
+
+class TestCompare(unittest.TestCase):
+    def test_scalars_are_normalized(self):
+        self.assertTrue(
+            isEquivalent(
+                {"enabled": True, "defaultIdleTimeout": 900},
+                {"enabled": "true", "defaultIdleTimeout": "900"},
+            )
+        )
+        self.assertFalse(isEquivalent({"enabled": False}, {"enabled": True}))
+
+    def test_reference_lists_ignore_order(self):
+        self.assertTrue(
+            isEquivalent(
+                {"serverGroups": [{"id": "2"}, {"id": "1"}]},
+                {"serverGroups": [{"id": "1", "name": "a"}, {"id": "2", "name": "b"}]},
+            )
+        )
+        self.assertFalse(
+            isEquivalent(
+                {"serverGroups": [{"id": "1"}]},
+                {"serverGroups": [{"id": "1"}, {"id": "2"}]},
+            )
+        )
+
+    def test_value_lists_keep_order(self):
+        self.assertFalse(
+            isEquivalent(
+                {"tcpPortRange": ["80", "80", "443", "443"]},
+                {"tcpPortRange": ["443", "443", "80", "80"]},
+            )
+        )
+
+    def test_empty_values_and_extra_fields(self):
+        self.assertTrue(
+            isEquivalent(
+                {"name": "a", "applications": []},
+                {"name": "a", "creationTime": "1", "modifiedBy": "x"},
+            )
+        )
+        self.assertFalse(isEquivalent({"applications": []}, {"applications": [{}]}))
+
+    def test_unset_options_keep_the_values_of_zpa(self):
+        self.assertTrue(isEquivalent({"description": ""}, {"description": "old"}))
+        self.assertTrue(isEquivalent({"description": None}, {"description": "old"}))
+        self.assertFalse(isEquivalent({"description": "new"}, {"description": "old"}))
+
+    def test_application_segment_defaults_are_idempotent(self):
+        service = ApplicationSegmentService(MagicMock(), "", MagicMock())
+        # ZPA fills in the timeouts the module leaves to their "" default
+        existing = service.mapRespJSONToApp(
+            {
+                "id": "1",
+                "name": "app",
+                "enabled": True,
+                "defaultIdleTimeout": "900",
+                "defaultMaxAge": "600",
+                "bypassType": "NEVER",
+                "domainNames": ["app.example.com"],
+                "serverGroups": [{"id": "10", "name": "sg"}],
+            }
+        )
+        desired = dict(existing)
+        desired.update(
+            {
+                "name": "app",
+                "enabled": True,
+                "default_idle_timeout": "",
+                "default_max_age": "",
+                "bypass_type": "NEVER",
+                "description": None,
+                "domain_names": ["app.example.com"],
+                "server_groups": [{"id": "10"}],
+            }
+        )
+        self.assertTrue(
+            isEquivalent(service.mapAppToJSON(desired), service.mapAppToJSON(existing))
+        )
+        desired["default_idle_timeout"] = "300"
+        self.assertFalse(
+            isEquivalent(service.mapAppToJSON(desired), service.mapAppToJSON(existing))
+        )
+
+    def test_nested_conditions(self):
+        existing = {
+            "conditions": [
+                {
+                    "operator": "OR",
+                    "operands": [
+                        {"objectType": "APP", "lhs": "id", "rhs": "1", "name": "a"}
+                    ],
+                }
+            ]
+        }
+        desired = {
+            "conditions": [
+                {
+                    "operator": "OR",
+                    "operands": [{"objectType": "APP", "lhs": "id", "rhs": "1"}],
+                }
+            ]
+        }
+        self.assertTrue(isEquivalent(desired, existing))
+        desired["conditions"][0]["operands"][0]["rhs"] = "2"
+        self.assertFalse(isEquivalent(desired, existing))
+
+    def test_service_round_trip(self):
+        service = SegmentGroupService(MagicMock(), "", MagicMock())
+        existing = service.mapRespJSONToApp(
+            {
+                "id": "1",
+                "name": "sg",
+                "enabled": True,
+                "applications": [{"id": "10", "name": "a"}, {"id": "11", "name": "b"}],
+            }
+        )
+        desired = dict(existing)
+        desired.update(
+            {
+                "name": "sg",
+                "enabled": True,
+                "applications": [{"id": "11"}, {"id": "10"}],
+            }
+        )
+        self.assertTrue(
+            isEquivalent(service.mapAppToJSON(desired), service.mapAppToJSON(existing))
+        )
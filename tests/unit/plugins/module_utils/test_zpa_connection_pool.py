@@ -0,0 +1,169 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import http.client as http_client
+import socket
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_connection_pool import (
+    HTTPSConnectionPool,
+)
+
+URL = "https://config.private.zscaler.com/mgmtconfig/v1/admin/customers/1/segmentGroup"
+
+
+def http_response(status=200, body=b'{"id": "1"}', reason="OK", will_close=False):
+    resp = MagicMock()
+    resp.status = status
+    resp.reason = reason
+    resp.will_close = will_close
+    resp.read.return_value = body
+    resp.getheaders.return_value = [("Content-Type", "application/json")]
+    return resp
+
+
+def connection(*outcomes):
+    """HTTPSConnection stand-in whose requests answer, or raise, the given outcomes"""
+    conn = MagicMock()
+    conn.sock = MagicMock()
+    outcomes = list(outcomes)
+
+    def request(*args, **kwargs):
+        if isinstance(outcomes[0], Exception):
+            raise outcomes.pop(0)
+
+    conn.request.side_effect = request
+    conn.getresponse.side_effect = lambda: outcomes.pop(0)
+    return conn
+
+
+def pool_of(*connections, **kwargs):
+    pool = HTTPSConnectionPool("https://config.private.zscaler.com", **kwargs)
+    pool._new_conn = MagicMock(side_effect=list(connections))
+    return pool
+
+
+class TestHTTPSConnectionPool(unittest.TestCase):
+    def test_response_and_info_mirror_fetch_url(self):
+        conn = connection(http_response())
+        pool = pool_of(conn)
+        resp, info = pool.request(
+            "POST", URL + "?page=1", data='{"name": "web"}', headers={"A": "b"}
+        )
+        self.assertEqual(resp.read(), b'{"id": "1"}')
+        self.assertEqual(info["status"], 200)
+        self.assertEqual(info["content-type"], "application/json")
+        self.assertEqual(info["url"], URL + "?page=1")
+        method, path = conn.request.call_args[0]
+        self.assertEqual(
+            (method, path),
+            ("POST", "/mgmtconfig/v1/admin/customers/1/segmentGroup?page=1"),
+        )
+        self.assertEqual(conn.request.call_args[1]["body"], b'{"name": "web"}')
+        self.assertIn("User-Agent", conn.request.call_args[1]["headers"])
+
+    def test_connection_is_reused(self):
+        conn = connection(http_response(), http_response())
+        pool = pool_of(conn)
+        pool.request("GET", URL)
+        pool.request("GET", URL)
+        pool._new_conn.assert_called_once()
+        self.assertEqual(conn.request.call_count, 2)
+        conn.close.assert_not_called()
+
+    def test_stale_reused_connection_is_retried_on_a_fresh_one(self):
+        stale = connection(http_response(), ConnectionResetError("reset"))
+        fresh = connection(http_response(body=b"{}"))
+        pool = pool_of(stale, fresh)
+        pool.request("GET", URL)
+        resp, info = pool.request("GET", URL)
+        self.assertEqual(resp.read(), b"{}")
+        stale.close.assert_called_once()
+        self.assertEqual(pool._new_conn.call_count, 2)
+        self.assertEqual(pool._idle, [fresh])
+
+    def test_write_is_retried_only_when_it_was_not_sent(self):
+        unsent = connection(http_response(), BrokenPipeError("broken pipe"))
+        fresh = connection(http_response(body=b"{}"))
+        pool = pool_of(unsent, fresh)
+        pool.request("GET", URL)
+        resp, info = pool.request("POST", URL, data="{}")
+        self.assertEqual(resp.read(), b"{}")
+        self.assertEqual(pool._new_conn.call_count, 2)
+
+        conn = connection(http_response(), http_response())
+        conn.getresponse.side_effect = [
+            http_response(),
+            http_client.BadStatusLine(""),
+        ]
+        pool = pool_of(conn)
+        pool.request("GET", URL)
+        resp, info = pool.request("PUT", URL, data="{}")
+        self.assertIsNone(resp)
+        self.assertEqual(info["status"], -1)
+        self.assertEqual(conn.request.call_count, 2)
+        pool._new_conn.assert_called_once()
+
+    def test_failure_on_a_fresh_connection_is_not_retried(self):
+        conn = connection(http_client.BadStatusLine(""))
+        pool = pool_of(conn)
+        resp, info = pool.request("GET", URL)
+        self.assertIsNone(resp)
+        self.assertEqual(info["status"], -1)
+        self.assertTrue(info["msg"].startswith("Request failed"))
+        conn.close.assert_called_once()
+        pool._new_conn.assert_called_once()
+        self.assertEqual(pool._idle, [])
+
+    def test_timeout(self):
+        conn = connection(socket.timeout("timed out"))
+        resp, info = pool_of(conn).request("GET", URL)
+        self.assertIsNone(resp)
+        self.assertEqual(info["status"], -1)
+        conn.close.assert_called_once()
+
+    def test_http_error_keeps_the_body(self):
+        conn = connection(
+            http_response(404, b'{"message": "gone"}', reason="Not Found")
+        )
+        pool = pool_of(conn)
+        resp, info = pool.request("GET", URL)
+        self.assertIsNone(resp)
+        self.assertEqual(info["status"], 404)
+        self.assertEqual(info["msg"], "HTTP Error 404: Not Found")
+        self.assertEqual(info["body"], b'{"message": "gone"}')
+        self.assertEqual(pool._idle, [conn])
+
+    def test_closed_by_server_is_not_pooled(self):
+        conn = connection(http_response(will_close=True))
+        pool = pool_of(conn)
+        pool.request("GET", URL)
+        conn.close.assert_called_once()
+        self.assertEqual(pool._idle, [])
+
+    def test_idle_connections_are_bounded(self):
+        pool = pool_of(maxsize=1)
+        first, second = MagicMock(), MagicMock()
+        pool._put_conn(first)
+        pool._put_conn(second)
+        self.assertEqual(pool._idle, [first])
+        second.close.assert_called_once()
+        pool.close()
+        first.close.assert_called_once()
+        self.assertEqual(pool._idle, [])
+
+    def test_handles_only_its_host(self):
+        pool = HTTPSConnectionPool("https://config.private.zscaler.com")
+        self.assertTrue(pool.handles(URL))
+        self.assertFalse(pool.handles("https://other.zscaler.com/x"))
+        self.assertFalse(pool.handles("http://config.private.zscaler.com/x"))
+
+    def test_new_connections_use_the_pool_settings(self):
+        pool = HTTPSConnectionPool("https://config.private.zscaler.com:8443")
+        with patch.object(http_client, "HTTPSConnection") as https:
+            pool._new_conn(30)
+        https.assert_called_once_with(
+            "config.private.zscaler.com", 8443, timeout=30, context=pool.context
+        )
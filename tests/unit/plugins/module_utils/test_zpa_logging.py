@@ -0,0 +1,97 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import io
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    Response,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_logging import (
+    RequestLogger,
+    redact,
+    redactAndTruncate,
+)
+
+
+class Unformattable:
+    def __str__(self):
+        raise AssertionError("formatted while the level is disabled")
+
+
+class TestRequestLogger(unittest.TestCase):
+    def setUp(self):
+        self.tmp_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.tmp_dir)
+
+    def test_redact(self):
+        self.assertEqual(
+            redact('{"access_token":"eyJhbGciOi","expires_in":"3600"}'),
+            '{"access_token":"********","expires_in":"3600"}',
+        )
+        self.assertEqual(
+            redact("client_id=abc&client_secret=s3cr3t"),
+            "client_id=abc&client_secret=********",
+        )
+        self.assertEqual(
+            redact("{'Authorization': 'Bearer eyJhbGciOi'}"),
+            "{'Authorization': 'Bearer ********'}",
+        )
+
+    def test_redact_and_truncate(self):
+        self.assertEqual(redactAndTruncate(b"0123456789", 4), "0123... (6 more)")
+        self.assertEqual(redactAndTruncate("0123", 4), "0123")
+        self.assertEqual(redactAndTruncate("0123", -1), "0123")
+        # a secret crossing the cut is redacted before the body is cut
+        self.assertEqual(
+            redactAndTruncate('{"access_token":"eyJhbGciOi"}', 20),
+            '{"access_token":"***... (9 more)',
+        )
+
+    def test_disabled_level_does_not_format(self):
+        module = MagicMock()
+        logger = RequestLogger(module, level="warn")
+        logger.info("%s", Unformattable())
+        module.log.assert_not_called()
+        logger.warn("token cache unavailable: %s", "boom")
+        module.log.assert_called_once_with("[WARN] token cache unavailable: boom")
+
+    def test_bodies_are_logged_at_debug_only(self):
+        response = Response(
+            io.BytesIO(b'{"access_token":"secret","list":[]}'), {"status": 200}
+        )
+        module = MagicMock()
+        RequestLogger(module, level="info").request(
+            "POST", "https://x/signin", "client_secret=s", response, 0.0123
+        )
+        module.log.assert_called_once_with(
+            "[INFO] POST https://x/signin -> 200 (35 bytes, 12.3 ms)"
+        )
+        module = MagicMock()
+        RequestLogger(module, level="debug", max_body=20).request(
+            "POST", "https://x/signin", "client_secret=s", response, 0.0123
+        )
+        msg = module.log.call_args[0][0]
+        self.assertNotIn("secret", msg.replace("client_secret", ""))
+        self.assertIn("(15 more)", msg)
+
+    def test_timing_lines(self):
+        path = os.path.join(self.tmp_dir, "timing.jsonl")
+        logger = RequestLogger(MagicMock(), level="off", timing_file=path)
+        response = Response(None, {"status": 404, "body": b'{"id":"x"}'})
+        logger.request("GET", "https://x/mgmtconfig/v1/app?page=1", None, response, 0.5)
+        with open(path) as f:
+            line = json.loads(f.readline())
+        self.assertEqual(line["method"], "GET")
+        self.assertEqual(line["path"], "/mgmtconfig/v1/app")
+        self.assertEqual(line["status"], 404)
+        self.assertEqual(line["bytes"], 10)
+        self.assertEqual(line["ms"], 500.0)
@@ -0,0 +1,231 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import gc
+import shutil
+import tempfile
+import unittest
+import weakref
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils import (
+    zpa_posture_profile,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    failJson,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_object_index import (
+    ObjectIndex,
+    sharedIndex,
+)
+
+SEGMENT_GROUPS = "/mgmtconfig/v1/admin/customers/c1/segmentGroup"
+POSTURES = "/mgmtconfig/v2/admin/customers/c1/posture"
+IDPS = "/mgmtconfig/v2/admin/customers/c1/idp"
+GROUPS = "/userconfig/v1/customers/c1/scimgroup/idpId/%s"
+
+COLLECTIONS = {
+    SEGMENT_GROUPS: [{"id": "10", "name": "Apps"}, {"id": "11", "name": "Web"}],
+    IDPS: [{"id": "20", "name": "Okta"}, {"id": "21", "name": "Azure"}],
+    GROUPS
+    % "20": [
+        {"id": "30", "name": "Engineering", "idpGroupId": "eng"},
+        {"id": "31", "name": "Finance", "idpGroupId": "fin"},
+    ],
+    GROUPS % "21": [{"id": "32", "name": "Sales"}],
+    POSTURES: [
+        {"id": "40", "name": "CrowdStrike", "postureUdid": "udid-1", "domain": "x"},
+        {"id": "41", "name": "Defender", "postureUdid": "udid-2", "domain": "x"},
+    ],
+}
+
+
+class FakeTenant:
+    """rest client streaming collections from a {url: items} dict"""
+
+    def __init__(self, existing_ids=()):
+        self.baseurl = "https://x"
+        self.collections = dict(
+            (url, list(items)) for url, items in COLLECTIONS.items()
+        )
+        self.existing_ids = existing_ids
+        self.iter_paginated_data = MagicMock(side_effect=self.stream)
+        self.get = MagicMock(side_effect=self.get_one)
+
+    def stream(self, base_url=None, data_key_name=None):
+        for item in self.collections.get(base_url, []):
+            yield dict(item)
+
+    def get_one(self, url):
+        response = MagicMock()
+        response.status_code = (
+            200 if url.rsplit("/", 1)[-1] in self.existing_ids else 404
+        )
+        response.json = {"id": url.rsplit("/", 1)[-1]}
+        return response
+
+    def urls(self):
+        return sorted(c[1]["base_url"] for c in self.iter_paginated_data.call_args_list)
+
+
+class TestObjectIndex(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.tenant = FakeTenant()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def index(self, tenant=None, ttl=0, memo=None):
+        return ObjectIndex(
+            tenant or self.tenant, "c1", ttl=ttl, cache_dir=self.cache_dir, memo=memo
+        )
+
+    def test_names_are_resolved_from_one_fetch_per_collection(self):
+        results = self.index().resolveNames(
+            [
+                ("segment_group", "Apps", None),
+                ("segment_group", "Web", None),
+                ("scim_group", "Engineering", "Okta"),
+                ("idp", "Okta", None),
+                ("posture", "CrowdStrike", None),
+                ("segment_group", "Missing", None),
+                ("scim_group", "Engineering", "Missing"),
+            ]
+        )
+        self.assertEqual(
+            [r and r["id"] for r in results], ["10", "11", "30", "20", "40", None, None]
+        )
+        self.assertEqual(results[4]["postureUdid"], "udid-1")
+        # only the attributes other resources refer to are kept
+        self.assertNotIn("domain", results[4])
+        self.assertEqual(
+            self.tenant.urls(), sorted([SEGMENT_GROUPS, IDPS, POSTURES, GROUPS % "20"])
+        )
+
+    def test_memo_is_shared_between_instances(self):
+        memo = {}
+        self.index(memo=memo).resolveNames([("segment_group", "Apps", None)])
+        self.index(memo=memo).resolveNames([("segment_group", "Web", None)])
+        self.assertEqual(self.tenant.iter_paginated_data.call_count, 1)
+
+    def test_persisted_collection_is_refreshed_on_miss(self):
+        self.index(ttl=60).resolveNames([("segment_group", "Apps", None)])
+        index = self.index(ttl=60)
+        self.assertEqual(index.get("segment_group", "name", "Web")["id"], "11")
+        self.assertEqual(self.tenant.iter_paginated_data.call_count, 1)
+        self.tenant.collections[SEGMENT_GROUPS].append({"id": "12", "name": "New"})
+        self.assertEqual(index.get("segment_group", "name", "New")["id"], "12")
+        self.assertEqual(self.tenant.iter_paginated_data.call_count, 2)
+
+    def test_items_keeps_only_the_wanted_objects(self):
+        index = self.index()
+        found = index.items("scim_group", "name", ["Finance", "Missing"], scope="20")
+        self.assertEqual(
+            found, {"Finance": {"id": "31", "name": "Finance", "idpGroupId": "fin"}}
+        )
+        # the pass also indexed every group of the IdP
+        self.assertEqual(
+            index.get("scim_group", "name", "Engineering", "20")["id"], "30"
+        )
+        self.assertEqual(self.tenant.iter_paginated_data.call_count, 1)
+
+    def test_all_refreshes_the_index(self):
+        index = self.index()
+        self.assertFalse(index.contains("posture", "postureUdid", "udid-3"))
+        self.tenant.collections[POSTURES].append({"id": "42", "postureUdid": "udid-3"})
+        self.assertFalse(index.contains("posture", "postureUdid", "udid-3"))
+        self.assertEqual(len(index.all("posture")), 3)
+        self.assertTrue(index.contains("posture", "postureUdid", "udid-3"))
+        self.assertEqual(self.tenant.iter_paginated_data.call_count, 2)
+
+    def test_exists_is_resolved_once(self):
+        index = self.index(FakeTenant(existing_ids=["1"]))
+        self.assertTrue(index.exists("application", "1"))
+        self.assertTrue(index.exists("application", "1"))
+        self.assertIsNone(index.exists("application", "2"))
+        self.assertEqual(index.rest.get.call_count, 2)
+
+    def test_collection_only_kind_is_fetched_once(self):
+        index = self.index()
+        self.assertTrue(index.exists("posture", "udid-1"))
+        self.assertTrue(index.exists("posture", "udid-2"))
+        self.assertIsNone(index.exists("posture", "udid-3"))
+        self.assertEqual(self.tenant.iter_paginated_data.call_count, 1)
+
+    def test_resolve_gets_each_value_when_the_collection_size_is_unknown(self):
+        ids = [str(i) for i in range(10)]
+        tenant = FakeTenant(existing_ids=ids)
+        index = self.index(tenant)
+        index.resolve([("segment_group", id) for id in ids], max_workers=4)
+        for id in ids:
+            self.assertTrue(index.exists("segment_group", id))
+        self.assertEqual(tenant.get.call_count, 10)
+        tenant.iter_paginated_data.assert_not_called()
+
+    def test_resolve_uses_the_collection_known_to_be_smaller(self):
+        ids = [str(i) for i in range(10)]
+        tenant = FakeTenant(existing_ids=ids)
+        tenant.collections[SEGMENT_GROUPS] = [{"id": id} for id in ids]
+        with patch("time.time", return_value=0):
+            self.index(tenant, ttl=60).records("segment_group")
+        # expired, but its single page is cheaper than two GETs
+        index = self.index(tenant, ttl=60)
+        self.assertEqual(index.fetchCost("segment_group"), 1)
+        index.resolve([("segment_group", id) for id in ids[:1]], max_workers=4)
+        index.resolve([("segment_group", id) for id in ids[1:]], max_workers=4)
+        for id in ids:
+            self.assertTrue(index.exists("segment_group", id))
+        self.assertEqual(tenant.get.call_count, 1)
+        self.assertEqual(tenant.iter_paginated_data.call_count, 2)
+
+    def test_persisted_collection_is_reused_and_rechecked_on_miss(self):
+        self.index(ttl=300).exists("posture", "udid-1")
+        tenant = FakeTenant()
+        tenant.collections[POSTURES].append({"id": "42", "postureUdid": "udid-3"})
+        index = self.index(tenant, ttl=300)
+        self.assertTrue(index.exists("posture", "udid-2"))
+        tenant.iter_paginated_data.assert_not_called()
+        self.assertTrue(index.exists("posture", "udid-3"))
+        self.assertEqual(tenant.iter_paginated_data.call_count, 1)
+
+    def test_failed_concurrent_fetch_is_reported_once(self):
+        self.tenant.module = MagicMock()
+        self.tenant.module.fail_json.side_effect = SystemExit
+
+        def fail(base_url=None, data_key_name=None):
+            failJson(self.tenant.module, "Failed to fetch list from %s" % base_url)
+
+        self.tenant.iter_paginated_data.side_effect = fail
+        with self.assertRaises(SystemExit):
+            self.index().prefetch([("segment_group", None), ("posture", None)])
+        self.tenant.module.fail_json.assert_called_once()
+
+
+class TestSharedIndex(unittest.TestCase):
+    def test_index_is_shared_by_services_using_the_same_client(self):
+        tenant = FakeTenant(existing_ids=["40"])
+        with patch.object(zpa_posture_profile, "sharedClient", return_value=tenant):
+            service = zpa_posture_profile.PostureProfileService(MagicMock(), "c1")
+        self.assertIs(service.index, sharedIndex(tenant, "c1"))
+        self.assertIsNot(service.index, sharedIndex(FakeTenant(), "c1"))
+        self.assertEqual(len(service.getAll()), 2)
+        self.assertEqual(service.getByUDID("udid-1")["id"], "40")
+        self.assertIsNone(service.getByUDID("udid-3"))
+        self.assertTrue(service.index.exists("posture", "udid-2"))
+        self.assertEqual(tenant.iter_paginated_data.call_count, 1)
+
+    def test_shared_indexes_go_away_with_the_client(self):
+        class Client:
+            def iter_paginated_data(self, base_url, data_key_name):
+                return iter(COLLECTIONS[POSTURES])
+
+        rest = Client()
+        index = weakref.ref(sharedIndex(rest, "c1"))
+        self.assertIs(index(), sharedIndex(rest, "c1"))
+        self.assertTrue(index().exists("posture", "udid-1"))
+        rest = weakref.ref(rest)
+        gc.collect()
+        self.assertIsNone(rest())
+        self.assertIsNone(index())
@@ -43,23 +43,14 @@ class TestPolicyAccessRuleService(unittest.TestCase):
     def test_get_by_name_when_ok(self):
         module = MagicMock()
         rest = MagicMock()
-        rest.get_paginated_data = MagicMock()
-        rest.get_paginated_data.return_value = [
-            {
-                "name": "bar1",
-                "id": "test1",
-                "app_connector_groups": [],
-                "conditions": [],
-                "app_server_groups": []
-            },
-            {
-                "name": "bar2",
-                "id": "test2",
-                "app_connector_groups": [],
-                "conditions": [],
-                "app_server_groups": []
-            }
-        ]
+        rest.find_by_name = MagicMock()
+        rest.find_by_name.return_value = {
+            "name": "bar2",
+            "id": "test2",
+            "app_connector_groups": [],
+            "conditions": [],
+            "app_server_groups": []
+        }
         k = PolicyAccessRuleService(module, "", rest)
         self.assertEqual(k.getByNameAndType("bar2", ""), {
             "name": "bar2",
@@ -75,6 +66,7 @@ class TestPolicyAccessRuleService(unittest.TestCase):
         rest = MagicMock()
         rest.get = MagicMock()
         rest.get.return_value.status_code = 400
+        rest.find_by_name = MagicMock(return_value=None)
         k = PolicyAccessRuleService(module, "", rest)
         self.assertIsNone(k.getByNameAndType("test", ""))
 
@@ -152,3 +144,21 @@ class TestPolicyAccessRuleService(unittest.TestCase):
         rest.put.return_value.status_code = 400
         k = PolicyAccessRuleService(module, "", rest)
         self.assertIsNone(k.update({"name": "bar", "id": "test"}, "1"))
+
+    def test_create_without_validation(self):
+        obj = {"name": "bar", "id": "test", "conditions": []}
+        module = MagicMock()
+        module.fail_json.side_effect = SystemExit
+        rest = MagicMock()
+        rest.post.return_value.status_code = 200
+        rest.put.return_value.status_code = 200
+        rest.get.return_value.status_code = 200
+        rest.get.return_value.json = {"name": "bar", "id": "test", "conditions": []}
+        k = PolicyAccessRuleService(module, "", rest)
+        k.validateConditions = MagicMock(return_value="[WARN] invalid\n")
+        self.assertEqual(k.create(obj, "1", validate=False)["id"], "test")
+        self.assertEqual(k.update(obj, "1", validate=False)["id"], "test")
+        k.validateConditions.assert_not_called()
+        with self.assertRaises(SystemExit):
+            k.create(obj, "1")
+        rest.post.assert_called_once()
@@ -0,0 +1,85 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import random
+import unittest
+from unittest.mock import MagicMock
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_access_rule import (
+    PolicyAccessRuleService,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_reorder import (
+    currentOrder,
+    longestIncreasingSubsequence,
+    planMoves,
+    targetOrder,
+)
+
+
+def apply_moves(current, moves):
+    order = list(current)
+    for rule_id, position in moves:
+        order.remove(rule_id)
+        order.insert(position - 1, rule_id)
+    return order
+
+
+class TestPolicyReorder(unittest.TestCase):
+    def test_current_order_sorts_by_rule_order(self):
+        rules = [
+            {"id": "b", "rule_order": "2"},
+            {"id": "c", "rule_order": "10"},
+            {"id": "a", "rule_order": "1"},
+        ]
+        self.assertEqual(currentOrder(rules), ["a", "b", "c"])
+
+    def test_target_order_pins_listed_rules(self):
+        current = ["a", "b", "c", "d", "e"]
+        self.assertEqual(
+            targetOrder(current, {"e": "1", "a": 3}), ["e", "b", "a", "c", "d"]
+        )
+        # taken and out of range orders fall back to the next free slot
+        self.assertEqual(
+            targetOrder(current, {"c": 2, "d": 2, "a": 99}),
+            ["b", "c", "d", "e", "a"],
+        )
+
+    def test_no_moves_when_already_ordered(self):
+        current = ["a", "b", "c"]
+        self.assertEqual(planMoves(current, list(current)), [])
+
+    def test_single_move(self):
+        current = ["a", "b", "c", "d"]
+        target = ["d", "a", "b", "c"]
+        self.assertEqual(planMoves(current, target), [("d", 1)])
+
+    def test_random_permutations_reach_target_with_minimal_moves(self):
+        rnd = random.Random(1234)
+        for dummy in range(200):
+            n = rnd.randint(0, 40)
+            current = ["r%d" % i for i in range(n)]
+            rnd.shuffle(current)
+            target = list(current)
+            rnd.shuffle(target)
+            moves = planMoves(current, target)
+            self.assertEqual(apply_moves(current, moves), target)
+            position = dict((r, i) for i, r in enumerate(target))
+            lis = longestIncreasingSubsequence([position[r] for r in current])
+            self.assertEqual(len(moves), n - len(lis))
+
+    def test_reorder_all_skips_refetch(self):
+        rest = MagicMock()
+        rest.get_paginated_data.return_value = [
+            {"id": "a", "ruleOrder": "1"},
+            {"id": "b", "ruleOrder": "2"},
+            {"id": "c", "ruleOrder": "3"},
+        ]
+        rest.put.return_value = MagicMock(status_code=204)
+        service = PolicyAccessRuleService(MagicMock(), "c1", rest)
+        moves = service.reorderAll("ps1", "ACCESS_POLICY", {"c": "1"})
+        self.assertEqual(moves, [("c", 1)])
+        rest.put.assert_called_once_with(
+            "/mgmtconfig/v1/admin/customers/c1/policySet/ps1/rule/c/reorder/1"
+        )
+        rest.get.assert_not_called()
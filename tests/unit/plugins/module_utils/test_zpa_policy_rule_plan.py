@@ -0,0 +1,92 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import MagicMock
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_access_rule import (
+    PolicyAccessRuleService,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_rule_plan import (
+    failedSteps,
+    orderChanged,
+    pinnedOrders,
+    planRules,
+    planSummary,
+    plannedReorders,
+)
+
+EXISTING = [
+    {"id": "1", "name": "web", "action": "ALLOW", "rule_order": "1"},
+    {"id": "2", "name": "ssh", "action": "DENY", "rule_order": "2"},
+    {"id": "3", "name": "old", "action": "DENY", "rule_order": "3"},
+]
+
+
+def plan(rules, existing=EXISTING):
+    service = PolicyAccessRuleService(MagicMock(), "c1", MagicMock())
+    return planRules(service, rules, [dict(rule) for rule in existing])
+
+
+class TestPolicyRulePlan(unittest.TestCase):
+    def test_actions(self):
+        steps = plan(
+            [
+                {"name": "web", "action": "ALLOW"},
+                {"name": "ssh", "action": "ALLOW"},
+                {"name": "old", "state": "absent"},
+                {"name": "new", "action": "ALLOW"},
+                {"name": "gone", "state": "absent"},
+            ]
+        )
+        self.assertEqual(
+            [(action, policy.get("name")) for action, policy, existing in steps],
+            [(None, "web"), ("update", "ssh"), ("delete", "old"), ("create", "new")],
+        )
+        # updates carry the id of the rule they match
+        self.assertEqual(steps[1][1]["id"], "2")
+        self.assertEqual(steps[1][2], EXISTING[1])
+        self.assertNotIn("state", steps[3][1])
+        self.assertEqual(planSummary(steps), (["new"], ["ssh"], ["old"]))
+
+    def test_match_by_id_before_name(self):
+        steps = plan([{"id": "2", "name": "ssh-renamed", "action": "DENY"}])
+        action, policy, existing = steps[0]
+        self.assertEqual((action, existing["id"], policy["id"]), ("update", "2", "2"))
+
+    def test_duplicate_names(self):
+        with self.assertRaises(ValueError):
+            plan([{"name": "web"}, {"name": "web", "state": "absent"}])
+
+    def test_order_only_changes_count_as_updates(self):
+        steps = plan(
+            [
+                {"name": "web", "rule_order": "2"},
+                {"name": "ssh", "rule_order": "2"},
+                {"name": "new", "rule_order": ""},
+            ]
+        )
+        self.assertEqual([step[0] for step in steps], [None, None, "create"])
+        self.assertEqual(plannedReorders(steps), [0])
+        self.assertEqual(planSummary(steps), (["new"], ["web"], []))
+
+    def test_order_changed(self):
+        self.assertFalse(orderChanged({"rule_order": "1"}, {"rule_order": None}))
+        self.assertFalse(orderChanged({"rule_order": 1}, {"rule_order": "1"}))
+        self.assertTrue(orderChanged({"rule_order": "1"}, {"rule_order": "3"}))
+        self.assertTrue(orderChanged(None, {"rule_order": "1"}))
+
+    def test_failed_and_pinned_rules(self):
+        steps = plan(
+            [
+                {"name": "web", "rule_order": "3"},
+                {"name": "ssh", "rule_order": "2"},
+                {"name": "old", "state": "absent"},
+                {"name": "new", "action": "ALLOW", "rule_order": "1"},
+                {"name": "other", "action": "ALLOW"},
+            ]
+        )
+        results = [steps[0][2], steps[1][2], steps[2][2], {"id": "4"}, None]
+        self.assertEqual(failedSteps(steps, results), ["other"])
+        self.assertEqual(pinnedOrders(steps, results), {"1": "3", "2": "2", "4": "1"})
@@ -0,0 +1,285 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils import (
+    zpa_policy_forwarding_rule,
+    zpa_policy_timeout_rule,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_object_index import (
+    ObjectIndex,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_access_rule import (
+    PolicyAccessRuleService,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_validation import (
+    ID_OBJECT_TYPES,
+    POLICY_OPERAND_TYPES,
+    conditionsReferences,
+    operandShape,
+    resolveConditions,
+    validateConditionsOffline,
+    validateRuleConditions,
+    validateRulesOffline,
+)
+
+
+class SlowTenant:
+    """rest client answering single object GETs after a delay, tracking concurrency"""
+
+    def __init__(self, existing, delay=0.01):
+        self.baseurl = "https://x"
+        self.existing = existing
+        self.delay = delay
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+        self.calls = 0
+
+    def get(self, url):
+        with self.lock:
+            self.calls += 1
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        time.sleep(self.delay)
+        with self.lock:
+            self.active -= 1
+        response = MagicMock()
+        response.status_code = 200 if url.rsplit("/", 1)[-1] in self.existing else 404
+        return response
+
+    def iter_paginated_data(self, base_url=None, data_key_name=None):
+        raise AssertionError("no collection should be fetched for %s" % base_url)
+
+
+class FakeDirectory:
+    """rest client streaming the SCIM groups of IdP 1, every single object GET succeeds"""
+
+    def __init__(self, groups=30):
+        self.baseurl = "https://x"
+        self.groups = [{"id": str(100 + i), "name": "g%d" % i} for i in range(groups)]
+        self.iter_paginated_data = MagicMock(side_effect=self.stream)
+        self.get = MagicMock()
+        self.get.return_value.status_code = 200
+
+    def stream(self, base_url=None, data_key_name=None):
+        if base_url == "/userconfig/v1/customers/c1/scimgroup/idpId/1":
+            for group in self.groups:
+                yield dict(group)
+
+
+def operand(object_type, lhs, rhs):
+    return {"objectType": object_type, "lhs": lhs, "rhs": rhs}
+
+
+class TestPolicyValidation(unittest.TestCase):
+    def service(self, tenant):
+        return PolicyAccessRuleService(MagicMock(), "c1", tenant)
+
+    def test_references_are_resolved_concurrently(self):
+        existing = set(["idp-1"] + ["g%d" % i for i in range(19)])
+        existing.update(["a%d" % i for i in range(4)] + ["s%d" % i for i in range(4)])
+        tenant = SlowTenant(existing)
+        operands = [operand("SCIM_GROUP", "idp-1", "g%d" % i) for i in range(19)]
+        operands += [operand("APP", "id", "a%d" % i) for i in range(4)]
+        operands += [operand("APP_GROUP", "id", "s%d" % i) for i in range(4)]
+        conditions = [{"operands": operands[:10]}, {"operands": operands[10:]}]
+        self.assertIs(
+            validateRuleConditions(self.service(tenant), conditions, max_workers=8),
+            True,
+        )
+        # every reference is looked up once, several at a time
+        self.assertEqual(tenant.calls, 28)
+        self.assertGreater(tenant.max_active, 1)
+        self.assertLessEqual(tenant.max_active, 8)
+
+    def test_every_invalid_operand_is_reported(self):
+        tenant = SlowTenant(set(["a1"]), delay=0)
+        conditions = [
+            {
+                "operands": [
+                    operand("APP", "id", "a1"),
+                    operand("APP", "id", "missing"),
+                    operand("POSTURE", "", "true"),
+                    operand("TRUSTED_NETWORK", "", "true"),
+                    operand("CLIENT_TYPE", "id", "zpn_client_type_bogus"),
+                    operand("BOGUS", "id", "x"),
+                ]
+            }
+        ]
+        check = self.service(tenant).validateConditions(conditions)
+        self.assertEqual(len(check.splitlines()), 5)
+        self.assertIn('"missing"', check)
+        self.assertIn("TRUSTED_NETWORK", check)
+        self.assertIn("invalid operand object type BOGUS", check)
+
+    def test_single_worker_resolves_serially(self):
+        tenant = SlowTenant(set(["a%d" % i for i in range(4)]), delay=0)
+        conditions = [{"operands": [operand("APP", "id", "a%d" % i) for i in range(4)]}]
+        self.assertIs(
+            validateRuleConditions(self.service(tenant), conditions, max_workers=1),
+            True,
+        )
+        self.assertEqual(tenant.max_active, 1)
+
+
+class TestConditionsReferences(unittest.TestCase):
+    def scim_groups(self, group_ids):
+        return [
+            {
+                "operands": [
+                    operand("SCIM_GROUP", "1", group_id) for group_id in group_ids
+                ]
+            }
+        ]
+
+    def test_conditions_references(self):
+        conditions = [
+            {
+                "operands": [
+                    operand("APP", "id", "1"),
+                    operand("POSTURE", "udid", "true"),
+                    operand("SCIM_GROUP", "idp", "g"),
+                    operand("CLIENT_TYPE", "id", "x"),
+                ]
+            }
+        ]
+        self.assertEqual(
+            conditionsReferences(conditions),
+            [
+                ("application", "1"),
+                ("posture", "udid"),
+                ("idp", "idp"),
+                ("scim_group", "g"),
+            ],
+        )
+
+    def test_bulk_scim_groups_are_checked_against_the_idp_collection(self):
+        directory = FakeDirectory()
+        cache_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, cache_dir)
+        with patch("time.time", return_value=0):
+            ObjectIndex(directory, "c1", ttl=60, cache_dir=cache_dir).records(
+                "scim_group", "1"
+            )
+        # the expired fetch tells the groups of the IdP fit on one page
+        index = ObjectIndex(directory, "c1", ttl=60, cache_dir=cache_dir)
+        group_ids = [str(100 + i) for i in range(25)] + ["999"]
+        resolveConditions(index, self.scim_groups(group_ids))
+        # only the IdP itself is checked with a GET
+        self.assertEqual(directory.get.call_count, 1)
+        self.assertEqual(directory.iter_paginated_data.call_count, 2)
+        self.assertTrue(index.exists("scim_group", "100"))
+        self.assertIsNone(index.exists("scim_group", "999"))
+        self.assertEqual(directory.get.call_count, 1)
+
+    def test_scim_groups_of_unknown_directory_size_are_checked_one_by_one(self):
+        directory = FakeDirectory()
+        group_ids = [str(100 + i) for i in range(25)]
+        resolveConditions(ObjectIndex(directory, "c1"), self.scim_groups(group_ids))
+        directory.iter_paginated_data.assert_not_called()
+        self.assertEqual(directory.get.call_count, 26)
+
+
+class TestOfflineValidation(unittest.TestCase):
+    def test_operand_shape(self):
+        self.assertIs(operandShape(operand("APP", "id", "1")), True)
+        self.assertIn("LHS", operandShape(operand("APP", "name", "1")))
+        self.assertIn("RHS", operandShape(operand("APP_GROUP", "id", "")))
+        self.assertIs(operandShape(operand("POSTURE", "udid", "false")), True)
+        self.assertIn('"true"/"false"', operandShape(operand("POSTURE", "udid", "yes")))
+        self.assertIn("RHS", operandShape(operand("TRUSTED_NETWORK", "net", "false")))
+        self.assertIs(
+            operandShape(
+                operand("CLIENT_TYPE", "id", "zpn_client_type_machine_tunnel")
+            ),
+            True,
+        )
+        # the timeout policy accepts fewer client types and object types
+        self.assertIn(
+            "zpn_client_type_zapp",
+            operandShape(
+                operand("CLIENT_TYPE", "id", "zpn_client_type_machine_tunnel"),
+                "TIMEOUT_POLICY",
+            ),
+        )
+        self.assertIn(
+            "invalid operand object type",
+            operandShape(operand("TRUSTED_NETWORK", "net", "true"), "TIMEOUT_POLICY"),
+        )
+
+    def test_offline_service_validation_makes_no_request(self):
+        tenant = MagicMock()
+        service = PolicyAccessRuleService(MagicMock(), "c1", tenant)
+        conditions = [
+            {
+                "operands": [
+                    operand("APP", "id", "1"),
+                    operand("SCIM_GROUP", "idp", "g"),
+                    operand("POSTURE", "udid", "maybe"),
+                ]
+            }
+        ]
+        check = service.validateConditions(conditions, offline=True)
+        self.assertEqual(check, validateConditionsOffline(conditions))
+        self.assertIn("POSTURE", check)
+        self.assertEqual(tenant.method_calls, [])
+
+    def test_rules_in_module_form(self):
+        rules = [
+            {
+                "name": "ok",
+                "conditions": [
+                    {
+                        "operator": "OR",
+                        "operands": [
+                            {"object_type": "APP", "lhs": "id", "rhs": "1"},
+                            {
+                                "object_type": "TRUSTED_NETWORK",
+                                "lhs": "n",
+                                "rhs": "true",
+                            },
+                        ],
+                    }
+                ],
+            },
+            {
+                "name": "bad",
+                "conditions": [
+                    {"operands": [{"object_type": "SAML", "lhs": "attr", "rhs": None}]}
+                ],
+            },
+        ] * 1000
+        start = time.time()
+        invalid = validateRulesOffline(rules)
+        self.assertLess(time.time() - start, 2)
+        self.assertEqual(list(invalid), ["bad"])
+        self.assertIn("SAML Attribute Value", invalid["bad"])
+
+    def test_api_and_offline_warnings_match(self):
+        tenant = SlowTenant(set(), delay=0)
+        services = [PolicyAccessRuleService(MagicMock(), "c1", tenant)]
+        for module_utils, name in (
+            (zpa_policy_forwarding_rule, "PolicyForwardingRuleService"),
+            (zpa_policy_timeout_rule, "PolicyTimeOutRuleService"),
+        ):
+            with patch.object(module_utils, "sharedClient", return_value=tenant):
+                services.append(getattr(module_utils, name)(MagicMock(), "c1"))
+        for service in services:
+            for object_type in POLICY_OPERAND_TYPES[service.POLICY_TYPE][0]:
+                if object_type in ID_OBJECT_TYPES + ("CLIENT_TYPE",):
+                    malformed = operand(object_type, "id", "")
+                else:
+                    malformed = operand(object_type, "", "x")
+                self.assertEqual(
+                    service.validateOperand(malformed),
+                    operandShape(malformed, service.POLICY_TYPE),
+                )
+        self.assertEqual(tenant.calls, 0)
@@ -0,0 +1,132 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils import zpa_client
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_rate_limit import (
+    RateLimiter,
+    retryAfter,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+        self.slept = []
+
+    def __call__(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.slept.append(seconds)
+        self.now += seconds
+
+
+class TestRateLimiter(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def limiter(self):
+        return RateLimiter(
+            "tenant",
+            limits={"read": (2, 10.0), "write": (1, 10.0)},
+            cache_dir=self.cache_dir,
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+
+    def test_paces_requests_once_the_bucket_is_empty(self):
+        limiter = self.limiter()
+        self.assertEqual(limiter.acquire("GET"), 0)
+        self.assertEqual(limiter.acquire("GET"), 0)
+        self.assertAlmostEqual(limiter.acquire("GET"), 5.0)
+        # writes draw from their own bucket
+        self.assertEqual(limiter.acquire("PUT"), 0)
+        self.assertTrue(limiter.shared)
+
+    def test_state_is_shared_between_limiters(self):
+        self.limiter().acquire("PUT")
+        self.assertAlmostEqual(self.limiter().acquire("POST"), 10.0)
+
+    def test_retry_after_blocks_the_bucket(self):
+        limiter = self.limiter()
+        limiter.update("GET", 429, {"retry-after": "7"})
+        self.assertAlmostEqual(self.limiter().acquire("GET"), 7.0)
+
+    def test_remaining_header_drains_the_bucket(self):
+        limiter = self.limiter()
+        limiter.update(
+            "GET", 200, {"x-ratelimit-remaining": "0", "x-ratelimit-reset": "3"}
+        )
+        self.assertAlmostEqual(limiter.acquire("GET"), 3.0)
+
+    def test_unwritable_cache_dir_falls_back_to_process_buckets(self):
+        limiter = RateLimiter(
+            "tenant",
+            limits={"read": (1, 10.0), "write": (1, 10.0)},
+            cache_dir="/proc/zpa-not-writable",
+            clock=self.clock,
+            sleep=self.clock.sleep,
+        )
+        limiter.acquire("GET")
+        self.assertFalse(limiter.shared)
+        self.assertAlmostEqual(limiter.acquire("GET"), 10.0)
+
+    def test_retry_after_parsing(self):
+        self.assertEqual(retryAfter({"retry-after": "13s"}, now=0), 13)
+        self.assertEqual(retryAfter({"retry-after": "2 seconds"}, now=0), 2)
+        self.assertEqual(
+            retryAfter({"retry-after": "Thu, 01 Jan 1970 00:00:30 GMT"}, now=0), 30
+        )
+        self.assertIsNone(retryAfter({}, now=0))
+        self.assertIsNone(retryAfter({"retry-after": "soon"}, now=0))
+
+
+class Client:
+    def __init__(self, responses):
+        self.module = MagicMock()
+        self.logger = MagicMock()
+        self.responses = list(responses)
+        self.calls = 0
+
+    @zpa_client.retry_with_backoff(retries=3)
+    def send(self):
+        self.calls += 1
+        return self.responses.pop(0)
+
+
+def response(status, headers=None):
+    info = dict(headers or {})
+    info["status"] = status
+    return zpa_client.Response(None, info)
+
+
+class TestRetryWithBackoff(unittest.TestCase):
+    @patch.object(zpa_client.time, "sleep")
+    def test_non_retryable_status_is_returned(self, sleep):
+        client = Client([response(404)])
+        self.assertEqual(client.send().status_code, 404)
+        self.assertEqual(client.calls, 1)
+        sleep.assert_not_called()
+
+    @patch.object(zpa_client.time, "sleep")
+    def test_throttled_request_waits_retry_after(self, sleep):
+        client = Client([response(429, {"retry-after": "4"}), response(200)])
+        self.assertEqual(client.send().status_code, 200)
+        self.assertEqual(client.calls, 2)
+        sleep.assert_called_once_with(4.0)
+
+    @patch.object(zpa_client.time, "sleep")
+    def test_gives_up_after_retries(self, sleep):
+        client = Client([response(503)] * 4)
+        self.assertRaises(Exception, client.send)
+        self.assertEqual(client.calls, 4)
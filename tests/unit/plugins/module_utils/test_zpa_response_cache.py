@@ -0,0 +1,132 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    Response,
+    ZPAClientHelper,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_response_cache import (
+    ResponseCache,
+    parseTTLs,
+    resourceClass,
+    resourceOf,
+)
+
+SERVER_GROUPS = "/mgmtconfig/v1/admin/customers/c1/serverGroup?page=1&pagesize=500"
+CLIENT_TYPES = "/mgmtconfig/v2/admin/lssConfig/clientTypes"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+        self.clock = FakeClock()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def cache(self, customer_id="c1"):
+        return ResponseCache(
+            customer_id,
+            "https://x",
+            ttls=parseTTLs("config=60,static=3600"),
+            cache_dir=self.cache_dir,
+            clock=self.clock,
+        )
+
+    def test_resource_classes(self):
+        self.assertEqual(resourceOf(SERVER_GROUPS), "serverGroup")
+        self.assertEqual(resourceOf(CLIENT_TYPES), "lssConfig")
+        self.assertEqual(resourceClass(CLIENT_TYPES), "static")
+        self.assertEqual(
+            resourceClass(
+                "/mgmtconfig/v2/admin/lssConfig/logType/formats?logType=zpn_auth_log"
+            ),
+            "static",
+        )
+        self.assertEqual(
+            resourceClass("/mgmtconfig/v2/admin/customers/c1/idp?page=1"), "reference"
+        )
+        self.assertEqual(resourceClass(SERVER_GROUPS), "config")
+        self.assertEqual(
+            resourceClass("/mgmtconfig/v2/admin/customers/c1/lssConfig"), "config"
+        )
+
+    def test_entries_expire_with_their_class_ttl(self):
+        cache = self.cache()
+        cache.put(SERVER_GROUPS, 200, b'{"list":[]}')
+        cache.put(CLIENT_TYPES, 200, b'{"zpn_client_type_ip_anchoring":"x"}')
+        self.assertEqual(cache.get(SERVER_GROUPS), (200, b'{"list":[]}'))
+        self.clock.now += 61
+        self.assertIsNone(cache.get(SERVER_GROUPS))
+        self.assertIsNotNone(cache.get(CLIENT_TYPES))
+        # entries are per tenant
+        self.assertIsNone(self.cache("c2").get(CLIENT_TYPES))
+
+    def test_failed_responses_are_not_cached(self):
+        cache = self.cache()
+        cache.put(SERVER_GROUPS, 404, b'{"id":"resource.not.found"}')
+        self.assertIsNone(cache.get(SERVER_GROUPS))
+
+    def test_writes_invalidate_the_resource_and_its_dependents(self):
+        cache = self.cache()
+        segment_groups = "/mgmtconfig/v1/admin/customers/c1/segmentGroup/1"
+        cache.put(SERVER_GROUPS, 200, b"{}")
+        cache.put(segment_groups, 200, b"{}")
+        cache.put(CLIENT_TYPES, 200, b"{}")
+        cache.invalidate("/mgmtconfig/v1/admin/customers/c1/serverGroup/5")
+        self.assertIsNone(cache.get(SERVER_GROUPS))
+        self.assertIsNotNone(cache.get(segment_groups))
+        # an application belongs to segment groups and server groups
+        cache.put(SERVER_GROUPS, 200, b"{}")
+        cache.invalidate("/mgmtconfig/v1/admin/customers/c1/application")
+        self.assertIsNone(cache.get(SERVER_GROUPS))
+        self.assertIsNone(cache.get(segment_groups))
+        self.assertIsNotNone(cache.get(CLIENT_TYPES))
+
+
+class TestClientResponseCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def client(self, cache_reads):
+        rest = ZPAClientHelper.__new__(ZPAClientHelper)
+        rest.logger = MagicMock()
+        rest.cache_reads = cache_reads
+        rest.response_cache = ResponseCache("c1", "https://x", cache_dir=self.cache_dir)
+        rest.send = MagicMock(
+            return_value=Response(None, {"status": 200, "body": b'{"list":[]}'})
+        )
+        rest.send.return_value.body = b'{"list":[]}'
+        return rest
+
+    def test_info_modules_read_through_the_cache(self):
+        rest = self.client(cache_reads=True)
+        self.assertEqual(rest.get(SERVER_GROUPS).json, {"list": []})
+        self.assertEqual(rest.get(SERVER_GROUPS).json, {"list": []})
+        self.assertEqual(rest.send.call_count, 1)
+        rest.put("/mgmtconfig/v1/admin/customers/c1/serverGroup/5", data={})
+        rest.get(SERVER_GROUPS)
+        self.assertEqual(rest.send.call_count, 3)
+
+    def test_other_modules_always_read_the_api(self):
+        rest = self.client(cache_reads=False)
+        rest.get(SERVER_GROUPS)
+        rest.get(SERVER_GROUPS)
+        self.assertEqual(rest.send.call_count, 2)
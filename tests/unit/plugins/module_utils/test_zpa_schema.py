@@ -0,0 +1,179 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import MagicMock
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_access_rule import (
+    PolicyAccessRuleService,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_schema import (
+    ENTITIES,
+    REFERENCES,
+    Field,
+    Schema,
+    pruneNone,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_service_edge_groups import (
+    SERVICE_EDGE_GROUP,
+)
+
+RULE_JSON = {
+    "id": "1",
+    "name": "rule",
+    "description": None,
+    "defaultRuleName": "Default_Rule",
+    "ruleOrder": "2",
+    "action": "ALLOW",
+    "appServerGroups": None,
+    "appConnectorGroups": [
+        {"id": "10", "name": "acg", "cityCountry": None, "connectors": [None, {}]}
+    ],
+    "conditions": [
+        {
+            "id": "20",
+            "operator": "OR",
+            "negated": False,
+            "modifiedTime": None,
+            "operands": [
+                {
+                    "id": "30",
+                    "objectType": "APP",
+                    "lhs": "id",
+                    "rhs": "40",
+                    "idpId": None,
+                }
+            ],
+        }
+    ],
+}
+
+
+class TestSchema(unittest.TestCase):
+    def test_prune_none(self):
+        value = {"a": None, "b": [None, {"c": None, "d": 0}], "e": ({"f": None},)}
+        self.assertEqual(pruneNone(value), {"b": [{"d": 0}], "e": ({},)})
+        # the input is left untouched
+        self.assertEqual(value["b"][1], {"c": None, "d": 0})
+
+    def test_directions_and_kinds(self):
+        schema = Schema(
+            Field("name"),
+            Field("geolocation_id", "geoLocationId"),
+            Field("creation_time", write=False),
+            Field("secret", read=False),
+            Field("apps", kind=ENTITIES),
+            Field("groups", kind=REFERENCES),
+        )
+        self.assertEqual(
+            schema.fromJSON(
+                {
+                    "name": "x",
+                    "geoLocationId": "1",
+                    "creationTime": "2",
+                    "secret": "s",
+                    "apps": [{"appId": "3", "cname": None}],
+                    "groups": [{"id": "4", "configSpace": "DEFAULT"}],
+                }
+            ),
+            {
+                "name": "x",
+                "geolocation_id": "1",
+                "creation_time": "2",
+                "apps": [{"app_id": "3"}],
+                "groups": [{"id": "4", "config_space": "DEFAULT"}],
+            },
+        )
+        self.assertEqual(
+            schema.toJSON(
+                {
+                    "name": None,
+                    "creation_time": "2",
+                    "secret": "s",
+                    "apps": [{"app_id": "3"}],
+                    "groups": [{"id": "4", "name": "g"}, {"name": "h"}],
+                }
+            ),
+            {
+                "secret": "s",
+                "apps": [{"appId": "3"}],
+                "groups": [{"id": "4"}, {}],
+            },
+        )
+        self.assertEqual(schema.fromJSON(None), {})
+        self.assertEqual(schema.toJSON({}), {"apps": [], "groups": []})
+
+    def test_policy_rule_matches_former_mapping(self):
+        service = PolicyAccessRuleService(MagicMock(), "", MagicMock())
+        rule = service.mapRespJSONToPolicy(RULE_JSON)
+        self.assertEqual(
+            rule,
+            {
+                "id": "1",
+                "name": "rule",
+                "default_rule_name": "Default_Rule",
+                "rule_order": "2",
+                "action": "ALLOW",
+                "app_server_groups": [],
+                "app_connector_groups": [
+                    {"id": "10", "name": "acg", "connectors": [{}]}
+                ],
+                "conditions": [
+                    {
+                        "id": "20",
+                        "operator": "OR",
+                        "negated": False,
+                        "operands": [
+                            {"id": "30", "object_type": "APP", "lhs": "id", "rhs": "40"}
+                        ],
+                    }
+                ],
+            },
+        )
+        self.assertEqual(
+            service.mapAppToJSON(rule),
+            {
+                "id": "1",
+                "name": "rule",
+                "ruleOrder": "2",
+                "action": "ALLOW",
+                "appServerGroups": [],
+                "appConnectorGroups": [{"id": "10"}],
+                "conditions": [
+                    {
+                        "operator": "OR",
+                        "negated": False,
+                        "operands": [{"objectType": "APP", "lhs": "id", "rhs": "40"}],
+                    }
+                ],
+            },
+        )
+        # the response is not modified by the conversion
+        self.assertIsNone(RULE_JSON["conditions"][0]["modifiedTime"])
+
+    def test_operand_idp_id_is_read_back(self):
+        service = PolicyAccessRuleService(MagicMock(), "", MagicMock())
+        operand = {"objectType": "SCIM_GROUP", "lhs": "5", "rhs": "6", "idpId": "5"}
+        rule = service.mapRespJSONToPolicy(
+            {"id": "1", "conditions": [{"operands": [operand]}]}
+        )
+        self.assertEqual(rule["conditions"][0]["operands"][0]["idp_id"], "5")
+        self.assertEqual(
+            service.mapAppToJSON(rule)["conditions"][0]["operands"], [operand]
+        )
+
+    def test_read_only_fields_are_not_sent(self):
+        edge = SERVICE_EDGE_GROUP.fromJSON(
+            {"id": "1", "geoLocationId": "2", "versionProfileName": "Default"}
+        )
+        self.assertEqual(edge["version_profile_name"], "Default")
+        self.assertEqual(
+            SERVICE_EDGE_GROUP.toJSON(edge),
+            {
+                "id": "1",
+                "geoLocationId": "2",
+                "serviceEdges": [],
+                "trustedNetworks": [],
+            },
+        )
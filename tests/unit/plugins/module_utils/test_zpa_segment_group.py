@@ -39,19 +39,12 @@ class TestSegmentGroupService(unittest.TestCase):
     def test_get_by_name_when_ok(self):
         module = MagicMock()
         rest = MagicMock()
-        rest.get_paginated_data = MagicMock()
-        rest.get_paginated_data.return_value = [
-            {
-                "name": "bar1",
-                "id": "test1",
-                "applications": []
-            },
-            {
-                "name": "bar2",
-                "id": "test2",
-                "applications": []
-            }
-        ]
+        rest.find_by_name = MagicMock()
+        rest.find_by_name.return_value = {
+            "name": "bar2",
+            "id": "test2",
+            "applications": []
+        }
         k = SegmentGroupService(module, "", rest)
         self.assertEqual(k.getByName("bar2"), {
             "name": "bar2",
@@ -65,6 +58,7 @@ class TestSegmentGroupService(unittest.TestCase):
         rest = MagicMock()
         rest.get = MagicMock()
         rest.get.return_value.status_code = 400
+        rest.find_by_name = MagicMock(return_value=None)
         k = SegmentGroupService(module, "", rest)
         self.assertIsNone(k.getByName("test"))
 
@@ -132,3 +126,27 @@ class TestSegmentGroupService(unittest.TestCase):
         rest.put.return_value.status_code = 400
         k = SegmentGroupService(module, "", rest)
         self.assertIsNone(k.update({"name": "bar", "id": "test"}))
+
+    def test_create_trusts_write_response(self):
+        module = MagicMock()
+        rest = MagicMock()
+        rest.trust_write_response = True
+        rest.post.return_value.status_code = 201
+        rest.post.return_value.json = {"id": "test", "name": "bar"}
+        k = SegmentGroupService(module, "", rest)
+        created = k.create({"name": "bar", "enabled": True})
+        self.assertEqual(
+            (created["id"], created["name"], created["enabled"]), ("test", "bar", True)
+        )
+        rest.get.assert_not_called()
+
+    def test_update_trusts_write_response(self):
+        module = MagicMock()
+        rest = MagicMock()
+        rest.trust_write_response = True
+        rest.put.return_value.status_code = 204
+        rest.put.return_value.json = None
+        k = SegmentGroupService(module, "", rest)
+        updated = k.update({"id": "test", "name": "bar"})
+        self.assertEqual((updated["id"], updated["name"]), ("test", "bar"))
+        rest.get.assert_not_called()
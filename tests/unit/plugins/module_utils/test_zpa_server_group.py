@@ -43,23 +43,14 @@ class TestServerGroupService(unittest.TestCase):
     def test_get_by_name_when_ok(self):
         module = MagicMock()
         rest = MagicMock()
-        rest.get_paginated_data = MagicMock()
-        rest.get_paginated_data.return_value = [
-            {
-                "name": "bar1",
-                "id": "test1",
-                "applications": [],
-                "app_connector_groups": [],
-                "servers": []
-            },
-            {
-                "name": "bar2",
-                "id": "test2",
-                "applications": [],
-                "app_connector_groups": [],
-                "servers": []
-            }
-        ]
+        rest.find_by_name = MagicMock()
+        rest.find_by_name.return_value = {
+            "name": "bar2",
+            "id": "test2",
+            "applications": [],
+            "app_connector_groups": [],
+            "servers": []
+        }
         k = ServerGroupService(module, "", rest)
         self.assertEqual(k.getByName("bar2"), {
             "name": "bar2",
@@ -75,6 +66,7 @@ class TestServerGroupService(unittest.TestCase):
         rest = MagicMock()
         rest.get = MagicMock()
         rest.get.return_value.status_code = 400
+        rest.find_by_name = MagicMock(return_value=None)
         k = ServerGroupService(module, "", rest)
         self.assertIsNone(k.getByName("test"))
 
@@ -0,0 +1,112 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import MagicMock
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_client import (
+    failJson,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_object_index import (
+    collectionURL,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_tenant_snapshot import (
+    COLLECTIONS,
+    TenantSnapshot,
+    highWaterMark,
+)
+
+
+class FakeTenant:
+    """rest client serving get_paginated_data from a {name: items} dict"""
+
+    def __init__(self, collections):
+        self.collections = collections
+        self.urls = dict(
+            (collectionURL(kind, "c1"), name) for name, kind in COLLECTIONS.items()
+        )
+        self.get_paginated_data = MagicMock(side_effect=self.list)
+
+    def list(self, base_url=None, data_key_name=None):
+        return [dict(item) for item in self.collections.get(self.urls[base_url], [])]
+
+
+class TestTenantSnapshot(unittest.TestCase):
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), "snapshot")
+        self.tenant = FakeTenant(
+            {
+                "segment_groups": [
+                    {"id": "2", "name": "b", "modifiedTime": "200"},
+                    {"id": "1", "name": "a", "creationTime": "100"},
+                ],
+                "server_groups": [{"id": "3", "name": "c", "modifiedTime": "50"}],
+            }
+        )
+
+    def tearDown(self):
+        shutil.rmtree(os.path.dirname(self.path))
+
+    def sync(self, **kwargs):
+        snapshot = TenantSnapshot(self.tenant, "c1", self.path)
+        return snapshot.sync(names=["segment_groups", "server_groups"], **kwargs)
+
+    def test_high_water_mark(self):
+        self.assertEqual(
+            highWaterMark(
+                [{"modifiedTime": "7"}, {"creationTime": "9"}, {"modifiedTime": "x"}]
+            ),
+            9,
+        )
+        self.assertEqual(highWaterMark([]), 0)
+
+    def test_first_sync_writes_every_collection(self):
+        refreshed, summary = self.sync()
+        self.assertEqual(refreshed, ["segment_groups", "server_groups"])
+        self.assertEqual(
+            summary["segment_groups"],
+            {"count": 2, "modified_time": 200, "refreshed": True},
+        )
+        with open(os.path.join(self.path, "segment_groups.json")) as f:
+            self.assertEqual([item["id"] for item in json.load(f)], ["1", "2"])
+        with open(os.path.join(self.path, "manifest.json")) as f:
+            manifest = json.load(f)
+        self.assertEqual(manifest["collections"]["server_groups"]["count"], 1)
+
+    def test_only_changed_collections_are_refreshed(self):
+        self.sync()
+        self.assertEqual(self.sync()[0], [])
+        self.tenant.collections["server_groups"][0]["modifiedTime"] = "60"
+        self.assertEqual(self.sync()[0], ["server_groups"])
+        # a deletion does not move the high-water mark but changes the count
+        del self.tenant.collections["segment_groups"][1]
+        self.assertEqual(self.sync()[0], ["segment_groups"])
+        self.assertEqual(self.sync(force=True)[0], ["segment_groups", "server_groups"])
+
+    def test_check_mode_writes_nothing(self):
+        refreshed, dummy = self.sync(check_mode=True)
+        self.assertEqual(refreshed, ["segment_groups", "server_groups"])
+        self.assertFalse(os.path.exists(self.path))
+
+    def test_other_tenant_snapshot_is_not_reused(self):
+        self.sync()
+        snapshot = TenantSnapshot(self.tenant, "c2", self.path)
+        self.assertIsNone(snapshot.loadManifest())
+
+    def test_failed_collection_is_reported_once(self):
+        self.tenant.module = MagicMock()
+        self.tenant.module.fail_json.side_effect = SystemExit
+
+        def fail(base_url=None, data_key_name=None):
+            failJson(self.tenant.module, "Failed to fetch list from %s" % base_url)
+
+        self.tenant.get_paginated_data.side_effect = fail
+        with self.assertRaises(SystemExit):
+            self.sync()
+        self.tenant.module.fail_json.assert_called_once()
+        self.assertFalse(os.path.exists(self.path))
@@ -0,0 +1,55 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import shutil
+import tempfile
+import time
+import unittest
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_token_cache import (
+    TokenCache,
+)
+
+
+class TestTokenCache(unittest.TestCase):
+    def setUp(self):
+        self.cache_dir = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_dir)
+
+    def cache(self, secret="secret"):
+        return TokenCache("client", secret, "customer", "https://x", self.cache_dir)
+
+    def test_get_when_empty(self):
+        self.assertIsNone(self.cache().get())
+
+    def test_set_then_get(self):
+        self.cache().set("token", 3600)
+        self.assertEqual(self.cache().get(), "token")
+
+    def test_short_lived_token_is_not_cached(self):
+        k = self.cache()
+        k.set("token", 30)
+        self.assertIsNone(k.get())
+
+    def test_other_secret_does_not_share_token(self):
+        self.cache().set("token", 3600)
+        self.assertIsNone(self.cache(secret="other").get())
+
+    def test_invalidate_only_stale_token(self):
+        k = self.cache()
+        k.set("fresh", 3600)
+        k.invalidate("stale")
+        self.assertEqual(k.get(), "fresh")
+        k.invalidate("fresh")
+        self.assertIsNone(k.get())
+
+    def test_lock(self):
+        k = self.cache()
+        start = time.time()
+        with k.lock():
+            k.set("token", 3600)
+        self.assertEqual(k.get(), "token")
+        self.assertLess(time.time() - start, 5)
@@ -0,0 +1,186 @@
+from __future__ import absolute_import, division, print_function
+
+__metaclass__ = type
+
+import unittest
+from unittest.mock import MagicMock, patch
+
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_object_index import (
+    ObjectIndex,
+)
+from ansible_collections.willguibr.zpacloud.plugins.module_utils.zpa_policy_access_rule import (
+    PolicyAccessRuleService,
+)
+from ansible_collections.willguibr.zpacloud.plugins.modules import (
+    zpa_policy_access_rules,
+)
+
+EXISTING = [
+    {"id": "1", "name": "web", "action": "ALLOW", "rule_order": "1"},
+    {"id": "2", "name": "ssh", "action": "DENY", "rule_order": "2"},
+    {"id": "3", "name": "old", "action": "DENY", "rule_order": "3"},
+]
+
+
+class ModuleExit(Exception):
+    def __init__(self, failed, result):
+        super(ModuleExit, self).__init__(result)
+        self.failed = failed
+        self.result = result
+
+
+class Tenant:
+    """rest client whose single object GETs find the objects of existing_ids"""
+
+    def __init__(self, existing_ids):
+        self.baseurl = "https://x"
+        self.existing_ids = existing_ids
+
+    def get(self, url):
+        response = MagicMock()
+        response.status_code = (
+            200 if url.rsplit("/", 1)[-1] in self.existing_ids else 404
+        )
+        return response
+
+
+def app_condition(*app_ids):
+    return [
+        {
+            "operator": "OR",
+            "operands": [
+                {"object_type": "APP", "lhs": "id", "rhs": app_id} for app_id in app_ids
+            ],
+        }
+    ]
+
+
+def fake_module(rules, check_mode=False):
+    module = MagicMock()
+    module.check_mode = check_mode
+    module.params = {
+        "customer_id": "c1",
+        "rules": rules,
+        "max_workers": 4,
+        "validation": "api",
+    }
+
+    def exit_json(**kwargs):
+        raise ModuleExit(False, kwargs)
+
+    def fail_json(**kwargs):
+        raise ModuleExit(True, kwargs)
+
+    module.exit_json.side_effect = exit_json
+    module.fail_json.side_effect = fail_json
+    return module
+
+
+class TestPolicyAccessRules(unittest.TestCase):
+    def run_module(self, rules, check_mode=False, existing_ids=("10", "11")):
+        module = fake_module(rules, check_mode)
+        self.calls = []
+        service = PolicyAccessRuleService
+
+        def record(name, result):
+            def call(self, *args, **kwargs):
+                calls.append((name, args, kwargs))
+                return result(*args) if callable(result) else result
+
+            return call
+
+        calls = self.calls
+        with patch.object(
+            zpa_policy_access_rules,
+            "sharedClient",
+            return_value=Tenant(existing_ids),
+        ), patch.object(
+            service, "getByPolicyType", return_value={"id": "ps"}
+        ), patch.object(
+            service,
+            "getAllByPolicyType",
+            return_value=[dict(rule) for rule in EXISTING],
+        ), patch.object(
+            service, "create", record("create", lambda p, s: dict(p, id="4"))
+        ), patch.object(
+            service, "update", record("update", lambda p, s: dict(p))
+        ), patch.object(
+            service, "delete", record("delete", 204)
+        ), patch.object(
+            service, "reorderAll", record("reorderAll", [])
+        ):
+            with self.assertRaises(ModuleExit) as exit:
+                zpa_policy_access_rules.core(module)
+        return exit.exception
+
+    def test_check_mode_returns_the_rules_as_they_would_be_written(self):
+        exit = self.run_module(
+            [
+                {"name": "web", "action": "ALLOW"},
+                {"name": "ssh", "action": "ALLOW", "description": "opened"},
+                {"name": "old", "state": "absent"},
+                {"name": "new", "action": "ALLOW", "conditions": app_condition("10")},
+            ],
+            check_mode=True,
+        )
+        self.assertFalse(exit.failed)
+        self.assertTrue(exit.result["changed"])
+        data = exit.result["data"]
+        self.assertEqual(data[0], EXISTING[0])
+        # the update returns the merged rule, not the one it replaces
+        self.assertEqual(
+            (data[1]["id"], data[1]["action"], data[1]["description"]),
+            ("2", "ALLOW", "opened"),
+        )
+        self.assertEqual(data[2], EXISTING[2])
+        self.assertEqual(data[3]["name"], "new")
+        self.assertEqual(self.calls, [])
+
+    def test_deletes_run_before_the_writes(self):
+        exit = self.run_module(
+            [
+                {"name": "web", "action": "ALLOW"},
+                {"name": "ssh", "action": "ALLOW"},
+                {"name": "old", "state": "absent"},
+                {"name": "new", "action": "ALLOW"},
+            ]
+        )
+        self.assertFalse(exit.failed)
+        self.assertEqual(
+            (exit.result["created"], exit.result["updated"], exit.result["deleted"]),
+            (["new"], ["ssh"], ["old"]),
+        )
+        self.assertEqual(self.calls[0][:2], ("delete", ("3", "ps")))
+        self.assertEqual(
+            sorted(name for name, args, kwargs in self.calls[1:]), ["create", "update"]
+        )
+        # the conditions were validated beforehand
+        for name, args, kwargs in self.calls[1:]:
+            self.assertEqual(kwargs, {"validate": False})
+            self.assertIsNone(args[0]["rule_order"])
+        self.assertEqual(
+            [rule["id"] for rule in exit.result["data"]], ["1", "2", "3", "4"]
+        )
+
+    def test_conditions_of_all_rules_are_resolved_in_one_pass(self):
+        with patch.object(
+            ObjectIndex, "resolve", autospec=True, side_effect=ObjectIndex.resolve
+        ) as resolve:
+            exit = self.run_module(
+                [
+                    {"name": "ssh", "conditions": app_condition("10", "11")},
+                    {"name": "new", "conditions": app_condition("11", "12")},
+                    {"name": "next", "conditions": app_condition("10")},
+                ]
+            )
+        resolve.assert_called_once()
+        self.assertEqual(
+            sorted(set(resolve.call_args[0][1])),
+            [("application", "10"), ("application", "11"), ("application", "12")],
+        )
+        # nothing is written when one rule is invalid
+        self.assertTrue(exit.failed)
+        self.assertIn("new: ", exit.result["msg"])
+        self.assertIn('"12"', exit.result["msg"])
+        self.assertNotIn("ssh: ", exit.result["msg"])
+        self.assertEqual(self.calls, [])